@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 bench_render.py - 화면 렌더링 성능 측정 (녹화된 API 응답으로 재생)
+================================================================================
+
+🚀 실행 방법:
+    # 1) 인터넷이 되는 곳에서 한 번 녹화 (data/cassettes에 저장)
+    API_REPLAY_MODE=record python bench_render.py
+
+    # 2) 어디서든 같은 응답으로 재생하며 측정 (기본 모드)
+    python bench_render.py
+    REPLAY_LATENCY_MS=recorded python bench_render.py   # 녹화 당시 지연까지 재현
+
+    # 3) CI: 카세트와 예산이 갖춰진 저장소에서만 켭니다
+    python bench_render.py --strict
+
+📌 이 파일이 하는 일:
+    1. 각 화면(views/*.py)의 show()를 Streamlit AppTest로 헤드리스 실행
+    2. 화면별 렌더링 시간의 중앙값을 data/render_budget.json의 예산과 비교
+    3. 예산을 (1 + 허용 오차) 넘거나, 데이터 조회가 마감 시간을 넘겨 기본값으로
+       그려진 화면이 있으면 종료 코드 1 (CI 실패 처리)
+    4. --strict이면 예산이 없거나 재생할 카세트가 없는 화면도 실패로 처리
+       (기본은 경고만 출력 - 녹화/예산이 없는 체크아웃에서도 실행 가능)
+
+💡 팁:
+    - 매 실행 전에 공용 캐시와 st.cache_data를 비워 콜드 렌더링을 측정합니다.
+    - --update-budget로 현재 측정값을 새 예산으로 저장할 수 있습니다.
+      예산 파일은 녹화한 카세트로 측정한 뒤 커밋합니다 (처음 한 번 필요).
+    - 재생 모드에서 카세트가 하나라도 없거나 조회가 마감 시간
+      (PAGE_LOAD_DEADLINE_SEC)을 넘기면 화면이 폴백 데이터로 그려지므로
+      그 화면은 측정값으로 쓰지 않습니다.
+================================================================================
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+# config.py가 import되기 전에 기본값을 정해야 함
+os.environ.setdefault("API_REPLAY_MODE", "replay")
+os.environ.setdefault("CACHE_WARMER_ENABLED", "0")
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from utils import market_cache
+from utils.async_loader import deadline_misses, reset_deadline_misses
+from utils.replay import missing_cassettes, reset_missing_cassettes
+
+BUDGET_PATH = os.path.join(ROOT, "data", "render_budget.json")
+
+PAGES = [
+    "landing",
+    "tab1_sourcing",
+    "tab2_proposal",
+    "tab3_cost_calculator",
+    "tab4_news",
+    "tab5_trade_intel",
+    "tab6_korean_market",
+]
+
+PAGE_SCRIPT = """
+import sys
+sys.path.insert(0, {root!r})
+from views import {page}
+{page}.show()
+"""
+
+
+# ===========================================
+# 1. 측정
+# ===========================================
+class MissingCassettesError(RuntimeError):
+    """재생 모드에서 화면이 카세트 없는 요청을 보내 폴백 경로로 그려진 경우"""
+
+
+class DeadlineMissedError(RuntimeError):
+    """화면 데이터 조회가 마감 시간을 넘겨 기본값으로 그려진 경우"""
+
+
+def render_once(page: str, timeout: float) -> float:
+    """
+    화면 하나를 콜드 상태로 렌더링하고 걸린 시간(ms)을 반환합니다.
+
+    Raises:
+        RuntimeError: 렌더링 중 예외
+        MissingCassettesError: 재생 모드에서 카세트가 없는 요청이 있었던 경우
+        DeadlineMissedError: 조회가 마감 시간을 넘겨 기본값으로 그려진 경우
+    """
+    market_cache.clear()
+    st.cache_data.clear()
+    reset_missing_cassettes()
+    reset_deadline_misses()
+    app = AppTest.from_string(PAGE_SCRIPT.format(root=ROOT, page=page), default_timeout=timeout)
+    started = time.perf_counter()
+    app.run()
+    elapsed = (time.perf_counter() - started) * 1000
+    if app.exception:
+        raise RuntimeError(f"{page} 렌더링 실패: {app.exception[0].message}")
+    missing = missing_cassettes()
+    if missing:
+        raise MissingCassettesError(f"{page}: 카세트 {len(missing)}개 없음 (예: {missing[0]})")
+    late = deadline_misses()
+    if late:
+        raise DeadlineMissedError(f"{page}: 마감 시간 초과로 기본값 표시 ({', '.join(sorted(set(late)))})")
+    return elapsed
+
+
+def measure(pages, runs: int, timeout: float) -> dict:
+    """
+    화면별 렌더링 시간 중앙값(ms)을 측정합니다.
+
+    Args:
+        pages: 측정할 화면 모듈 이름 목록
+        runs: 화면당 측정 횟수 (첫 실행은 import 비용이 섞이므로 버림)
+        timeout: 화면 1회 렌더링 제한 시간(초)
+
+    Returns:
+        tuple: ({화면: 중앙값(ms)}, {화면: 카세트 누락 사유}, {화면: 마감 초과 사유})
+    """
+    results, missing, late = {}, {}, {}
+    for page in pages:
+        try:
+            render_once(page, timeout)
+            samples = [render_once(page, timeout) for _ in range(runs)]
+        except MissingCassettesError as e:
+            missing[page] = str(e)
+            continue
+        except DeadlineMissedError as e:
+            late[page] = str(e)
+            continue
+        results[page] = round(statistics.median(samples), 1)
+    return results, missing, late
+
+
+# ===========================================
+# 2. 예산 비교
+# ===========================================
+def load_budget() -> dict:
+    if not os.path.exists(BUDGET_PATH):
+        return {"tolerance": 0.2, "pages": {}}
+    with open(BUDGET_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="화면 렌더링 성능 측정")
+    parser.add_argument("pages", nargs="*", default=PAGES, help="측정할 화면 (기본: 전체)")
+    parser.add_argument("--runs", type=int, default=5, help="화면당 측정 횟수")
+    parser.add_argument("--timeout", type=float, default=60, help="1회 렌더링 제한 시간(초)")
+    parser.add_argument("--update-budget", action="store_true", help="측정값을 새 예산으로 저장")
+    parser.add_argument("--strict", action="store_true",
+                        help="예산 없음/카세트 없음도 실패로 처리 (CI용)")
+    args = parser.parse_args()
+
+    print(f"API_REPLAY_MODE={os.environ['API_REPLAY_MODE']}, "
+          f"REPLAY_LATENCY_MS={os.environ.get('REPLAY_LATENCY_MS', '0')}")
+    results, missing, late = measure(args.pages, args.runs, args.timeout)
+    budget = load_budget()
+
+    # 폴백 경로로 측정한 값이 예산이 되지 않도록 카세트가 모두 있고 마감 안에 그려졌을 때만 저장
+    if args.update_budget and not missing and not late:
+        budget["pages"].update(results)
+        with open(BUDGET_PATH, "w", encoding="utf-8") as f:
+            json.dump(budget, f, indent=2, ensure_ascii=False)
+        print(f"예산 저장: {BUDGET_PATH}")
+
+    failed, unbudgeted = [], []
+    limit_ratio = 1 + budget.get("tolerance", 0.2)
+    for page, ms in results.items():
+        limit = budget["pages"].get(page)
+        if limit is None:
+            status = "NO BUDGET"
+            unbudgeted.append(page)
+        else:
+            status = "OK" if ms <= limit * limit_ratio else "SLOW"
+            if status == "SLOW":
+                failed.append(page)
+        print(f"{page:<22} {ms:>9.1f} ms   budget {limit if limit is not None else '-':>9}   {status}")
+    for page, reason in missing.items():
+        print(f"{page:<22} {'-':>9}      budget {budget['pages'].get(page, '-'):>9}   NO CASSETTE ({reason})")
+    for page, reason in late.items():
+        print(f"{page:<22} {'-':>9}      budget {budget['pages'].get(page, '-'):>9}   DEADLINE ({reason})")
+
+    if missing:
+        print(f"카세트 없음: {', '.join(missing)} - API_REPLAY_MODE=record python bench_render.py로 먼저 녹화")
+    if unbudgeted:
+        print(f"예산 없음: {', '.join(unbudgeted)} - --update-budget로 예산을 만든 뒤 커밋")
+    if late:
+        print(f"마감 시간 초과: {', '.join(late)} - PAGE_LOAD_DEADLINE_SEC 안에 렌더링되지 않음")
+    if failed:
+        print(f"예산 초과: {', '.join(failed)}")
+    if (missing or unbudgeted) and not args.strict:
+        print("카세트/예산이 없는 화면은 경고만 합니다 (CI에서는 --strict)")
+    return 1 if failed or late or (args.strict and (missing or unbudgeted)) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -168,3 +168,146 @@ def get_coffee_origins():
 APP_TITLE = "Coffee Trade Hub"
 APP_ICON = "☕"
 APP_LAYOUT = "wide"
+
+# ===========================================
+# 6. 시장 데이터 캐시 설정 (utils/market_cache.py)
+# ===========================================
+# 데이터 소스별 캐시 유지 시간(초)입니다. 서버 내 모든 세션이 같은 캐시를 공유합니다.
+CACHE_TTL = {
+    "fx_api": 600,          # exchangerate-api (USD 기준 전체 환율)
+    "fx_matrix": 600,       # 교차환율 행렬 (utils/fx_matrix.py)
+    "yahoo_quote": 300,     # Yahoo Finance 최근 시세 (5일)
+    "yahoo_history": 3600,  # Yahoo Finance 히스토리 (1y/5y/10y/max)
+    "history_sync": 3600,   # 로컬 히스토리 저장소 증분 갱신 주기
+    "weather": 900,         # OpenWeatherMap 선적항 날씨 (전체 항구 일괄 조회)
+    "weather_city_id": 30 * 24 * 3600,  # 선적항 이름 → OpenWeatherMap 도시 ID (거의 불변)
+    "chart_series": 3600,   # 차트용으로 축소한 시계열 (utils/chart_data.py)
+    "freight_index": 6 * 3600,  # 컨테이너 운임지수 (주 1회 발표)
+    "market_file": 60,      # 로컬 CSV 시세 (오프라인 실행용)
+}
+
+# 마지막 정상 조회값(Last-Known-Good)을 디스크에 보관할 소스와 저장 위치
+# API 장애 시 이 값을 즉시 '지연 데이터'로 보여주고 백그라운드에서 1회 재조회합니다.
+CACHE_PERSIST_SOURCES = ("fx_api", "yahoo_quote", "weather", "weather_city_id")
+CACHE_SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "market_snapshot.pkl")
+
+# 일별 OHLC 히스토리 로컬 저장소 (utils/history_store.py)
+HISTORY_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "market_history.sqlite")
+
+# ===========================================
+# 7. 백그라운드 캐시 워머 (utils/cache_warmer.py)
+# ===========================================
+# 서버당 1개의 스레드가 아래 주기(초)로 데이터를 미리 받아 공용 캐시에 채웁니다.
+# 주기를 CACHE_TTL보다 짧게 두면 사용자는 항상 캐시된 데이터를 읽게 됩니다.
+CACHE_WARMER_ENABLED = os.getenv("CACHE_WARMER_ENABLED", "1") == "1"
+CACHE_WARMER_INTERVALS = {
+    "market_quotes": int(os.getenv("WARM_QUOTES_SEC", "240")),     # KC=F, RC=F, KRW=X, 산지 통화
+    "exchange_rates": int(os.getenv("WARM_FX_SEC", "480")),        # exchangerate-api
+    "port_weather": int(os.getenv("WARM_WEATHER_SEC", "720")),     # 선적항 날씨
+    "history": int(os.getenv("WARM_HISTORY_SEC", "3000")),         # 히스토리 저장소
+    "freight_index": int(os.getenv("WARM_FREIGHT_SEC", "3600")),   # 컨테이너 운임지수
+}
+
+# ===========================================
+# 8. 외부 HTTP 호출 설정 (utils/http_client.py)
+# ===========================================
+# 호스트별 (연결, 응답) 타임아웃(초). 목록에 없는 호스트는 HTTP_DEFAULT_TIMEOUT 사용.
+HTTP_TIMEOUTS = {
+    "v6.exchangerate-api.com": (3.05, 6),
+    "api.openweathermap.org": (3.05, 4),
+    "openapi.naver.com": (3.05, 6),
+}
+HTTP_DEFAULT_TIMEOUT = (3.05, 10)
+HTTP_MAX_RETRIES = 2            # 실패 시 추가 재시도 횟수
+HTTP_BACKOFF_BASE = 0.3         # 재시도 대기 기본값(초), 시도마다 2배 + 무작위 지터
+CIRCUIT_FAILURE_THRESHOLD = 3   # 연속 실패 횟수가 이 값에 도달하면 호스트 차단
+CIRCUIT_RESET_SEC = 60          # 차단 후 다시 시도해보기까지 대기(초)
+
+# ===========================================
+# 9. 페이지 데이터 동시 로딩 (utils/async_loader.py)
+# ===========================================
+# 페이지에 필요한 조회를 한꺼번에 시작한 뒤 기다리는 전체 마감 시간(초)입니다.
+# 이 시간 안에 끝나지 않은 항목은 기본값으로 그리고, 조회는 백그라운드에서 계속됩니다.
+PAGE_LOAD_DEADLINE_SEC = float(os.getenv("PAGE_LOAD_DEADLINE_SEC", "6"))
+
+# ===========================================
+# 10. 차트 데이터 축소 (utils/chart_data.py)
+# ===========================================
+# 차트 한 개에 보낼 최대 점 개수입니다. 차트 폭(픽셀) 정도면 눈으로 보이는 차이가 없습니다.
+CHART_MAX_POINTS = 800
+
+# ===========================================
+# 11. 시장 데이터 공급자 (utils/market_providers.py)
+# ===========================================
+# MARKET_DATA_OFFLINE=1이면 외부 API 없이 로컬 CSV의 시세로 대시보드를 그립니다.
+MARKET_DATA_OFFLINE = os.getenv("MARKET_DATA_OFFLINE", "0") == "1"
+OFFLINE_MARKET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "offline_market.csv")
+
+# 컨테이너 운임지수(SCFI 등, 주간) CSV - 외부 피드 연동 없음, 사용자가 갱신하거나
+# FREIGHT_INDEX_URL로 같은 형식의 원격 CSV를 지정합니다.
+FREIGHT_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "freight_index.csv")
+FREIGHT_INDEX_URL = os.getenv("FREIGHT_INDEX_URL", "")
+# 마지막 행 날짜가 이 일수보다 오래되면 실시간 데이터로 표시하지 않고 '기준일 지연'으로 표시합니다.
+# (저장소의 data/freight_index.csv는 갱신되지 않는 샘플이므로 항상 지연으로 표시됩니다)
+FREIGHT_INDEX_MAX_AGE_DAYS = int(os.getenv("FREIGHT_INDEX_MAX_AGE_DAYS", "10"))
+
+# ===========================================
+# 12. 외부 API 녹화/재생 (utils/replay.py)
+# ===========================================
+# off: 실제 호출 / record: 호출하면서 카세트에 저장 / replay: 카세트에서만 읽음
+API_REPLAY_MODE = os.getenv("API_REPLAY_MODE", "off").lower()
+CASSETTE_DIR = os.getenv(
+    "CASSETTE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "cassettes")
+)
+# 재생 시 주입할 응답 지연: 숫자(ms) 또는 "recorded"(녹화 당시 소요 시간)
+REPLAY_LATENCY_MS = os.getenv("REPLAY_LATENCY_MS", "0")
+
+# ===========================================
+# 13. 소싱 시그널 규칙 (utils/signal_engine.py)
+# ===========================================
+# 지표별 변동률 조건 → 가감점, 점수 구간 → 시그널 단계를 정의한 JSON 파일입니다.
+SIGNAL_RULES_PATH = os.getenv(
+    "SIGNAL_RULES_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "signal_rules.json")
+)
+
+# ===========================================
+# 14. 기술적 지표 (utils/indicators.py)
+# ===========================================
+# 이동평균/볼린저 밴드/Z-점수는 sma_short 창, 변동성은 수익률 volatility 창 기준입니다.
+INDICATOR_WINDOWS = {
+    "sma_short": 20,
+    "sma_long": 60,
+    "bollinger_k": 2.0,
+    "rsi": 14,
+    "volatility": 20,
+}
+
+# ===========================================
+# 15. 시그널 알림 데몬 (utils/alert_daemon.py)
+# ===========================================
+# 데몬이 시그널을 평가해 기록하는 SQLite 파일과 평가 주기입니다.
+ALERT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "alerts.sqlite")
+ALERT_INTERVAL_SEC = int(os.getenv("ALERT_INTERVAL_SEC", "300"))
+# 대시보드는 이보다 새로운 로그가 있으면 그대로 쓰고, 없으면(데몬 미실행) 직접 계산합니다.
+ALERT_MAX_AGE_SEC = int(os.getenv("ALERT_MAX_AGE_SEC", str(ALERT_INTERVAL_SEC * 3)))
+
+# ===========================================
+# 16. 메트릭 타일 자동 갱신 (st.fragment)
+# ===========================================
+# 랜딩/소싱 대시보드 상단 시세 타일만 이 주기(초)로 다시 그립니다 (페이지 전체는 재실행하지 않음).
+# 0이면 자동 갱신을 끕니다.
+METRIC_REFRESH_SEC = int(os.getenv("METRIC_REFRESH_SEC", "30"))
+
+# ===========================================
+# 17. 교차환율 행렬 (utils/fx_matrix.py)
+# ===========================================
+# 산지 통화(get_coffee_origins()의 currency)와 함께 행렬에 항상 넣는 통화입니다.
+FX_BASE_CURRENCIES = ("KRW", "USD", "EUR", "JPY", "CNY")
+
+# ===========================================
+# 18. 관세율표 (utils/tariff_index.py)
+# ===========================================
+# 국가 × HS 코드 × 적용기간별 관세율 CSV입니다. 행을 추가하면 전체 관세율표로 확장됩니다.
+TARIFF_SCHEDULE_PATH = os.getenv(
+    "TARIFF_SCHEDULE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "tariff_schedule.csv")
+)
@@ -46,6 +46,13 @@ st.set_page_config(
 from styles import apply_global_styles
 apply_global_styles()
 
+# ===========================================
+# 2-1. 백그라운드 캐시 워머 (서버당 1회만 시작됨)
+# ===========================================
+# 시세/환율/날씨를 미리 받아두어 사용자 요청이 외부 API를 기다리지 않게 합니다.
+from utils import start_cache_warmer
+start_cache_warmer()
+
 # ===========================================
 # 3. 메뉴 옵션 정의
 # ===========================================
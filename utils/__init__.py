@@ -17,8 +17,33 @@ from .api_helpers import (
     get_current_local_rate,
     get_market_data,
     get_history_rate,
-    get_country_weather
+    get_price_history,
+    get_batch_tickers,
+    get_batch_closes,
+    get_close_series,
+    prefetch_market_data,
+    get_exchange_rate_info,
+    get_quotes_freshness,
+    get_country_weather,
+    get_krw_rates,
+    get_fx_matrix
 )
+from .market_cache import market_cache, make_key, get_cache_stats
+from .history_store import sync_history
+from .async_loader import gather_with_deadline
+from .weather_service import get_port_weather_map
+from .chart_data import get_chart_series, downsample_series
+from .market_providers import get_market_quotes, get_market_history, get_market_indicators, market_providers
+from .indicators import compute_indicators, indicator_book
+from .signal_engine import compute_signal_history, score_snapshot, score_panel, get_rule_set
+from .landed_cost import calculate_landed_cost, calculate_landed_costs
+from .risk_sim import simulate_landed_cost
+from .sensitivity import sensitivity_grid, tornado_table
+from .excel_export import ExcelReport, export_tables
+from .tariff_index import get_tariff_index
+from .backtest import prepare_backtest_data, run_backtest, sweep as sweep_signal_thresholds
+from .cache_warmer import start_cache_warmer
+from .http_client import http_get, CircuitOpenError
 
 __all__ = [
     'get_exchange_rate',
@@ -26,5 +51,46 @@ __all__ = [
     'get_current_local_rate',
     'get_market_data',
     'get_history_rate',
-    'get_country_weather'
+    'get_price_history',
+    'get_batch_tickers',
+    'get_batch_closes',
+    'get_close_series',
+    'prefetch_market_data',
+    'get_exchange_rate_info',
+    'get_quotes_freshness',
+    'get_country_weather',
+    'get_krw_rates',
+    'get_fx_matrix',
+    'market_cache',
+    'make_key',
+    'get_cache_stats',
+    'sync_history',
+    'gather_with_deadline',
+    'get_port_weather_map',
+    'get_chart_series',
+    'downsample_series',
+    'get_market_quotes',
+    'market_providers',
+    'get_market_history',
+    'get_market_indicators',
+    'compute_indicators',
+    'indicator_book',
+    'compute_signal_history',
+    'score_snapshot',
+    'score_panel',
+    'get_rule_set',
+    'calculate_landed_cost',
+    'calculate_landed_costs',
+    'simulate_landed_cost',
+    'sensitivity_grid',
+    'tornado_table',
+    'ExcelReport',
+    'export_tables',
+    'get_tariff_index',
+    'prepare_backtest_data',
+    'run_backtest',
+    'sweep_signal_thresholds',
+    'start_cache_warmer',
+    'http_get',
+    'CircuitOpenError'
 ]
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/alert_daemon.py - 소싱 시그널 알림 데몬 (브라우저 불필요)
+================================================================================
+정해진 주기마다 시세를 조회해 알고리즘 시그널을 계산하고,
+결과와 단계 전환(예: 중립 관망 → 매수)을 알림 로그(utils/alert_log.py)에 기록합니다.
+Streamlit 없이 독립 프로세스로 실행하며, 대시보드는 이 로그를 읽기만 합니다.
+
+💡 실행 예시:
+    python -m utils.alert_daemon                  # ALERT_INTERVAL_SEC 주기로 계속 실행
+    python -m utils.alert_daemon --interval 60
+    python -m utils.alert_daemon --once           # 1회 평가 후 종료 (cron용)
+================================================================================
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from config import ALERT_INTERVAL_SEC
+from .alert_log import alert_log
+from .signal_service import get_market_data_live, generate_algorithmic_signal
+
+
+def evaluate_once() -> Optional[Dict]:
+    """
+    시그널을 1회 평가해 알림 로그에 기록합니다.
+
+    Returns:
+        dict: 단계 전환 기록 (단계가 그대로면 None)
+    """
+    market_data = get_market_data_live()
+    signal = generate_algorithmic_signal(market_data)
+    return alert_log.record(signal, market_data.get('data_source', ''))
+
+
+def run(interval: int = ALERT_INTERVAL_SEC, once: bool = False):
+    """
+    주기적으로 시그널을 평가합니다 (실패해도 다음 주기에 다시 시도).
+
+    Args:
+        interval: 평가 주기(초)
+        once: True면 1회만 평가
+    """
+    while True:
+        started = time.time()
+        stamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        try:
+            alert = evaluate_once()
+            if alert is not None:
+                print(f"[{stamp}] {alert['from_status'] or '-'} → {alert['to_status']} "
+                      f"(점수 {alert['score']:.0f}) {' / '.join(alert['triggers'])}", flush=True)
+        except Exception as e:
+            print(f"[{stamp}] 시그널 평가 실패: {e}", flush=True)
+        if once:
+            return
+        time.sleep(max(0.0, interval - (time.time() - started)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="소싱 시그널 알림 데몬")
+    parser.add_argument("--interval", type=int, default=ALERT_INTERVAL_SEC, help="평가 주기(초)")
+    parser.add_argument("--once", action="store_true", help="1회 평가 후 종료")
+    args = parser.parse_args()
+    run(args.interval, args.once)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/alert_log.py - 소싱 시그널 알림 로그 (SQLite)
+================================================================================
+시그널 알림 데몬(utils/alert_daemon.py)이 평가할 때마다 최신 시그널을 저장하고,
+단계가 바뀌면(예: 중립 관망 → 매수) 전환 기록을 추가합니다.
+대시보드는 이 로그를 읽기만 하므로 rerun마다 시그널을 다시 계산하지 않습니다.
+
+- signal_state: 가장 최근 평가 결과 1행
+- signal_alerts: 단계 전환 기록 (시간순으로 추가만 함)
+
+💡 팁:
+- 저장 위치는 config.py의 ALERT_DB_PATH에서 바꿀 수 있습니다.
+- 데몬 여러 개가 같은 파일에 써도 전환 판정은 한 트랜잭션 안에서 이뤄집니다.
+================================================================================
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Dict, List, Optional
+
+from config import ALERT_DB_PATH
+
+
+class AlertLog:
+    """최신 시그널과 단계 전환 기록을 보관하는 SQLite 로그"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    # ===========================================
+    # 1. 저장소 기본 동작
+    # ===========================================
+    def _connect(self) -> sqlite3.Connection:
+        """
+        새 연결을 엽니다. 호출하는 쪽에서 closing()으로 닫아야 합니다
+        (sqlite3 연결의 with 문은 커밋/롤백만 하고 연결을 닫지 않음).
+        """
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS signal_state (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    evaluated_at REAL NOT NULL,
+                    signal TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS signal_alerts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    created_at REAL NOT NULL,
+                    from_status TEXT,
+                    to_status TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    triggers TEXT NOT NULL
+                );
+            """)
+            self._initialized = True
+        return conn
+
+    def record(self, signal: Dict, data_source: str = "") -> Optional[Dict]:
+        """
+        평가 결과를 저장하고, 단계가 바뀌었으면 전환 기록을 추가합니다.
+
+        Args:
+            signal: generate_algorithmic_signal() 결과
+            data_source: 시세 출처 표시 (예: '✅ Live Data')
+
+        Returns:
+            dict: 추가된 전환 기록 (단계가 그대로면 None)
+        """
+        now = time.time()
+        payload = json.dumps({**signal, 'data_source': data_source}, ensure_ascii=False)
+        with self._lock, closing(self._connect()) as conn, conn:
+            # 다른 프로세스가 사이에 끼어들지 않도록 읽기 전에 쓰기 잠금
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT signal FROM signal_state WHERE id = 1").fetchone()
+            previous = json.loads(row["signal"])["signal_status"] if row else None
+            conn.execute("INSERT OR REPLACE INTO signal_state VALUES (1, ?, ?)", (now, payload))
+            if previous == signal['signal_status']:
+                return None
+            alert = {
+                'created_at': now,
+                'from_status': previous,
+                'to_status': signal['signal_status'],
+                'score': float(signal['signal_strength']),
+                'triggers': list(signal['logic_triggers']),
+            }
+            conn.execute(
+                "INSERT INTO signal_alerts (created_at, from_status, to_status, score, triggers) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (now, previous, alert['to_status'], alert['score'],
+                 json.dumps(alert['triggers'], ensure_ascii=False))
+            )
+        return alert
+
+    # ===========================================
+    # 2. 조회
+    # ===========================================
+    def latest(self, max_age: Optional[float] = None) -> Optional[Dict]:
+        """
+        가장 최근 평가 결과
+
+        Args:
+            max_age: 이보다 오래된(초) 결과는 무시
+
+        Returns:
+            dict: generate_algorithmic_signal() 형식 + data_source, evaluated_at (없으면 None)
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT evaluated_at, signal FROM signal_state WHERE id = 1").fetchone()
+        if row is None or (max_age is not None and time.time() - row["evaluated_at"] > max_age):
+            return None
+        return {**json.loads(row["signal"]), 'evaluated_at': row["evaluated_at"]}
+
+    def recent_alerts(self, limit: int = 20) -> List[Dict]:
+        """최근 단계 전환 기록 (최신 순)"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT created_at, from_status, to_status, score, triggers FROM signal_alerts "
+                "ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [{**dict(row), 'triggers': json.loads(row["triggers"])} for row in rows]
+
+
+# ===========================================
+# 3. 공용 인스턴스
+# ===========================================
+os.makedirs(os.path.dirname(ALERT_DB_PATH), exist_ok=True)
+alert_log = AlertLog(ALERT_DB_PATH)
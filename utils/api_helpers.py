@@ -7,15 +7,204 @@
 
 💡 팁:
 - 모든 API 함수는 오류 발생 시 기본값을 반환하도록 설계되어 있습니다.
-- 캐싱을 통해 불필요한 API 호출을 줄입니다.
+- 캐싱을 통해 불필요한 API 호출을 줄입니다. (utils/market_cache.py, 서버 공용)
 ================================================================================
 """
 
+from datetime import datetime
+
 import requests
-import streamlit as st
 import yfinance as yf
 import plotly.graph_objects as go
-from config import EXCHANGE_API_KEY, WEATHER_API_KEY, COLOR_PRIMARY
+import pandas as pd
+from config import EXCHANGE_API_KEY, WEATHER_API_KEY, COLOR_PRIMARY, FX_BASE_CURRENCIES, get_coffee_origins
+from .market_cache import market_cache, make_key, CacheEntry
+from .http_client import http_get
+from .replay import replay_call
+from .fx_matrix import FxMatrix
+from .weather_service import get_port_weather, get_port_weather_map
+from .chart_data import get_chart_series
+from .history_store import get_stored_history, sync_history, PERIOD_OFFSETS
+
+
+# ===========================================
+# 0. 공용 조회 함수 (캐시 경유)
+# ===========================================
+
+def _fx_ticker(currency_code: str) -> str:
+    """통화 코드를 Yahoo Finance 환율 티커로 변환합니다."""
+    return f"{currency_code}=X" if currency_code != "USD" else "USDKRW=X"
+
+
+def _fetch_usd_rates() -> dict:
+    """exchangerate-api에서 USD 기준 전체 환율을 가져옵니다 (실패 시 예외)."""
+    url = f"https://v6.exchangerate-api.com/v6/{EXCHANGE_API_KEY}/latest/USD"
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+    }
+    response = http_get(url, headers=headers)
+    response.raise_for_status()
+    return response.json()["conversion_rates"]
+
+
+def _usd_rates_entry(force: bool = False) -> CacheEntry:
+    """USD 기준 전체 환율 캐시 항목 (공용 캐시, 소스: fx_api)"""
+    return market_cache.get_entry("fx_api", make_key(currency="USD"), _fetch_usd_rates, force=force)
+
+
+def _get_usd_rates(force: bool = False) -> dict:
+    """USD 기준 전체 환율 (공용 캐시, 소스: fx_api)"""
+    return _usd_rates_entry(force).value
+
+
+def get_price_history(ticker: str, period: str) -> pd.DataFrame:
+    """
+    Yahoo Finance 일별 시세를 공용 캐시를 거쳐 가져옵니다.
+
+    Args:
+        ticker: Yahoo Finance 티커 (예: "KC=F", "KRW=X")
+        period: 조회 기간 (예: "5d", "1y", "max")
+
+    Returns:
+        pd.DataFrame: OHLC 데이터 (데이터가 없으면 ValueError 발생)
+    """
+    def fetch():
+        df = replay_call("yahoo", {"fn": "history", "ticker": ticker, "period": period},
+                         lambda: yf.Ticker(ticker).history(period=period))
+        if df.empty:
+            raise ValueError(f"{ticker} 데이터 없음")
+        return df
+
+    source = "yahoo_quote" if period in ("1d", "5d") else "yahoo_history"
+    return market_cache.get_or_fetch(source, make_key(ticker=ticker, period=period), fetch)
+
+
+# ===========================================
+# 0-1. 배치 시세 (한 번의 Yahoo 요청)
+# ===========================================
+
+def get_batch_tickers() -> list:
+    """배치 조회 대상 티커 목록 (KC=F, RC=F, KRW=X + 모든 산지 통화 + 교차환율 기본 통화)"""
+    currencies = {info['currency'] for info in get_coffee_origins().values()}
+    currencies |= set(FX_BASE_CURRENCIES) - {"KRW", "USD"}
+    return ["KC=F", "RC=F", "KRW=X"] + sorted(_fx_ticker(c) for c in currencies)
+
+
+def get_batch_closes(period: str = "5d", force: bool = False) -> pd.DataFrame:
+    """
+    배치 대상 티커 전체의 일별 종가를 한 번의 요청으로 가져옵니다.
+
+    Args:
+        period: 조회 기간 (예: "5d", "1y", "max")
+        force: True면 캐시를 무시하고 새로 받아 교체
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스 × 티커 컬럼의 종가 표
+    """
+    return get_batch_closes_entry(period, force).value
+
+
+def get_batch_closes_entry(period: str = "5d", force: bool = False) -> CacheEntry:
+    """get_batch_closes()의 캐시 항목 (조회 시각, 지연 여부 포함)"""
+    tickers = get_batch_tickers()
+
+    def fetch():
+        raw = replay_call(
+            "yahoo", {"fn": "download", "tickers": tickers, "period": period},
+            lambda: yf.download(tickers, period=period, interval="1d", group_by="column",
+                                progress=False, threads=True)
+        )
+        if raw.empty:
+            raise ValueError("배치 시세 데이터 없음")
+        closes = raw['Close']
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(tickers[0])
+        closes = closes.dropna(how="all")
+        if closes.empty:
+            raise ValueError("배치 시세 데이터 없음")
+        return closes
+
+    source = "yahoo_quote" if period in ("1d", "5d") else "yahoo_history"
+    return market_cache.get_entry(source, make_key(tickers=tuple(tickers), period=period), fetch,
+                                  force=force)
+
+
+def get_close_series(ticker: str, period: str) -> pd.Series:
+    """
+    티커의 일별 종가 시리즈를 반환합니다.
+    - 1y/5y/10y/max: 로컬 히스토리 저장소에서 잘라서 반환 (증분 갱신)
+    - 그 외 단기 기간: 배치 대상 티커는 배치 표에서, 나머지는 개별 조회
+
+    Args:
+        ticker: Yahoo Finance 티커
+        period: 조회 기간
+
+    Returns:
+        pd.Series: 종가 시리즈 (데이터가 없으면 ValueError 발생)
+    """
+    batch_tickers = get_batch_tickers()
+    if period in PERIOD_OFFSETS:
+        sync_tickers = batch_tickers if ticker in batch_tickers else None
+        series = get_stored_history(ticker, period, sync_tickers)['close']
+    elif ticker in batch_tickers:
+        closes = get_batch_closes(period)
+        series = closes[ticker].dropna() if ticker in closes.columns else pd.Series(dtype=float)
+    else:
+        series = get_price_history(ticker, period)['Close']
+    if series.empty:
+        raise ValueError(f"{ticker} 데이터 없음")
+    return series
+
+
+def prefetch_market_data(period: str = "5d") -> bool:
+    """
+    배치 시세를 미리 받아 캐시에 채워둡니다 (페이지 상단에서 1회 호출).
+
+    Returns:
+        bool: 성공 여부
+    """
+    try:
+        get_batch_closes(period)
+        return True
+    except Exception:
+        return False
+
+
+# ===========================================
+# 0-2. 데이터 신선도 (지연 여부)
+# ===========================================
+
+def _freshness(entry: CacheEntry) -> dict:
+    return {'fetched_at': datetime.fromtimestamp(entry.fetched_at), 'stale': entry.stale}
+
+
+def get_exchange_rate_info() -> dict:
+    """
+    USD/KRW 환율을 조회 시각, 지연 여부와 함께 반환합니다.
+
+    Returns:
+        dict: {'rate': 환율, 'fetched_at': datetime 또는 None(기본값), 'stale': 지연 여부}
+    """
+    try:
+        if not EXCHANGE_API_KEY:
+            raise ValueError("EXCHANGE_RATE 키 없음")
+        entry = _usd_rates_entry()
+        return {'rate': entry.value['KRW'], **_freshness(entry)}
+    except Exception:
+        return {'rate': 1445.0, 'fetched_at': None, 'stale': True}
+
+
+def get_quotes_freshness() -> dict:
+    """
+    배치 시세(KC=F, RC=F, KRW=X, 산지 통화)의 조회 시각과 지연 여부를 반환합니다.
+
+    Returns:
+        dict: {'fetched_at': datetime 또는 None(데이터 없음), 'stale': 지연 여부}
+    """
+    try:
+        return _freshness(get_batch_closes_entry("5d"))
+    except Exception:
+        return {'fetched_at': None, 'stale': True}
 
 
 # ===========================================
@@ -32,9 +221,7 @@ def get_exchange_rate() -> float:
     try:
         if not EXCHANGE_API_KEY:
             return 1445.0
-        url = f"https://v6.exchangerate-api.com/v6/{EXCHANGE_API_KEY}/latest/USD"
-        res = requests.get(url, timeout=10).json()
-        return res['conversion_rates']['KRW']
+        return _get_usd_rates()['KRW']
     except Exception:
         return 1445.0
 
@@ -46,25 +233,25 @@ def get_exchange_rate_with_status():
     Returns:
         tuple: (환율 또는 None, 상태 메시지)
     """
+    if not EXCHANGE_API_KEY:
+        return None, "❌ .env 파일에서 'EXCHANGE_RATE' 키를 찾을 수 없습니다."
+
     try:
-        if not EXCHANGE_API_KEY:
-            return None, "❌ .env 파일에서 'EXCHANGE_RATE' 키를 찾을 수 없습니다."
-        
-        url = f"https://v6.exchangerate-api.com/v6/{EXCHANGE_API_KEY}/latest/USD"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-        }
-        response = requests.get(url, headers=headers, timeout=10, verify=False)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if "conversion_rates" in data and "KRW" in data["conversion_rates"]:
-                return data["conversion_rates"]["KRW"], "✅ 실시간 환율을 성공적으로 불러왔습니다."
-            return None, "⚠️ 응답은 받았으나 KRW 환율 정보가 없습니다."
-        return None, f"⚠️ API 서버 오류 (코드: {response.status_code})"
+        entry = _usd_rates_entry()
+    except requests.HTTPError as e:
+        return None, f"⚠️ API 서버 오류 (코드: {e.response.status_code})"
+    except (KeyError, ValueError):
+        return None, "⚠️ 응답은 받았으나 KRW 환율 정보가 없습니다."
     except Exception as e:
         return None, f"❌ 연결 오류: {str(e)}"
 
+    if "KRW" not in entry.value:
+        return None, "⚠️ 응답은 받았으나 KRW 환율 정보가 없습니다."
+    if entry.stale:
+        fetched = datetime.fromtimestamp(entry.fetched_at).strftime('%m-%d %H:%M')
+        return entry.value["KRW"], f"🕒 {fetched} 기준 마지막 환율입니다. (최신 환율 갱신 중)"
+    return entry.value["KRW"], "✅ 실시간 환율을 성공적으로 불러왔습니다."
+
 
 def get_current_local_rate(currency_code: str):
     """
@@ -77,20 +264,81 @@ def get_current_local_rate(currency_code: str):
         float 또는 None
     """
     try:
-        ticker = f"{currency_code}=X" if currency_code != "USD" else "USDKRW=X"
-        data = yf.Ticker(ticker).history(period="1d")
-        if not data.empty:
-            return round(data['Close'].iloc[-1], 2)
-        return None
+        closes = get_close_series(_fx_ticker(currency_code), "5d")
+        return round(closes.iloc[-1], 2)
     except Exception:
         return None
 
 
+def _build_fx_matrix(currencies) -> FxMatrix:
+    """
+    교차환율 행렬을 1회 조회로 만듭니다.
+    exchangerate-api USD 기준 전체 환율을 쓰고, 빠진 통화는 Yahoo 배치 시세(1회 요청)에서 채웁니다.
+    """
+    usd_rates = {}
+    if EXCHANGE_API_KEY:
+        try:
+            usd_rates = dict(_get_usd_rates())
+        except Exception:
+            usd_rates = {}
+
+    missing = [c for c in currencies if c not in usd_rates and c != "USD"]
+    if missing:
+        try:
+            last = get_batch_closes("5d").ffill().iloc[-1]
+        except Exception:
+            last = pd.Series(dtype=float)
+        for currency in missing:
+            ticker = "KRW=X" if currency == "KRW" else _fx_ticker(currency)
+            if pd.notna(last.get(ticker)):
+                usd_rates[currency] = float(last[ticker])
+
+    if not usd_rates.get("KRW"):
+        raise ValueError("USD/KRW 환율 없음")
+    return FxMatrix.from_usd_rates(currencies, usd_rates, usd_rates["KRW"])
+
+
+def get_fx_matrix(usd_krw: float = None, currencies=(), force: bool = False) -> FxMatrix:
+    """
+    KRW, USD, 주요 통화, 모든 산지 통화의 교차환율 행렬 (공용 캐시, 소스: fx_matrix)
+
+    Args:
+        usd_krw: 적용할 USD/KRW 환율 (수동 환율 등, None이면 조회값 그대로)
+        currencies: 추가로 넣을 통화 코드
+        force: True면 캐시를 무시하고 새로 만들어 교체
+
+    Returns:
+        FxMatrix (조회 실패 시 KRW/USD만 있는 행렬)
+    """
+    origin_currencies = sorted({info['currency'] for info in get_coffee_origins().values()})
+    codes = tuple(dict.fromkeys([*FX_BASE_CURRENCIES, *origin_currencies, *currencies]))
+    try:
+        matrix = market_cache.get_or_fetch("fx_matrix", make_key(currencies=codes),
+                                           lambda: _build_fx_matrix(codes), force=force)
+    except Exception:
+        matrix = FxMatrix.from_usd_rates(codes, {}, usd_krw or get_exchange_rate())
+    return matrix.rebased(usd_krw) if usd_krw else matrix
+
+
+def get_krw_rates(currencies, usd_krw: float = None) -> dict:
+    """
+    통화별 1단위당 원화 환율을 한 번에 구합니다 (교차환율 행렬 기반, 통화별 개별 조회 없음).
+
+    Args:
+        currencies: 통화 코드 목록 (예: ["USD", "EUR", "BRL"])
+        usd_krw: USD/KRW 환율 (None이면 조회값)
+
+    Returns:
+        dict: {통화: 원/1단위} (조회할 수 없는 통화는 제외)
+    """
+    matrix = get_fx_matrix(usd_krw, tuple(sorted(set(currencies))))
+    return {c: v for c, v in matrix.krw_rates().items() if c in set(currencies) | {"KRW", "USD"}}
+
+
 # ===========================================
 # 2. 시장 데이터 함수
 # ===========================================
 
-@st.cache_data(ttl=300)
 def get_market_data(ticker: str):
     """
     Yahoo Finance에서 시장 데이터를 가져옵니다.
@@ -102,10 +350,10 @@ def get_market_data(ticker: str):
         tuple: (현재가, 변동률%)
     """
     try:
-        df = yf.Ticker(ticker).history(period="5d")
-        if not df.empty and len(df) >= 2:
-            curr = df['Close'].iloc[-1]
-            prev = df['Close'].iloc[-2]
+        closes = get_close_series(ticker, "5d")
+        if len(closes) >= 2:
+            curr = closes.iloc[-1]
+            prev = closes.iloc[-2]
             change = ((curr - prev) / prev) * 100
             return round(curr, 2), round(change, 2)
         return 0.0, 0.0
@@ -125,15 +373,14 @@ def get_history_rate(currency_code: str, period: str):
         plotly Figure 또는 None
     """
     try:
-        ticker = f"{currency_code}=X" if currency_code != "USD" else "USDKRW=X"
-        df = yf.Ticker(ticker).history(period=period)
-        if df.empty:
-            return None
+        ticker = _fx_ticker(currency_code)
+        # 긴 기간은 수만 개의 점이 되므로 화면 폭에 맞게 줄여서 전송
+        closes = get_chart_series(ticker, period, lambda: get_close_series(ticker, period))
         
         fig = go.Figure(data=[
             go.Scatter(
-                x=df.index,
-                y=df['Close'],
+                x=closes.index,
+                y=closes.values,
                 mode='lines',
                 line=dict(color=COLOR_PRIMARY)
             )
@@ -156,6 +403,7 @@ def get_history_rate(currency_code: str, period: str):
 def get_country_weather(city_name: str):
     """
     OpenWeatherMap API를 사용하여 도시 날씨를 가져옵니다.
+    선적항은 모든 항구를 한 번에 받은 공용 캐시에서 꺼냅니다 (utils/weather_service.py).
     
     Args:
         city_name: 도시 이름 (영문)
@@ -163,36 +411,33 @@ def get_country_weather(city_name: str):
     Returns:
         dict: {'temp': 온도, 'desc_ko': 한글 설명, 'desc_en': 영문 설명}
     """
-    try:
-        if not WEATHER_API_KEY:
-            return {'temp': 0, 'desc_ko': "API키 없음", 'desc_en': "No API Key"}
-        
-        url = f"http://api.openweathermap.org/data/2.5/weather?q={city_name}&appid={WEATHER_API_KEY}&units=metric&lang=en"
-        res = requests.get(url, timeout=10).json()
-        
-        if res.get('cod') != 200:
-            return {'temp': 0, 'desc_ko': "정보 없음", 'desc_en': "No Info"}
-        
-        desc_en = res['weather'][0]['description']
-        temp = res['main']['temp']
-        
-        # 영문 → 한글 변환
-        weather_map = {
-            'clear sky': '맑음',
-            'few clouds': '구름 조금',
-            'scattered clouds': '구름 낌',
-            'broken clouds': '구름 많음',
-            'overcast clouds': '흐림',
-            'light rain': '약한 비',
-            'moderate rain': '비',
-            'heavy intensity rain': '강한 비',
-            'thunderstorm': '뇌우',
-            'snow': '눈',
-            'mist': '안개',
-            'haze': '연무'
-        }
-        desc_ko = weather_map.get(desc_en, desc_en)
-        
-        return {'temp': temp, 'desc_ko': desc_ko, 'desc_en': desc_en}
-    except Exception:
-        return {'temp': 0, 'desc_ko': "수신 불가", 'desc_en': "Error"}
+    return get_port_weather(city_name)
+
+
+# ===========================================
+# 4. 캐시 갱신 함수 (백그라운드 워머용)
+# ===========================================
+# 아래 함수들은 캐시 유효기간과 무관하게 새로 받아 공용 캐시를 통째로 교체합니다.
+# 실패 시 예외를 그대로 올려 기존 캐시 값은 유지됩니다.
+
+def refresh_market_quotes():
+    """KC=F, RC=F, KRW=X, 산지 통화 배치 시세 갱신"""
+    get_batch_closes("5d", force=True)
+
+
+def refresh_exchange_rates():
+    """exchangerate-api USD 기준 환율 + 교차환율 행렬 갱신"""
+    if EXCHANGE_API_KEY:
+        _get_usd_rates(force=True)
+    get_fx_matrix(force=True)
+
+
+def refresh_port_weather():
+    """모든 산지 선적항 날씨 갱신 (group API 1회)"""
+    if WEATHER_API_KEY:
+        get_port_weather_map(force=True)
+
+
+def refresh_history():
+    """배치 대상 티커의 로컬 히스토리 저장소 증분 갱신"""
+    sync_history(get_batch_tickers(), force=True)
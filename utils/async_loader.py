@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/async_loader.py - 페이지 데이터 동시 로딩
+================================================================================
+한 페이지에 필요한 여러 외부 조회(환율, 시세, 히스토리 등)를 한꺼번에 시작하고
+전체 마감 시간(deadline) 하나로 기다립니다.
+렌더링 대기 시간이 '모든 호출의 합'이 아니라 '가장 느린 호출'로 줄어듭니다.
+
+yfinance, requests 등 동기 함수는 asyncio 이벤트 루프에서 전용 스레드 풀로
+넘겨 실행합니다 (run_in_executor).
+
+💡 사용 예시:
+    from utils.async_loader import gather_with_deadline
+    results = gather_with_deadline(
+        {"krw": get_exchange_rate_info, "kc": lambda: get_market_data("KC=F")},
+        deadline=6.0,
+        defaults={"kc": (0.0, 0.0)}
+    )
+
+💡 팁:
+- 마감 시간 안에 끝나지 않은 작업은 defaults 값으로 대체되고, 작업 자체는
+  백그라운드에서 계속 진행되어 결과가 공용 캐시에 채워집니다.
+- 예외가 난 작업도 defaults 값으로 대체됩니다 (다른 작업에는 영향 없음).
+- 마감 시간을 넘긴 작업 이름은 deadline_misses()로 확인할 수 있습니다
+  (bench_render.py가 대체값으로 그려진 화면을 걸러낼 때 사용).
+================================================================================
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+
+# 페이지 로딩 전용 스레드 풀
+# asyncio.run()의 기본 실행기는 종료 시 모든 스레드를 기다리므로 마감 시간을
+# 지킬 수 없습니다. 별도 풀을 쓰면 늦은 작업은 그대로 두고 바로 반환할 수 있습니다.
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="page-loader")
+
+# 마감 시간 안에 끝나지 않아 대체값으로 넘어간 작업 (화면에는 기본값이 그려짐)
+_deadline_misses: List[str] = []
+_deadline_misses_lock = threading.Lock()
+
+
+def deadline_misses() -> List[str]:
+    """reset_deadline_misses() 이후 마감 시간을 넘긴 작업 이름 목록"""
+    with _deadline_misses_lock:
+        return list(_deadline_misses)
+
+
+def reset_deadline_misses():
+    with _deadline_misses_lock:
+        _deadline_misses.clear()
+
+
+async def _gather(jobs: Dict[str, Callable[[], Any]], deadline: float) -> Dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    futures = {name: loop.run_in_executor(_executor, job) for name, job in jobs.items()}
+    await asyncio.wait(futures.values(), timeout=deadline)
+
+    results, late = {}, []
+    for name, future in futures.items():
+        if not future.done():
+            late.append(name)
+        elif not future.cancelled() and future.exception() is None:
+            results[name] = future.result()
+    if late:
+        with _deadline_misses_lock:
+            _deadline_misses.extend(late)
+    return results
+
+
+def gather_with_deadline(jobs: Dict[str, Callable[[], Any]], deadline: float,
+                         defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    여러 조회 함수를 동시에 실행하고 마감 시간까지 모인 결과를 반환합니다.
+
+    Args:
+        jobs: {이름: 인자 없는 조회 함수}
+        deadline: 전체 마감 시간(초)
+        defaults: {이름: 실패/시간 초과 시 대체값} (없는 이름은 None)
+
+    Returns:
+        dict: {이름: 결과 또는 대체값}
+    """
+    defaults = defaults or {}
+    if not jobs:
+        return {}
+
+    # Streamlit 스크립트 스레드에는 실행 중인 이벤트 루프가 없으므로 매번 새로 만듦
+    finished = asyncio.run(_gather(jobs, deadline))
+    return {name: finished.get(name, defaults.get(name)) for name in jobs}
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/backtest.py - 소싱 시그널 임계값 백테스트
+================================================================================
+과거 KC=F(Arabica), KRW=X(환율) 등 일별 시세로 시그널 점수를 다시 계산하고,
+"점수가 매수 기준 이상인 날에만 산다" 전략의 실현 원가를
+"매일 같은 양을 산다"(DCA, 분할 매입) 기준과 비교합니다.
+
+- 매달 1단위(같은 물량)를 반드시 구매한다고 가정
+- 전략: 그 달의 매수 신호일에 물량을 나눠 구매, 신호가 없으면 말일에 전량 구매
+- 원가(원/kg) = Arabica(¢/lb) ÷ 100 × 2.20462 × USD/KRW
+
+임계값 조합(수천 개)은 프로세스 풀로 나눠 계산합니다.
+
+💡 실행 예시:
+    python -m utils.backtest                     # 기본 그리드, 10년, CPU 코어 수만큼
+    python -m utils.backtest --period max --workers 16 --top 20
+================================================================================
+"""
+
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict, replace
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .signal_engine import INSTRUMENTS, INDICATOR_INSTRUMENTS, RuleSet, get_rule_set, score_changes
+from .indicators import indicator_features
+
+
+LB_PER_KG = 2.20462
+
+
+# ===========================================
+# 1. 파라미터 / 데이터
+# ===========================================
+@dataclass(frozen=True)
+class BacktestParams:
+    """백테스트할 임계값 조합 (기본값 = data/signal_rules.json / 매수 단계 60점)"""
+    arabica_buy_below: float = -1.0
+    arabica_sell_above: float = 2.0
+    arabica_points: int = 15
+    robusta_points: int = 10
+    fx_buy_below: float = -0.5
+    fx_sell_above: float = 1.0
+    fx_points: int = 10
+    freight_points: int = 5
+    buy_score: float = 60
+
+    def to_rules(self) -> RuleSet:
+        """규칙 파일의 규칙에 이 조합의 임계값/가감점을 덮어쓴 규칙 묶음"""
+        # (지표, 비교 연산) → 덮어쓸 임계값 / 가감점 ("<"는 매수 가점, ">"는 매도 감점)
+        overrides = {
+            ("arabica", "<"): (self.arabica_buy_below, self.arabica_points),
+            ("arabica", ">"): (self.arabica_sell_above, -self.arabica_points),
+            ("robusta", "<"): (None, self.robusta_points),
+            ("robusta", ">"): (None, -self.robusta_points),
+            ("usd_krw", "<"): (self.fx_buy_below, self.fx_points),
+            ("usd_krw", ">"): (self.fx_sell_above, -self.fx_points),
+            ("freight", "<"): (None, self.freight_points),
+            ("freight", ">"): (None, -self.freight_points),
+        }
+        base = get_rule_set()
+        rules = []
+        for rule in base.rules:
+            threshold, delta = overrides.get((rule.instrument, rule.comparator), (None, rule.delta))
+            rules.append(replace(rule, threshold=rule.threshold if threshold is None else threshold,
+                                 delta=delta))
+        return base.with_rules(rules)
+
+
+@dataclass
+class BacktestData:
+    """백테스트용으로 미리 계산해 둔 배열 (프로세스마다 1회만 전달)"""
+    changes: Dict[str, np.ndarray]  # 지표별 일별 변동률(%) + 기술적 지표(<지표>_rsi, <지표>_zscore)
+    cost: np.ndarray                # 일별 원가 (원/kg)
+    month: np.ndarray               # 일별 월 번호 (0부터)
+    last_day: np.ndarray            # 그 달의 마지막 거래일 여부
+    n_months: int
+    start: pd.Timestamp
+    end: pd.Timestamp
+
+
+def prepare_backtest_data(prices: pd.DataFrame) -> BacktestData:
+    """
+    가격 표를 백테스트용 배열로 변환합니다.
+
+    Args:
+        prices: 날짜 인덱스 + arabica(¢/lb), usd_krw 컬럼 (robusta, freight는 선택)
+
+    Returns:
+        BacktestData
+    """
+    prices = prices.reindex(columns=list(INSTRUMENTS)).sort_index().ffill()
+    prices = prices.dropna(subset=["arabica", "usd_krw"])
+    if len(prices) < 2:
+        raise ValueError("백테스트할 시세 데이터가 부족합니다.")
+
+    changes = prices.pct_change(fill_method=None) * 100
+    cost = (prices["arabica"] / 100 * LB_PER_KG * prices["usd_krw"]).to_numpy()
+    periods = prices.index.to_period("M")
+    month = pd.factorize(periods)[0]
+    last_day = np.r_[month[1:] != month[:-1], True]
+
+    features = {name: changes[name].to_numpy() for name in INSTRUMENTS}
+    features.update(indicator_features(prices, INDICATOR_INSTRUMENTS))
+
+    return BacktestData(
+        changes=features,
+        cost=cost, month=month, last_day=last_day, n_months=int(month.max()) + 1,
+        start=prices.index[0], end=prices.index[-1]
+    )
+
+
+# ===========================================
+# 2. 시뮬레이션
+# ===========================================
+def run_backtest(data: BacktestData, params: BacktestParams = BacktestParams()) -> Dict:
+    """
+    임계값 조합 하나를 시뮬레이션합니다 (배열 연산, 반복문 없음).
+
+    Args:
+        data: prepare_backtest_data() 결과
+        params: 임계값 조합
+
+    Returns:
+        dict: 파라미터 + avg_cost(전략 평균 원가), dca_cost(DCA 평균 원가),
+              savings_pct(DCA 대비 절감률 %), signal_days(매수 신호일 수)
+    """
+    score = score_changes(data.changes, params.to_rules())
+    buy = score >= params.buy_score
+    signal_days = int(buy.sum())
+
+    # 신호가 한 번도 없던 달은 말일에 전량 구매
+    buys_per_month = np.bincount(data.month, weights=buy, minlength=data.n_months)
+    buy = buy | (data.last_day & (buys_per_month[data.month] == 0))
+    buys_per_month = np.bincount(data.month, weights=buy, minlength=data.n_months)
+
+    # 달마다 1단위를 신호일에 균등 분할 구매
+    weight = buy / buys_per_month[data.month]
+    strategy_monthly = np.bincount(data.month, weights=weight * data.cost, minlength=data.n_months)
+    days_per_month = np.bincount(data.month, minlength=data.n_months)
+    dca_monthly = np.bincount(data.month, weights=data.cost, minlength=data.n_months) / days_per_month
+
+    avg_cost = float(strategy_monthly.mean())
+    dca_cost = float(dca_monthly.mean())
+    return {
+        **asdict(params),
+        'avg_cost': round(avg_cost, 2),
+        'dca_cost': round(dca_cost, 2),
+        'savings_pct': round((dca_cost - avg_cost) / dca_cost * 100, 3),
+        'signal_days': signal_days,
+    }
+
+
+# ===========================================
+# 3. 임계값 그리드 탐색 (프로세스 풀)
+# ===========================================
+DEFAULT_GRID = {
+    "arabica_buy_below": [-0.5, -1.0, -1.5, -2.0],
+    "arabica_sell_above": [1.0, 2.0, 3.0],
+    "arabica_points": [10, 15, 20],
+    "fx_buy_below": [-0.3, -0.5, -0.8],
+    "fx_sell_above": [0.5, 1.0, 1.5],
+    "fx_points": [5, 10, 15],
+    "buy_score": [55, 60, 65, 75],
+}
+
+_worker_data: Optional[BacktestData] = None
+
+
+def _init_worker(data: BacktestData):
+    # 각 프로세스에 배열을 한 번만 전달 (작업마다 복사하지 않음)
+    global _worker_data
+    _worker_data = data
+
+
+def _run_chunk(chunk: Sequence[BacktestParams]) -> List[Dict]:
+    return [run_backtest(_worker_data, params) for params in chunk]
+
+
+def expand_grid(grid: Dict[str, Iterable]) -> List[BacktestParams]:
+    """{파라미터: 후보 목록} 그리드의 모든 조합을 만듭니다."""
+    names = list(grid)
+    return [BacktestParams(**dict(zip(names, values)))
+            for values in itertools.product(*(grid[name] for name in names))]
+
+
+def sweep(data: BacktestData, grid: Dict[str, Iterable] = None,
+          workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    임계값 그리드 전체를 백테스트합니다.
+
+    Args:
+        data: prepare_backtest_data() 결과
+        grid: {파라미터: 후보 목록} (기본: DEFAULT_GRID)
+        workers: 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 실행)
+
+    Returns:
+        pd.DataFrame: 조합별 결과 (절감률 높은 순)
+    """
+    combos = expand_grid(grid or DEFAULT_GRID)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        rows = [run_backtest(data, params) for params in combos]
+    else:
+        # 프로세스 간 통신 횟수를 줄이도록 조합을 큰 묶음으로 나눔
+        chunk_size = max(1, len(combos) // (workers * 4))
+        chunks = [combos[i:i + chunk_size] for i in range(0, len(combos), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(data,)) as pool:
+            rows = [row for result in pool.map(_run_chunk, chunks) for row in result]
+
+    return pd.DataFrame(rows).sort_values("savings_pct", ascending=False).reset_index(drop=True)
+
+
+# ===========================================
+# 4. 명령줄 실행
+# ===========================================
+def main():
+    from .market_providers import get_market_history
+
+    parser = argparse.ArgumentParser(description="소싱 시그널 임계값 백테스트")
+    parser.add_argument("--period", default="10y", help="기간 (1y, 5y, 10y, max)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 상위 조합 수")
+    parser.add_argument("--output", default=None, help="전체 결과 CSV 저장 경로")
+    args = parser.parse_args()
+
+    data = prepare_backtest_data(get_market_history(args.period))
+    baseline = run_backtest(data)
+    print(f"기간: {data.start:%Y-%m-%d} ~ {data.end:%Y-%m-%d} ({data.n_months}개월)")
+    print(f"현재 임계값: 평균 원가 {baseline['avg_cost']:,.0f}원/kg, "
+          f"DCA {baseline['dca_cost']:,.0f}원/kg, 절감률 {baseline['savings_pct']:+.2f}%")
+
+    started = time.perf_counter()
+    results = sweep(data, workers=args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"{len(results):,}개 조합 탐색: {elapsed:.1f}초")
+    print(results.head(args.top).to_string())
+
+    if args.output:
+        results.to_csv(args.output, index=False, encoding="utf-8-sig")
+        print(f"저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/cache_warmer.py - 백그라운드 캐시 워머
+================================================================================
+서버당 1개의 데몬 스레드가 시세, 환율, 선적항 날씨를 주기적으로 미리 받아
+공용 캐시(utils/market_cache.py)에 통째로 교체해 넣습니다.
+사용자 요청은 항상 데워진 캐시를 읽으므로 외부 API 지연의 영향을 받지 않습니다.
+
+💡 팁:
+- 갱신 주기는 config.py의 CACHE_WARMER_INTERVALS에서 조정합니다.
+- CACHE_WARMER_ENABLED=0 환경변수로 끌 수 있습니다.
+- start_cache_warmer()는 여러 번 호출해도 스레드를 1개만 띄웁니다.
+================================================================================
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from config import CACHE_WARMER_ENABLED, CACHE_WARMER_INTERVALS
+from .api_helpers import (
+    refresh_market_quotes,
+    refresh_exchange_rates,
+    refresh_port_weather,
+    refresh_history
+)
+from .market_providers import refresh_freight_index
+
+
+# 작업 이름 → 갱신 함수 (config.CACHE_WARMER_INTERVALS의 키와 같음)
+WARM_JOBS: Dict[str, Callable[[], None]] = {
+    "market_quotes": refresh_market_quotes,
+    "exchange_rates": refresh_exchange_rates,
+    "port_weather": refresh_port_weather,
+    "history": refresh_history,
+    "freight_index": refresh_freight_index,
+}
+
+
+class CacheWarmer(threading.Thread):
+    """주기별로 갱신 작업을 실행하는 데몬 스레드"""
+
+    def __init__(self, jobs: Dict[str, Callable[[], None]], intervals: Dict[str, int]):
+        super().__init__(name="cache-warmer", daemon=True)
+        self.jobs = jobs
+        self.intervals = intervals
+        self._next_run = {name: 0.0 for name in jobs}
+        self._status: Dict[str, Dict] = {}
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            now = time.time()
+            for name, job in self.jobs.items():
+                if now < self._next_run[name]:
+                    continue
+                self._run_job(name, job)
+                self._next_run[name] = time.time() + self.intervals.get(name, 300)
+            self._stop_event.wait(1.0)
+
+    def _run_job(self, name: str, job: Callable[[], None]):
+        started = time.time()
+        try:
+            job()
+            error = None
+        except Exception as e:
+            # 실패해도 기존 캐시 값은 그대로 유지됨
+            error = str(e)
+        self._status[name] = {
+            'last_run': started,
+            'duration': round(time.time() - started, 3),
+            'error': error,
+        }
+
+    def stop(self):
+        """스레드를 멈춥니다."""
+        self._stop_event.set()
+
+    def status(self) -> Dict[str, Dict]:
+        """작업별 마지막 실행 시각/소요 시간/오류를 반환합니다."""
+        return {name: dict(info) for name, info in self._status.items()}
+
+
+_warmer: Optional[CacheWarmer] = None
+_warmer_lock = threading.Lock()
+
+
+def start_cache_warmer() -> Optional[CacheWarmer]:
+    """
+    서버당 1개의 캐시 워머 스레드를 시작합니다 (이미 실행 중이면 그대로 반환).
+
+    Returns:
+        CacheWarmer 또는 None (CACHE_WARMER_ENABLED=0인 경우)
+    """
+    global _warmer
+    if not CACHE_WARMER_ENABLED:
+        return None
+    with _warmer_lock:
+        if _warmer is None or not _warmer.is_alive():
+            _warmer = CacheWarmer(WARM_JOBS, CACHE_WARMER_INTERVALS)
+            _warmer.start()
+        return _warmer
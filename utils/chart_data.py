@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/chart_data.py - 차트용 시계열 축소 (다운샘플링)
+================================================================================
+"max" 기간처럼 수만 개의 점을 가진 시계열을 화면 폭에 맞는 점 개수로 줄여
+브라우저로 보내는 데이터 크기를 줄입니다.
+
+- LTTB(Largest-Triangle-Three-Buckets): 선 모양을 최대한 유지하는 점을 고름
+- 전체 구간의 최고/최저점은 항상 포함
+- 축소 결과는 (티커, 기간)별로 공용 캐시(소스: chart_series)에 저장
+  (원본이 바뀌면 같은 키의 값을 새 버전으로 교체)
+
+💡 팁:
+- 점 개수 상한은 config.py의 CHART_MAX_POINTS에서 조정합니다.
+- 원본 점 개수가 상한 이하이면 그대로 반환합니다.
+================================================================================
+"""
+
+from typing import Callable, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import CHART_MAX_POINTS
+from .market_cache import market_cache, make_key
+
+
+# ===========================================
+# 1. LTTB 다운샘플링
+# ===========================================
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    LTTB 알고리즘으로 남길 점의 인덱스를 고릅니다.
+
+    Args:
+        x: x 좌표 (오름차순 숫자 배열)
+        y: y 좌표
+        threshold: 남길 점 개수 (3 이상)
+
+    Returns:
+        np.ndarray: 선택된 인덱스 (오름차순, 첫 점과 마지막 점 포함)
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # 첫 점과 마지막 점을 제외한 구간을 (threshold - 2)개 버킷으로 나눔
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 버킷의 평균점 (마지막 버킷은 마지막 점)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # 직전 선택점, 후보점, 다음 버킷 평균점이 만드는 삼각형 넓이가 가장 큰 후보 선택
+        bx, by = x[start:end], y[start:end]
+        area = np.abs((x[prev] - avg_x) * (by - y[prev]) - (x[prev] - bx) * (avg_y - y[prev]))
+        prev = start + int(np.argmax(area))
+        selected[i + 1] = prev
+    return selected
+
+
+def downsample_series(series: pd.Series, max_points: int = CHART_MAX_POINTS) -> pd.Series:
+    """
+    시계열을 max_points 근처로 줄입니다 (최고/최저점 보존).
+
+    Args:
+        series: 날짜(또는 숫자) 인덱스의 시계열
+        max_points: 남길 점 개수 상한
+
+    Returns:
+        pd.Series: 축소된 시계열 (원본이 작으면 그대로)
+    """
+    series = series.dropna()
+    if len(series) <= max_points:
+        return series
+
+    index = series.index
+    x = index.asi8.astype(float) if isinstance(index, pd.DatetimeIndex) else np.asarray(index, dtype=float)
+    y = series.to_numpy(dtype=float)
+
+    # 최고/최저점 자리를 비워두고 LTTB로 고른 뒤 두 점을 합침
+    keep = lttb_indices(x, y, max_points - 2)
+    keep = np.union1d(keep, [int(np.argmax(y)), int(np.argmin(y))])
+    return series.iloc[keep]
+
+
+def downsample_frame(df: pd.DataFrame, x_col: str, y_col: str,
+                     max_points: int = CHART_MAX_POINTS) -> pd.DataFrame:
+    """
+    DataFrame의 (x_col, y_col) 선을 기준으로 행을 줄입니다.
+
+    Args:
+        df: x_col 오름차순으로 정렬된 DataFrame
+        x_col: x축 컬럼 (날짜)
+        y_col: y축 컬럼 (가격)
+        max_points: 남길 점 개수 상한
+
+    Returns:
+        pd.DataFrame: 축소된 DataFrame (인덱스는 0부터 다시 매김)
+    """
+    reduced = downsample_series(df.set_index(x_col)[y_col], max_points)
+    return df[df[x_col].isin(reduced.index)].reset_index(drop=True)
+
+
+# ===========================================
+# 2. 축소 결과 캐시
+# ===========================================
+def get_chart_series(ticker: str, period: str, load: Callable[[], pd.Series],
+                     max_points: int = CHART_MAX_POINTS,
+                     version: Optional[Hashable] = None) -> pd.Series:
+    """
+    (티커, 기간)별로 축소된 차트 시계열을 반환합니다 (공용 캐시, 소스: chart_series).
+
+    Args:
+        ticker: 티커 또는 시리즈 이름
+        period: 기간 코드
+        load: 원본 시계열을 반환하는 함수 (캐시에 없을 때만 호출)
+        max_points: 남길 점 개수 상한
+        version: 원본 데이터가 바뀌었음을 알리는 값 (예: 마지막 날짜)
+
+    Returns:
+        pd.Series: 축소된 시계열
+    """
+    # version은 키가 아니라 값에 담아 같은 키의 이전 버전을 교체 (캐시 항목 수가 늘지 않음)
+    key = make_key(ticker=ticker, period=period, points=max_points)
+
+    def fetch():
+        return version, downsample_series(load(), max_points)
+
+    cached_version, series = market_cache.get_or_fetch("chart_series", key, fetch)
+    if cached_version != version:
+        cached_version, series = market_cache.get_or_fetch("chart_series", key, fetch, force=True)
+    return series
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/excel_export.py - 공용 엑셀 내보내기 (xlsxwriter 상수 메모리 모드)
+================================================================================
+원가 계산기(tab3), 제안서(tab2), 일괄 계산 리포트가 함께 쓰는 엑셀 작성기입니다.
+
+- xlsxwriter constant_memory 모드: 행을 쓰는 즉시 임시 파일로 내보내므로
+  10만 행 이상의 표도 메모리 사용량이 일정합니다.
+- 표는 컬럼 배열에서 행 단위로 한 번에 기록합니다 (셀 서식 문자열을 미리 만들지 않음).
+- 여러 시트 리포트를 하나의 파일로 만들 수 있습니다.
+
+💡 팁:
+- 상수 메모리 모드에서는 시트마다 위에서 아래로만 쓸 수 있습니다.
+  ReportSheet가 현재 행을 관리하므로 호출 순서대로 내려가며 기록됩니다.
+- path를 지정하면 파일로 바로 저장하고, 생략하면 BytesIO로 돌려줍니다
+  (st.download_button에 그대로 전달 가능).
+================================================================================
+"""
+
+import os
+import tempfile
+from io import BytesIO
+from typing import Dict, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+
+# 기본 서식 (원가 계산기 녹색 테마)
+HEADER_STYLE = {"bold": True, "font_color": "white", "align": "center",
+                "bg_color": "#00695C", "border": 1}
+CELL_STYLE = {"border": 1}
+INTEGER_FORMAT = "#,##0"
+FLOAT_FORMAT = "#,##0.00"
+DATE_FORMAT = "yyyy-mm-dd"
+
+
+TABLE_CHUNK_ROWS = 10_000
+
+
+def _column_values(values) -> list:
+    """컬럼 배열 → 엑셀에 쓸 파이썬 값 목록 (NaN/NaT/±inf는 빈 칸)"""
+    series = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        series = pd.Series(series.dt.to_pydatetime(), dtype=object)
+    series = series.astype(object)
+    # xlsxwriter는 무한대 숫자를 기록하지 못함 (write_number에서 TypeError)
+    return series.where(series.notna() & ~series.isin([np.inf, -np.inf]), None).tolist()
+
+
+def _column_kind(values) -> str:
+    """자료형별 기록 방식 (number / datetime / bool / any)"""
+    dtype = pd.Series(values).dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return "bool"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "number"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    return "any"
+
+
+def _default_num_format(values) -> Optional[str]:
+    """자료형별 기본 표시 형식"""
+    dtype = pd.Series(values).dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return None
+    if pd.api.types.is_integer_dtype(dtype):
+        return INTEGER_FORMAT
+    if pd.api.types.is_float_dtype(dtype):
+        return FLOAT_FORMAT
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return DATE_FORMAT
+    return None
+
+
+# ===========================================
+# 1. 시트 작성기
+# ===========================================
+class ReportSheet:
+    """시트 1개를 위에서 아래로 채우는 작성기 (현재 행 관리)"""
+
+    def __init__(self, report: "ExcelReport", worksheet):
+        self.report = report
+        self.worksheet = worksheet
+        self.row = 0
+
+    def skip(self, rows: int = 1) -> "ReportSheet":
+        """빈 행 건너뛰기"""
+        self.row += rows
+        return self
+
+    def merged(self, text, columns: int, style: Optional[Dict] = None, rows: int = 1) -> "ReportSheet":
+        """여러 칸을 병합해 값 1개 기록 (제목, 긴 문단 등)"""
+        fmt = self.report.format(**(style or {}))
+        if columns > 1 or rows > 1:
+            self.worksheet.merge_range(self.row, 0, self.row + rows - 1, columns - 1, text, fmt)
+        else:
+            self.worksheet.write(self.row, 0, text, fmt)
+        self.row += rows
+        return self
+
+    def values(self, values: Sequence, styles: Union[Dict, Sequence[Optional[Dict]], None] = None) -> "ReportSheet":
+        """
+        한 행 기록
+
+        Args:
+            values: 칸별 값 (None은 건너뜀)
+            styles: 행 전체 서식 dict 또는 칸별 서식 목록
+        """
+        if styles is None or isinstance(styles, dict):
+            styles = [styles] * len(values)
+        for col, (value, style) in enumerate(zip(values, styles)):
+            if value is None:
+                continue
+            fmt = self.report.format(**style) if style else None
+            self.worksheet.write(self.row, col, value, fmt)
+        self.row += 1
+        return self
+
+    def key_values(self, pairs: Sequence[Sequence], label_style: Optional[Dict] = None,
+                   value_style: Optional[Dict] = None) -> "ReportSheet":
+        """(항목, 값) 목록을 2열 표로 기록"""
+        for label, value in pairs:
+            self.values([label, value], [label_style, value_style])
+        return self
+
+    def table(self, columns: Union[pd.DataFrame, Mapping[str, Sequence]],
+              header_style: Optional[Dict] = None, cell_style: Optional[Dict] = None,
+              num_formats: Optional[Mapping[str, str]] = None,
+              widths: Optional[Mapping[str, float]] = None) -> "ReportSheet":
+        """
+        컬럼 배열 표를 행 단위로 기록합니다 (헤더 1행 + 데이터 행).
+
+        Args:
+            columns: DataFrame 또는 {컬럼 이름: 값 배열}
+            header_style: 헤더 서식 (기본 HEADER_STYLE)
+            cell_style: 데이터 칸 공통 서식 (기본 CELL_STYLE)
+            num_formats: {컬럼 이름: 표시 형식} (생략 시 자료형별 기본값)
+            widths: {컬럼 이름: 열 너비}
+        """
+        if isinstance(columns, pd.DataFrame):
+            columns = {str(name): columns[name] for name in columns.columns}
+        names = list(columns)
+        num_formats = num_formats or {}
+        cell_style = CELL_STYLE if cell_style is None else cell_style
+
+        formats = []
+        for col, name in enumerate(names):
+            num_format = num_formats.get(name, _default_num_format(columns[name]))
+            style = {**cell_style, "num_format": num_format} if num_format else cell_style
+            formats.append(self.report.format(**style) if style else None)
+            if widths and name in widths:
+                self.worksheet.set_column(col, col, widths[name])
+
+        self.values(names, header_style or HEADER_STYLE)
+        # 자료형별 전용 메서드로 바로 기록 (write()의 값 종류 판별 생략)
+        ws = self.worksheet
+        writers = {"number": ws.write_number, "datetime": ws.write_datetime,
+                   "bool": ws.write_boolean, "any": ws.write}
+        column_writers = [writers[_column_kind(values)] for values in columns.values()]
+        arrays = [pd.Series(values).reset_index(drop=True) for values in columns.values()]
+
+        total = len(arrays[0]) if arrays else 0
+        # 파이썬 값 목록은 청크 단위로만 만들어 메모리 사용량을 일정하게 유지
+        for start in range(0, total, TABLE_CHUNK_ROWS):
+            cells = [_column_values(values.iloc[start:start + TABLE_CHUNK_ROWS]) for values in arrays]
+            for record in zip(*cells):
+                row = self.row
+                for col, value in enumerate(record):
+                    if value is not None:
+                        column_writers[col](row, col, value, formats[col])
+                self.row += 1
+        return self
+
+
+# ===========================================
+# 2. 통합 문서
+# ===========================================
+class ExcelReport:
+    """
+    상수 메모리 모드 엑셀 통합 문서
+
+    사용 예:
+        with ExcelReport() as report:
+            sheet = report.add_sheet("결과", widths=[25, 20])
+            sheet.merged("제목", 2, {"bold": True}).skip()
+            sheet.table(df)
+        buffer = report.output
+    """
+
+    def __init__(self, path: Optional[str] = None, font_name: Optional[str] = None):
+        """
+        Args:
+            path: 저장할 파일 경로 (None이면 임시 파일에 쓴 뒤 BytesIO로 반환)
+            font_name: 모든 서식에 적용할 글꼴
+        """
+        self.path = path
+        self.font_name = font_name
+        self.output: Union[BytesIO, str, None] = None
+        if path is None:
+            handle, self._target = tempfile.mkstemp(suffix=".xlsx")
+            os.close(handle)
+        else:
+            self._target = path
+        self.workbook = xlsxwriter.Workbook(self._target, {
+            "constant_memory": True,
+            "strings_to_formulas": False,   # "=..." 문자열이 수식으로 실행되지 않도록
+            "strings_to_urls": False,
+        })
+        self._formats = {}
+
+    def format(self, **style):
+        """같은 속성의 서식은 1번만 만들어 재사용"""
+        if self.font_name and "font_name" not in style:
+            style["font_name"] = self.font_name
+        key = tuple(sorted(style.items()))
+        if key not in self._formats:
+            self._formats[key] = self.workbook.add_format(style)
+        return self._formats[key]
+
+    def add_sheet(self, name: str, widths: Sequence[float] = ()) -> ReportSheet:
+        """시트 추가 (widths: A열부터 열 너비)"""
+        worksheet = self.workbook.add_worksheet(name[:31])
+        for col, width in enumerate(widths):
+            worksheet.set_column(col, col, width)
+        return ReportSheet(self, worksheet)
+
+    def close(self) -> Union[BytesIO, str]:
+        """
+        파일을 마무리합니다.
+
+        Returns:
+            path를 지정했으면 경로, 아니면 완성된 파일 내용(BytesIO)
+        """
+        if self.output is not None:
+            return self.output
+        try:
+            self.workbook.close()
+            if self.path is not None:
+                self.output = self.path
+            else:
+                with open(self._target, "rb") as f:
+                    self.output = BytesIO(f.read())
+        finally:
+            if self.path is None:
+                os.remove(self._target)
+        return self.output
+
+    def __enter__(self) -> "ExcelReport":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def export_tables(sheets: Mapping[str, pd.DataFrame], path: Optional[str] = None,
+                  num_formats: Optional[Mapping[str, str]] = None) -> Union[BytesIO, str]:
+    """
+    여러 표를 시트별로 내보냅니다 (일괄 계산 리포트 등).
+
+    Args:
+        sheets: {시트 이름: DataFrame}
+        path: 저장 경로 (None이면 BytesIO 반환)
+        num_formats: {컬럼 이름: 표시 형식} (모든 시트 공통)
+
+    Returns:
+        BytesIO 또는 저장 경로
+    """
+    with ExcelReport(path) as report:
+        for name, df in sheets.items():
+            widths = {str(c): max(10, min(40, len(str(c)) + 4)) for c in df.columns}
+            report.add_sheet(name).table(df, num_formats=num_formats, widths=widths)
+    return report.output
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/fx_matrix.py - 통화 교차환율 행렬
+================================================================================
+KRW, USD, 주요 통화와 모든 산지 통화(get_coffee_origins()의 currency)의
+N×N 교차환율을 한 번에 만들어 두고, 금액 변환은 배열 인덱스 조회로 처리합니다.
+행이 수천 개여도 통화 코드 → 위치 변환 1번, 곱셈 1번이면 끝납니다.
+
+- 원천 데이터는 "통화 1단위당 원화" 벡터 1개 (krw_per_unit)
+- matrix[i, j] = i통화 1단위가 j통화로 얼마인지 = krw[i] / krw[j]
+- 조회는 utils/api_helpers.py의 get_fx_matrix()가 담당합니다
+  (exchangerate-api 1회 또는 Yahoo 배치 시세 1회, 공용 캐시)
+
+💡 팁:
+- 수동 환율(USD/KRW)을 쓸 때는 rebased(usd_krw)로 원화 기준만 바꿉니다.
+- 행렬에 없는 통화는 NaN으로 변환됩니다.
+================================================================================
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Mapping, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class FxMatrix:
+    """통화별 원화 환율 벡터와 교차환율 행렬"""
+    currencies: Tuple[str, ...]
+    krw_per_unit: np.ndarray        # currencies 순서, 통화 1단위당 원화 (없으면 NaN)
+
+    @classmethod
+    def from_usd_rates(cls, currencies: Sequence[str], usd_rates: Mapping[str, float],
+                       usd_krw: float) -> "FxMatrix":
+        """
+        USD 기준 환율표(1 USD당 각 통화)로 행렬을 만듭니다.
+
+        Args:
+            currencies: 행렬에 넣을 통화 코드
+            usd_rates: {통화: 1 USD당 금액} (exchangerate-api conversion_rates 형식)
+            usd_krw: USD/KRW 환율
+        """
+        codes = tuple(dict.fromkeys(["KRW", "USD", *currencies]))
+        per_usd = np.array([{"USD": 1.0, "KRW": usd_krw}.get(c, usd_rates.get(c, np.nan)) or np.nan
+                            for c in codes], dtype=float)
+        return cls(codes, usd_krw / per_usd)
+
+    # ===========================================
+    # 1. 조회
+    # ===========================================
+    @property
+    def matrix(self) -> pd.DataFrame:
+        """교차환율 행렬 (행 통화 1단위 = 열 통화 금액)"""
+        krw = self.krw_per_unit
+        return pd.DataFrame(krw[:, None] / krw[None, :], index=self.currencies, columns=self.currencies)
+
+    def positions(self, codes) -> np.ndarray:
+        """통화 코드 배열 → 행렬 위치 배열 (없는 통화는 -1)"""
+        return pd.Index(self.currencies).get_indexer(np.asarray(codes, dtype=object).ravel())
+
+    def krw_for(self, codes) -> np.ndarray:
+        """통화 코드 배열 → 1단위당 원화 배열 (없는 통화는 NaN)"""
+        lookup = np.append(self.krw_per_unit, np.nan)    # 위치 -1 → 마지막 NaN
+        return lookup[self.positions(codes)]
+
+    def rate(self, source: str, target: str = "KRW") -> float:
+        """source 1단위가 target으로 얼마인지"""
+        krw = self.krw_for([source, target])
+        return float(krw[0] / krw[1])
+
+    def convert(self, amounts, source, target="KRW") -> np.ndarray:
+        """
+        금액 배열을 한 번에 변환합니다.
+
+        Args:
+            amounts: 금액 (배열 또는 스칼라)
+            source: 원래 통화 (배열 또는 코드 1개)
+            target: 바꿀 통화 (배열 또는 코드 1개)
+        """
+        source_krw = self.krw_for(np.atleast_1d(source))
+        target_krw = self.krw_for(np.atleast_1d(target))
+        return np.asarray(amounts, dtype=float) * source_krw / target_krw
+
+    def krw_rates(self) -> Dict[str, float]:
+        """{통화: 원/1단위} (값이 있는 통화만)"""
+        return {c: float(v) for c, v in zip(self.currencies, self.krw_per_unit) if np.isfinite(v)}
+
+    # ===========================================
+    # 2. 변형
+    # ===========================================
+    def rebased(self, usd_krw: float) -> "FxMatrix":
+        """USD/KRW만 바꾼 행렬 (외화 간 교차환율은 그대로, 수동 환율 적용용)"""
+        current = self.krw_for(["USD"])[0]
+        if not usd_krw or not np.isfinite(current) or usd_krw == current:
+            return self
+        scaled = self.krw_per_unit * (usd_krw / current)
+        scaled[self.currencies.index("KRW")] = 1.0
+        return FxMatrix(self.currencies, scaled)
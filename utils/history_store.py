@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/history_store.py - 일별 시세/환율 히스토리 로컬 저장소
+================================================================================
+Yahoo Finance 일별 OHLC 데이터를 data/market_history.sqlite에 저장해두고,
+갱신 시에는 마지막 저장일 이후의 데이터만 받아 덧붙입니다.
+1y/5y/10y/max 기간은 로컬에서 잘라서 반환합니다.
+
+💡 팁:
+- 저장 위치는 config.py의 HISTORY_DB_PATH에서 바꿀 수 있습니다.
+- 증분 갱신 주기는 CACHE_TTL["history_sync"]로 조정합니다.
+- 파일을 지우면 다음 조회 시 전체 기간을 다시 내려받습니다.
+================================================================================
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from config import HISTORY_DB_PATH
+from .market_cache import market_cache, make_key
+from .replay import replay_call
+
+
+# 기간 코드 → 잘라낼 기간 (None = 전체)
+PERIOD_OFFSETS = {
+    "1y": pd.DateOffset(years=1),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+    "max": None,
+}
+
+# 증분 갱신 시 마지막 저장일보다 며칠 앞에서부터 다시 받음 (미확정 종가 보정용)
+OVERLAP_DAYS = 5
+
+OHLC_COLUMNS = ["open", "high", "low", "close"]
+
+
+class HistoryStore:
+    """티커별 일별 OHLC를 SQLite에 보관하는 저장소"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    # ===========================================
+    # 1. 저장소 기본 동작
+    # ===========================================
+    def _connect(self) -> sqlite3.Connection:
+        """
+        새 연결을 엽니다. 호출하는 쪽에서 closing()으로 닫아야 합니다
+        (sqlite3 연결의 with 문은 커밋/롤백만 하고 연결을 닫지 않음).
+        """
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ohlc (
+                    ticker TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    open REAL, high REAL, low REAL, close REAL,
+                    PRIMARY KEY (ticker, date)
+                )
+            """)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def last_date(self, ticker: str) -> Optional[pd.Timestamp]:
+        """티커의 마지막 저장일 (없으면 None)"""
+        return self.last_dates([ticker]).get(ticker)
+
+    def last_dates(self, tickers: Iterable[str]) -> Dict[str, pd.Timestamp]:
+        """티커별 마지막 저장일 (저장된 티커만, 쿼리 1번)"""
+        tickers = list(tickers)
+        if not tickers:
+            return {}
+        placeholders = ", ".join("?" * len(tickers))
+        with closing(self._connect()) as conn:
+            rows = conn.execute(f"SELECT ticker, MAX(date) FROM ohlc WHERE ticker IN ({placeholders}) "
+                                "GROUP BY ticker", tickers).fetchall()
+        return {ticker: pd.Timestamp(last) for ticker, last in rows if last}
+
+    def upsert(self, ticker: str, frame: pd.DataFrame):
+        """
+        OHLC 데이터를 저장합니다 (같은 날짜는 덮어씀).
+
+        Args:
+            ticker: 티커
+            frame: 날짜 인덱스 + open/high/low/close 컬럼
+        """
+        frame = frame.dropna(subset=["close"])
+        if frame.empty:
+            return
+        rows = [
+            (ticker, idx.strftime("%Y-%m-%d"), *(None if pd.isna(v) else float(v) for v in values))
+            for idx, values in zip(frame.index, frame[OHLC_COLUMNS].itertuples(index=False))
+        ]
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO ohlc VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def load(self, ticker: str, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """
+        저장된 OHLC를 읽습니다.
+
+        Args:
+            ticker: 티커
+            start: 시작일 (None이면 전체)
+
+        Returns:
+            pd.DataFrame: 날짜 인덱스 + open/high/low/close 컬럼
+        """
+        query = "SELECT date, open, high, low, close FROM ohlc WHERE ticker = ?"
+        params = [ticker]
+        if start is not None:
+            query += " AND date >= ?"
+            params.append(start.strftime("%Y-%m-%d"))
+        query += " ORDER BY date"
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(query, conn, params=params, parse_dates=["date"])
+        return df.set_index("date")
+
+    # ===========================================
+    # 2. 증분 갱신
+    # ===========================================
+    def sync(self, tickers: Iterable[str]) -> int:
+        """
+        저장소를 최신 상태로 맞춥니다.
+        처음 보는 티커는 전체 기간을, 기존 티커는 각자의 마지막 저장일 이후만 받습니다.
+        마지막 저장일이 같은 티커끼리 묶어 그룹마다 한 번의 Yahoo 요청으로 처리합니다
+        (상장폐지 등으로 멈춘 티커 하나 때문에 다른 티커가 긴 구간을 다시 받지 않음).
+
+        Args:
+            tickers: 갱신할 티커 목록
+
+        Returns:
+            int: 저장한 행 수
+        """
+        tickers = list(tickers)
+        known = self.last_dates(tickers)
+        new_tickers = [ticker for ticker in tickers if ticker not in known]
+        groups: Dict[pd.Timestamp, list] = {}
+        for ticker, last in known.items():
+            groups.setdefault(last, []).append(ticker)
+
+        saved = 0
+        if new_tickers:
+            saved += self._download_and_store(new_tickers, period="max")
+        for last, group in groups.items():
+            start = last - pd.Timedelta(days=OVERLAP_DAYS)
+            saved += self._download_and_store(group, start=start.strftime("%Y-%m-%d"))
+        return saved
+
+    def _download_and_store(self, tickers: list, **range_kwargs) -> int:
+        raw = replay_call(
+            "yahoo", {"fn": "download_ohlc", "tickers": tickers, **range_kwargs},
+            lambda: yf.download(tickers, interval="1d", group_by="ticker", auto_adjust=False,
+                                progress=False, threads=True, **range_kwargs)
+        )
+        if raw.empty:
+            return 0
+
+        saved = 0
+        for ticker in tickers:
+            if isinstance(raw.columns, pd.MultiIndex):
+                if ticker not in raw.columns.get_level_values(0):
+                    continue
+                frame = raw[ticker]
+            else:
+                frame = raw
+            frame = frame.rename(columns=str.lower)
+            if not set(OHLC_COLUMNS).issubset(frame.columns):
+                continue
+            if frame.index.tz is not None:
+                frame.index = frame.index.tz_localize(None)
+            self.upsert(ticker, frame)
+            saved += int(frame['close'].notna().sum())
+        return saved
+
+
+# ===========================================
+# 3. 서버 공용 인스턴스 및 조회 함수
+# ===========================================
+os.makedirs(os.path.dirname(HISTORY_DB_PATH), exist_ok=True)
+history_store = HistoryStore(HISTORY_DB_PATH)
+
+
+def sync_history(tickers: Iterable[str], force: bool = False) -> int:
+    """
+    티커 묶음을 증분 갱신합니다 (CACHE_TTL["history_sync"] 주기로 최대 1회).
+
+    Args:
+        tickers: 갱신할 티커 목록
+        force: True면 주기와 무관하게 바로 갱신
+
+    Returns:
+        int: 이번 호출에서 저장한 행 수 (주기 내 재호출이면 직전 값)
+    """
+    tickers = tuple(sorted(tickers))
+    return market_cache.get_or_fetch(
+        "history_sync", make_key(tickers=tickers), lambda: history_store.sync(tickers), force=force
+    )
+
+
+def get_stored_history(ticker: str, period: str, sync_tickers: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    로컬 저장소에서 기간별 일별 OHLC를 반환합니다.
+
+    Args:
+        ticker: 티커
+        period: 기간 ("1y", "5y", "10y", "max")
+        sync_tickers: 함께 갱신할 티커 묶음 (None이면 해당 티커만)
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스 + open/high/low/close (데이터가 없으면 ValueError 발생)
+    """
+    try:
+        sync_history(sync_tickers or [ticker])
+    except Exception:
+        # 갱신 실패 시 저장된 데이터로 계속 진행
+        pass
+
+    offset = PERIOD_OFFSETS.get(period)
+    start = pd.Timestamp.today().normalize() - offset if offset is not None else None
+    df = history_store.load(ticker, start)
+    if df.empty:
+        raise ValueError(f"{ticker} 히스토리 없음")
+    return df
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/http_client.py - 공용 HTTP 클라이언트
+================================================================================
+모든 외부 API 호출(환율, 날씨, 네이버 뉴스)이 함께 쓰는 requests.Session 기반
+클라이언트입니다.
+
+- Keep-Alive 연결 풀: 호스트별 TCP/TLS 연결을 재사용
+- 호스트별 타임아웃: config.py의 HTTP_TIMEOUTS
+- 재시도: 연결 오류/5xx/429에 대해 지수 백오프 + 지터로 최대 HTTP_MAX_RETRIES회
+- 서킷 브레이커: 호스트가 연속으로 실패하면 CIRCUIT_RESET_SEC 동안 즉시 실패 처리
+- 녹화/재생: API_REPLAY_MODE에 따라 응답을 카세트에 저장하거나 재생 (utils/replay.py)
+
+💡 사용 예시:
+    from utils.http_client import http_get
+    res = http_get(url, params={...}, headers={...})
+================================================================================
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import (
+    HTTP_TIMEOUTS, HTTP_DEFAULT_TIMEOUT, HTTP_MAX_RETRIES, HTTP_BACKOFF_BASE,
+    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_SEC
+)
+from .replay import replay_call
+
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(requests.RequestException):
+    """서킷 브레이커가 열려 있어 호출하지 않고 바로 실패한 경우"""
+
+
+def _dump_response(response: requests.Response) -> dict:
+    """카세트 저장용: 응답에서 상태 코드/헤더/본문만 남김"""
+    return {
+        "status_code": response.status_code,
+        "headers": dict(response.headers),
+        "content": response.content,
+        "encoding": response.encoding,
+    }
+
+
+def _load_response(data: dict) -> requests.Response:
+    """카세트 재생용: 저장된 값으로 응답 객체를 다시 만듦"""
+    response = requests.Response()
+    response.status_code = data["status_code"]
+    response.headers.update(data["headers"])
+    response._content = data["content"]
+    response.encoding = data["encoding"]
+    return response
+
+
+# ===========================================
+# 1. 서킷 브레이커
+# ===========================================
+class CircuitBreaker:
+    """호스트 하나의 연속 실패를 추적하는 서킷 브레이커"""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        호출을 허용할지 판단합니다.
+        차단 시간이 지나면 한 번의 시험 호출(half-open)을 허용합니다.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.time() - self.opened_at >= self.reset_timeout:
+                # 시험 호출 동안 다른 요청은 계속 차단
+                self.opened_at = time.time()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.time()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self.opened_at is not None
+
+
+# ===========================================
+# 2. HTTP 클라이언트
+# ===========================================
+class HttpClient:
+    """연결 풀, 재시도, 서킷 브레이커를 갖춘 공용 HTTP 클라이언트"""
+
+    def __init__(self, pool_maxsize: int = 32):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """호스트별 서킷 브레이커를 반환합니다."""
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_SEC)
+            return self._breakers[host]
+
+    def get(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+            timeout=None, retries: int = HTTP_MAX_RETRIES) -> requests.Response:
+        """
+        GET 요청을 보냅니다.
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            headers: 요청 헤더
+            timeout: (연결, 응답) 타임아웃 (None이면 호스트별 설정)
+            retries: 추가 재시도 횟수
+
+        Returns:
+            requests.Response (4xx 응답은 재시도 없이 그대로 반환)
+
+        Raises:
+            CircuitOpenError: 호스트가 차단된 상태
+            requests.RequestException: 재시도 후에도 실패한 경우
+        """
+        host = urlparse(url).hostname or ""
+        breaker = self.breaker(host)
+        if not breaker.allow():
+            raise CircuitOpenError(f"{host} 일시 차단 중 (연속 실패)")
+
+        timeout = timeout or HTTP_TIMEOUTS.get(host, HTTP_DEFAULT_TIMEOUT)
+        last_error: Optional[Exception] = None
+        for attempt in range(retries + 1):
+            try:
+                # 헤더(인증값 포함)는 카세트 키에서 제외
+                response = replay_call(
+                    "http", {"url": url, "params": params},
+                    lambda: self.session.get(url, params=params, headers=headers, timeout=timeout),
+                    dump=_dump_response, load=_load_response
+                )
+                if response.status_code not in RETRY_STATUS:
+                    breaker.record_success()
+                    return response
+                last_error = requests.HTTPError(f"HTTP {response.status_code}", response=response)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                last_error = e
+            if attempt < retries:
+                time.sleep(HTTP_BACKOFF_BASE * (2 ** attempt) * (0.5 + random.random()))
+
+        breaker.record_failure()
+        if isinstance(last_error, requests.HTTPError):
+            # 5xx/429 응답은 호출자가 상태 코드를 확인할 수 있도록 응답 그대로 반환
+            return last_error.response
+        raise last_error
+
+
+# ===========================================
+# 3. 서버 공용 인스턴스
+# ===========================================
+http_client = HttpClient()
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """공용 클라이언트로 GET 요청을 보냅니다 (인자는 HttpClient.get과 동일)."""
+    return http_client.get(url, **kwargs)
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/indicators.py - 기술적 지표 (증분 계산)
+================================================================================
+이동평균, 볼린저 밴드, Z-점수, RSI, 변동성을 "새 시세 1개 → O(1) 갱신"
+방식으로 계산합니다. 창(window)마다 합계/편차 상태를 들고 있어서
+새 값이 들어오면 빠지는 값만 빼고 들어오는 값만 더합니다.
+
+- RollingWindow: 고정 길이 창의 평균/표준편차 (Welford 방식, O(1))
+- WilderRSI: Wilder 평활 RSI (O(1))
+- IndicatorState: 시리즈 하나의 전체 지표 묶음
+- indicator_book: (지표 키)별 상태 보관소. 같은 시리즈를 다시 넘기면
+  마지막 시점 이후의 새 값만 반영합니다 (rerun마다 전체 재계산하지 않음).
+
+💡 팁:
+- 창 길이는 config.py의 INDICATOR_WINDOWS에서 조정합니다.
+- 결과 컬럼: sma_short, sma_long, bb_upper, bb_lower, zscore, rsi, volatility
+================================================================================
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Dict, Hashable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import INDICATOR_WINDOWS
+
+
+INDICATOR_COLUMNS = ("sma_short", "sma_long", "bb_upper", "bb_lower", "zscore", "rsi", "volatility")
+
+
+# ===========================================
+# 1. 창 상태
+# ===========================================
+class RollingWindow:
+    """
+    고정 길이 창의 평균과 표본 표준편차를 O(1)로 갱신합니다.
+
+    Args:
+        size: 창 길이
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values = deque()
+        self.mean = 0.0
+        self._m2 = 0.0      # 편차 제곱합
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.size
+
+    def push(self, value: float):
+        """값 하나를 넣습니다 (창이 차 있으면 가장 오래된 값이 빠짐)."""
+        if self.full:
+            old = self.values.popleft()
+            self.values.append(value)
+            old_mean = self.mean
+            self.mean += (value - old) / self.size
+            self._m2 += (value - old) * (value - self.mean + old - old_mean)
+        else:
+            self.values.append(value)
+            delta = value - self.mean
+            self.mean += delta / len(self.values)
+            self._m2 += delta * (value - self.mean)
+
+    @property
+    def std(self) -> float:
+        n = len(self.values)
+        return math.sqrt(max(self._m2, 0.0) / (n - 1)) if n > 1 else math.nan
+
+
+class WilderRSI:
+    """
+    Wilder 평활 RSI (첫 period개는 단순 평균, 이후 지수 평활)
+
+    Args:
+        period: RSI 기간
+    """
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.prev = None
+        self.count = 0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+
+    def push(self, price: float) -> float:
+        """가격 하나를 넣고 RSI(0~100)를 반환합니다 (기간이 차기 전에는 NaN)."""
+        if self.prev is None:
+            self.prev = price
+            return math.nan
+        change = price - self.prev
+        self.prev = price
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+
+        self.count += 1
+        if self.count <= self.period:
+            self.avg_gain += gain / self.period
+            self.avg_loss += loss / self.period
+            if self.count < self.period:
+                return math.nan
+        else:
+            self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+
+        if self.avg_loss == 0:
+            return 100.0 if self.avg_gain > 0 else 50.0
+        return 100 - 100 / (1 + self.avg_gain / self.avg_loss)
+
+
+# ===========================================
+# 2. 시리즈 하나의 지표 묶음
+# ===========================================
+class IndicatorState:
+    """
+    시리즈 하나의 기술적 지표 상태
+
+    Args:
+        windows: {sma_short, sma_long, bollinger_k, rsi, volatility} (기본: config.INDICATOR_WINDOWS)
+    """
+
+    def __init__(self, windows: Optional[Dict] = None):
+        windows = {**INDICATOR_WINDOWS, **(windows or {})}
+        self.k = windows["bollinger_k"]
+        self.short = RollingWindow(windows["sma_short"])
+        self.long = RollingWindow(windows["sma_long"])
+        self.returns = RollingWindow(windows["volatility"])
+        self.rsi = WilderRSI(windows["rsi"])
+        self.prev = None
+        self.last_index = None
+        self._index: List = []
+        self._rows: List[tuple] = []
+        self._frame: Optional[pd.DataFrame] = None
+
+    def update(self, index: Hashable, price: float) -> Dict[str, float]:
+        """
+        새 시세 하나를 반영합니다 (O(1)).
+
+        Args:
+            index: 시점 (날짜 등)
+            price: 가격
+
+        Returns:
+            dict: 이 시점의 지표 값 (창이 차기 전인 지표는 NaN)
+        """
+        self.short.push(price)
+        self.long.push(price)
+        if self.prev is not None:
+            self.returns.push((price / self.prev - 1) * 100)
+        self.prev = price
+        rsi = self.rsi.push(price)
+
+        mean, std = self.short.mean, self.short.std
+        if self.short.full:
+            row = (mean, self.long.mean if self.long.full else math.nan,
+                   mean + self.k * std, mean - self.k * std,
+                   (price - mean) / std if std > 0 else 0.0)
+        else:
+            row = (math.nan,) * 5
+        row += (rsi, self.returns.std if self.returns.full else math.nan)
+
+        self.last_index = index
+        self._index.append(index)
+        self._rows.append(row)
+        self._frame = None
+        return dict(zip(INDICATOR_COLUMNS, row))
+
+    def latest(self) -> Dict[str, float]:
+        """마지막 시점의 지표 값"""
+        if not self._rows:
+            return dict.fromkeys(INDICATOR_COLUMNS, math.nan)
+        return dict(zip(INDICATOR_COLUMNS, self._rows[-1]))
+
+    def frame(self) -> pd.DataFrame:
+        """지금까지의 지표 표 (새 값이 들어오기 전까지 재사용)"""
+        if self._frame is None:
+            self._frame = pd.DataFrame(self._rows, index=pd.Index(self._index),
+                                       columns=list(INDICATOR_COLUMNS))
+        return self._frame
+
+
+def compute_indicators(series: pd.Series, windows: Optional[Dict] = None) -> pd.DataFrame:
+    """
+    시리즈 전체의 지표 표를 한 번에 계산합니다 (상태를 보관하지 않는 일회성 계산).
+
+    Args:
+        series: 가격 시리즈 (오래된 순)
+        windows: 창 길이 덮어쓰기
+
+    Returns:
+        pd.DataFrame: series와 같은 인덱스 + 지표 컬럼
+    """
+    state = IndicatorState(windows)
+    for index, price in series.dropna().items():
+        state.update(index, float(price))
+    return state.frame().reindex(series.index)
+
+
+# ===========================================
+# 3. 지표 상태 보관소
+# ===========================================
+class IndicatorBook:
+    """
+    (지표 키)별 IndicatorState 보관소
+
+    같은 키로 시리즈를 다시 넘기면 이미 반영한 마지막 시점 이후의 값만
+    갱신합니다. 결과가 프로세스 이력과 무관하게 compute_indicators(series)와
+    같도록, 시작 시점이 같은 시리즈만 이어서 계산하고 시작 시점이 바뀌거나
+    (이동 창, 과거 확장) 과거 값이 수정되면 새로 만듭니다.
+    """
+
+    def __init__(self):
+        self._states: Dict[Hashable, IndicatorState] = {}
+        self._lock = threading.Lock()
+
+    def _state_for(self, key: Hashable, series: pd.Series) -> IndicatorState:
+        state = self._states.get(key)
+        if state is None or state.last_index is None:
+            return IndicatorState()
+        # 이어지는 시리즈인지: 시작 시점이 같고, 마지막 반영 시점의 값이 그대로인지
+        if not state._index or series.index[0] != state._index[0] or state.last_index not in series.index:
+            return IndicatorState()
+        if series.loc[state.last_index] != state.prev:
+            return IndicatorState()
+        return state
+
+    def sync(self, key: Hashable, series: pd.Series) -> pd.DataFrame:
+        """
+        시리즈의 새 값만 반영하고 지표 표를 반환합니다.
+
+        Args:
+            key: 지표 키 (예: "arabica", "tab1:arabica:1M")
+            series: 가격 시리즈 (오래된 순, 시점 중복 없음)
+
+        Returns:
+            pd.DataFrame: series와 같은 인덱스 + 지표 컬럼
+        """
+        series = series.dropna()
+        if series.empty:
+            return pd.DataFrame(columns=list(INDICATOR_COLUMNS), dtype=float)
+
+        with self._lock:
+            state = self._state_for(key, series)
+            new = series if state.last_index is None else series.loc[series.index > state.last_index]
+            for index, price in new.items():
+                state.update(index, float(price))
+            self._states[key] = state
+            frame = state.frame()
+        return frame if len(frame) == len(series) else frame.reindex(series.index)
+
+    def latest(self, key: Hashable) -> Dict[str, float]:
+        """키의 마지막 지표 값 (상태가 없으면 모두 NaN)"""
+        with self._lock:
+            state = self._states.get(key)
+            return state.latest() if state else dict.fromkeys(INDICATOR_COLUMNS, math.nan)
+
+    def clear(self):
+        with self._lock:
+            self._states.clear()
+
+
+indicator_book = IndicatorBook()
+
+
+def indicator_features(prices: pd.DataFrame, instruments=None,
+                       key: Optional[Hashable] = None) -> Dict[str, np.ndarray]:
+    """
+    시그널 엔진용 지표 특성 배열 (<지표>_rsi, <지표>_zscore)
+
+    Args:
+        prices: 날짜 인덱스 + 지표 키 컬럼
+        instruments: 지표를 계산할 컬럼 (기본: 모든 컬럼)
+        key: indicator_book 키 접두어 (None이면 상태를 보관하지 않고 한 번 계산)
+
+    Returns:
+        dict: {특성 이름: prices 길이의 배열}
+    """
+    features = {}
+    for name in instruments or prices.columns:
+        if name not in prices.columns:
+            continue
+        if key is None:
+            frame = compute_indicators(prices[name])
+        else:
+            frame = indicator_book.sync((key, name), prices[name]).reindex(prices.index)
+        features[f"{name}_rsi"] = frame["rsi"].to_numpy()
+        features[f"{name}_zscore"] = frame["zscore"].to_numpy()
+    return features
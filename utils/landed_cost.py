@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/landed_cost.py - 수입 원가 계산 엔진 (단건 / CSV 일괄)
+================================================================================
+인코텀즈(EXW/FOB/CFR/CIF/DDP)별 과세가격(CIF), 관세, 부가세, 총 필요 자금(원)을
+계산합니다. 단건 계산도 같은 벡터 연산을 1행으로 실행하므로
+원가 계산기 화면과 일괄 계산 결과가 항상 같은 규칙을 따릅니다.
+
+- 물품대금/운임: 행별 통화(currency) 기준 → 원화 환산 (교차환율 행렬 배열 조회)
+- 보험료/국내비용: 원화 그대로 합산
+- EXW/FOB만 운임을, EXW/FOB/CFR만 보험료를 따로 더함 (나머지는 물품대금에 포함)
+- DDP는 판매자가 관세/부가세를 부담하므로 물품대금 + 국내비용만 계산
+
+- 관세율(duty_rate)이 빈 행은 관세율 색인(utils/tariff_index.py)에서
+  원산지(origin) × HS 코드(hs_code) × 수입일(import_date)로 한 번에 조회
+
+💡 팁:
+- CSV 필수 컬럼: incoterm, price
+  선택 컬럼: freight, insurance, duty_rate(%), local_cost, currency(기본 USD),
+            origin, hs_code(기본 0901.11), import_date(기본 오늘)
+- 인코텀즈, 통화, 수입일이 잘못되었거나 관세율을 찾지 못한 행은
+  error 컬럼에 사유를 적고 금액은 비워둡니다 (합계에서 제외).
+================================================================================
+"""
+
+from typing import BinaryIO, Dict, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .fx_matrix import FxMatrix
+from .tariff_index import TariffIndex, parse_dates
+
+
+INCOTERMS = ("EXW", "FOB", "CFR", "CIF", "DDP")
+VAT_RATE = 0.1
+
+REQUIRED_COLUMNS = ("incoterm", "price")
+OPTIONAL_COLUMNS = {
+    "freight": 0.0,
+    "insurance": 0.0,
+    "duty_rate": np.nan,        # 비어 있으면 관세율 색인에서 조회
+    "local_cost": 0.0,
+    "currency": "USD",
+    "origin": "",
+    "hs_code": "0901.11",
+    "import_date": "",
+}
+
+AMOUNT_COLUMNS = [
+    "price_krw", "freight_krw", "insurance_krw", "cif_krw",
+    "duty_krw", "vat_krw", "local_cost_krw", "total_krw",
+]
+RESULT_COLUMNS = ["fx_rate", *AMOUNT_COLUMNS, "duty_source", "error"]
+
+# 업로드용 예시 파일
+SHIPMENT_TEMPLATE = pd.DataFrame({
+    "shipment_id": ["BR-2401", "CO-2402", "ET-2403"],
+    "incoterm": ["FOB", "CIF", "DDP"],
+    "price": [52000.0, 61000.0, 48000.0],
+    "freight": [3200.0, 0.0, 0.0],
+    "insurance": [450000, 0, 0],
+    "duty_rate": [np.nan, 0.0, 0.0],
+    "local_cost": [1200000, 950000, 800000],
+    "currency": ["USD", "USD", "USD"],
+    "origin": ["브라질", "콜롬비아", "에티오피아"],
+    "hs_code": ["0901.11", "0901.11", "0901.11"],
+})
+
+
+# ===========================================
+# 1. 입력 정리
+# ===========================================
+def _clean_text(column: pd.Series, default: str, transform=None) -> np.ndarray:
+    """문자열 컬럼 정리 (앞뒤 공백 제거 + 변환을 고유값에만 적용한 뒤 펼침)"""
+    codes, uniques = pd.factorize(column)
+    cleaned = [str(v).strip() for v in uniques]
+    if transform is not None:
+        cleaned = [transform(v) for v in cleaned]
+    # 빈 값(NaN)은 factorize 코드가 -1 → 마지막 자리의 기본값
+    return np.array(cleaned + [default], dtype=object)[codes]
+
+
+def normalize_shipments(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    선적 표의 컬럼 이름/기본값/자료형을 정리합니다.
+
+    Args:
+        df: 선적 표 (컬럼 이름은 대소문자, 앞뒤 공백 무관)
+
+    Returns:
+        pd.DataFrame: 정리된 복사본
+
+    Raises:
+        ValueError: 필수 컬럼이 없는 경우
+    """
+    df = df.rename(columns=lambda c: str(c).strip().lower())
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"필수 컬럼 없음: {', '.join(missing)}")
+
+    df = df.copy()
+    for column, default in OPTIONAL_COLUMNS.items():
+        if column not in df.columns:
+            df[column] = default
+    # "FOB (본선인도)"처럼 설명이 붙어 있어도 첫 단어만 사용
+    df["incoterm"] = _clean_text(df["incoterm"], "", lambda v: (v.split() or [""])[0].upper())
+    df["currency"] = _clean_text(df["currency"], "USD", str.upper)
+    df["origin"] = _clean_text(df["origin"], "")
+    df["hs_code"] = _clean_text(df["hs_code"], OPTIONAL_COLUMNS["hs_code"])
+    df["import_date"] = _clean_text(df["import_date"], "")
+    for column in ("price", "freight", "insurance", "duty_rate", "local_cost"):
+        df[column] = pd.to_numeric(df[column], errors="coerce")
+    # duty_rate는 빈 값으로 남겨 관세율 색인 조회 대상으로 둠
+    df[["freight", "insurance", "local_cost"]] = df[["freight", "insurance", "local_cost"]].fillna(0.0)
+    return df
+
+
+def read_shipments_csv(source: Union[str, BinaryIO]) -> pd.DataFrame:
+    """CSV 파일(경로 또는 업로드 파일)을 읽어 정리합니다 (엑셀에서 저장한 BOM 포함 UTF-8 지원)."""
+    # hs_code "0901.11"이 실수 901.11로 읽히지 않도록 문자열로 읽음
+    return normalize_shipments(pd.read_csv(source, encoding="utf-8-sig",
+                                           dtype={"hs_code": str, "import_date": str}))
+
+
+# ===========================================
+# 2. 일괄 계산 (벡터 연산)
+# ===========================================
+def cost_chain(incoterm, price_krw, freight_krw, insurance_krw, duty_rate, local_cost) -> Dict[str, np.ndarray]:
+    """
+    CIF → 관세 → 부가세 → 총액 계산 (모든 인자는 같은 모양으로 브로드캐스트되는 배열/스칼라)
+
+    Args:
+        incoterm: 인코텀즈 코드 (배열 또는 문자열 1개)
+        price_krw: 물품대금 (원)
+        freight_krw: 국제운송비 (원, EXW/FOB만 더함)
+        insurance_krw: 보험료 (원, EXW/FOB/CFR만 더함)
+        duty_rate: 관세율 (%)
+        local_cost: 국내 발생비용 (원)
+
+    Returns:
+        dict: price_krw, freight_krw, insurance_krw, cif_krw, duty_krw, vat_krw,
+              local_cost_krw, total_krw 배열
+    """
+    incoterm = np.asarray(incoterm)
+    # 인코텀즈별로 따로 더하는 비용
+    add_freight = np.isin(incoterm, ("EXW", "FOB"))
+    add_insurance = np.isin(incoterm, ("EXW", "FOB", "CFR"))
+    is_ddp = incoterm == "DDP"
+
+    freight_krw = np.where(add_freight, freight_krw, 0.0)
+    insurance_krw = np.where(add_insurance, insurance_krw, 0.0)
+    cif_krw = np.where(is_ddp, price_krw, price_krw + freight_krw + insurance_krw)
+    duty_krw = np.where(is_ddp, 0.0, cif_krw * np.divide(duty_rate, 100))
+    # 관세율 0%(FTA 등)인 경우 부가세도 계산하지 않음 (기존 계산기 규칙)
+    vat_krw = np.where(is_ddp | (np.asarray(duty_rate) == 0), 0.0, (cif_krw + duty_krw) * VAT_RATE)
+    return {
+        "price_krw": price_krw,
+        "freight_krw": freight_krw,
+        "insurance_krw": insurance_krw,
+        "cif_krw": cif_krw,
+        "duty_krw": duty_krw,
+        "vat_krw": vat_krw,
+        "local_cost_krw": local_cost,
+        "total_krw": cif_krw + duty_krw + vat_krw + local_cost,
+    }
+
+
+def resolve_duty_rates(df: pd.DataFrame, tariffs: Optional[TariffIndex] = None):
+    """
+    빈 관세율을 관세율 색인으로 채웁니다.
+
+    Args:
+        df: normalize_shipments() 결과
+        tariffs: 관세율 색인 (None이면 빈 관세율은 0%)
+
+    Returns:
+        tuple: (관세율 배열 [찾지 못하면 NaN], 출처 배열 ['입력' / '관세율표' / '미확인'])
+    """
+    duty = df["duty_rate"].to_numpy(dtype=float, copy=True)
+    missing = np.isnan(duty)
+    if tariffs is not None and missing.any():
+        rows = df.loc[missing]
+        duty[missing] = tariffs.duty_rates(rows["origin"].to_numpy(), rows["hs_code"].to_numpy(),
+                                           rows["import_date"].to_numpy())
+    source = np.where(~missing, "입력", np.where(np.isnan(duty), "미확인", "관세율표"))
+    return duty, source
+
+
+def calculate_landed_costs(shipments: pd.DataFrame,
+                           krw_rates: Union[FxMatrix, Mapping[str, float]],
+                           tariffs: Optional[TariffIndex] = None) -> pd.DataFrame:
+    """
+    모든 선적의 원가를 한 번에 계산합니다 (행 반복 없음).
+
+    Args:
+        shipments: 선적 표 (normalize_shipments() 전이어도 됨)
+        krw_rates: 교차환율 행렬(get_fx_matrix()) 또는 {통화: 원/1단위} (예: {"USD": 1380.0})
+        tariffs: 관세율 색인 (get_tariff_index(), 빈 duty_rate 조회용)
+
+    Returns:
+        pd.DataFrame: 입력 컬럼 + RESULT_COLUMNS
+    """
+    df = normalize_shipments(shipments)
+    duty_rate, duty_source = resolve_duty_rates(df, tariffs)
+    df["duty_rate"] = duty_rate
+    incoterm = df["incoterm"].to_numpy()
+    if isinstance(krw_rates, FxMatrix):
+        fx = krw_rates.krw_for(df["currency"].to_numpy())
+    else:
+        fx = df["currency"].map(krw_rates).to_numpy(dtype=float)
+    price = df["price"].to_numpy(dtype=float)
+
+    costs = cost_chain(
+        incoterm,
+        price_krw=price * fx,
+        freight_krw=df["freight"].to_numpy(dtype=float) * fx,
+        insurance_krw=df["insurance"].to_numpy(dtype=float),
+        duty_rate=np.nan_to_num(duty_rate, nan=0.0),
+        local_cost=df["local_cost"].to_numpy(dtype=float),
+    )
+
+    # 잘못된 행은 사유를 남기고 금액을 비움
+    error = np.full(len(df), "", dtype=object)
+    error[np.isnan(price)] = "price 값 오류"
+    # 관세율을 찾지 못한 행을 0%로 계산하면 관세와 부가세가 모두 빠지므로 오류로 제외 (DDP는 관세 무관)
+    error[np.isnan(duty_rate) & (incoterm != "DDP")] = "관세율 없음 (duty_rate 입력 필요)"
+    error[(df["import_date"] != "").to_numpy() & np.isnat(parse_dates(df["import_date"]))] = "import_date 값 오류"
+    error[np.isnan(fx)] = "환율 없는 통화"
+    error[~np.isin(incoterm, INCOTERMS)] = "알 수 없는 인코텀즈"
+    invalid = error != ""
+
+    result = df.assign(fx_rate=fx, **costs)
+    result.loc[invalid, AMOUNT_COLUMNS] = np.nan
+    result["duty_source"] = duty_source
+    result["error"] = error
+    return result
+
+
+def summarize_landed_costs(result: pd.DataFrame) -> Dict[str, float]:
+    """
+    일괄 계산 결과 요약
+
+    Returns:
+        dict: rows, errors, total_krw, tax_krw(관세+부가세), cif_krw
+    """
+    valid = result[result["error"] == ""]
+    return {
+        "rows": len(result),
+        "errors": int((result["error"] != "").sum()),
+        "total_krw": float(valid["total_krw"].sum()),
+        "tax_krw": float((valid["duty_krw"] + valid["vat_krw"]).sum()),
+        "cif_krw": float(valid["cif_krw"].sum()),
+    }
+
+
+# ===========================================
+# 3. 단건 계산
+# ===========================================
+def calculate_landed_cost(incoterm: str, price: float, freight: float, insurance_krw: float,
+                          duty_rate: float, local_cost: float, exchange_rate: float,
+                          currency: str = "USD") -> Dict[str, float]:
+    """
+    선적 1건의 원가 (원가 계산기 화면용, 일괄 계산과 같은 규칙)
+
+    Args:
+        incoterm: 인코텀즈 코드
+        price: 물품대금 (currency 기준)
+        freight: 국제운송비 (currency 기준)
+        insurance_krw: 보험료 (원)
+        duty_rate: 관세율 (%)
+        local_cost: 국내 발생비용 (원)
+        exchange_rate: currency 1단위당 원화
+        currency: 물품대금/운임 통화 (기본 USD)
+
+    Returns:
+        dict: price_krw, freight_krw, insurance_krw, cif_krw, duty_krw, vat_krw,
+              local_cost_krw, total_krw
+    """
+    row = pd.DataFrame([{
+        "incoterm": incoterm, "price": price, "freight": freight, "insurance": insurance_krw,
+        "duty_rate": duty_rate, "local_cost": local_cost, "currency": currency,
+    }])
+    result = calculate_landed_costs(row, {currency.upper(): exchange_rate}).iloc[0]
+    if result["error"]:
+        raise ValueError(result["error"])
+    return {column: float(result[column]) for column in AMOUNT_COLUMNS}
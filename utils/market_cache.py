@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/market_cache.py - 서버 공용 시장 데이터 캐시
+================================================================================
+환율, 시세, 히스토리 등 외부 API 응답을 프로세스 전체에서 공유하는 캐시입니다.
+Streamlit 세션이 몇 개든 같은 키는 TTL 동안 한 번만 조회됩니다.
+
+만료된 값이 있으면 그 값을 '지연(stale)' 표시와 함께 즉시 돌려주고,
+백그라운드에서 한 번만 재조회합니다 (stale-while-revalidate).
+CACHE_PERSIST_SOURCES에 속한 소스는 마지막 정상값을 디스크에 저장하므로
+서버 재시작 직후 API 장애가 나도 지난 값을 보여줄 수 있습니다.
+디스크 저장은 호출 스레드가 아닌 백그라운드에서, 연속된 갱신을 묶어
+SNAPSHOT_DEBOUNCE_SEC마다 최대 1번만 실행합니다 (종료 시 남은 저장을 마무리).
+
+💡 팁:
+- 소스별 TTL은 config.py의 CACHE_TTL에서 조정합니다.
+- 키는 make_key(ticker=..., period=..., currency=...)로 명시적으로 만듭니다.
+- 조회 실패(예외)는 캐시에 저장하지 않으므로 다음 호출에서 다시 시도합니다.
+- get_cache_stats()로 소스별 hit/miss/stale 횟수를 확인할 수 있습니다.
+================================================================================
+"""
+
+import atexit
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from config import CACHE_TTL, CACHE_PERSIST_SOURCES, CACHE_SNAPSHOT_PATH
+
+
+DEFAULT_TTL = 300
+# 연속된 set()을 묶어 스냅샷을 한 번만 쓰는 대기 시간(초)
+SNAPSHOT_DEBOUNCE_SEC = 2.0
+
+
+# ===========================================
+# 1. 캐시 키 / 항목
+# ===========================================
+def make_key(**parts) -> Tuple:
+    """
+    명시적인 캐시 키를 생성합니다.
+
+    Args:
+        **parts: 키 구성 요소 (예: ticker="KC=F", period="5d")
+
+    Returns:
+        tuple: 이름 순으로 정렬된 (이름, 값) 쌍의 튜플
+    """
+    return tuple(sorted(parts.items()))
+
+
+@dataclass
+class CacheEntry:
+    """캐시 조회 결과 (값 + 조회 시각 + 지연 여부)"""
+    value: Any
+    fetched_at: float
+    stale: bool = False
+
+
+# ===========================================
+# 2. 캐시 클래스
+# ===========================================
+class MarketCache:
+    """소스별 TTL, hit/miss 카운터, 마지막 정상값 보관 기능을 가진 스레드 안전 캐시"""
+
+    def __init__(self, ttls: Optional[Dict[str, int]] = None,
+                 snapshot_path: Optional[str] = None,
+                 persist_sources: Iterable[str] = ()):
+        self._ttls = dict(ttls or {})
+        self._store: Dict[Tuple[str, Hashable], Tuple[float, Any]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        # 같은 키를 동시에 조회하는 세션이 한 번만 API를 호출하도록 키별 잠금 사용
+        self._key_locks: Dict[Tuple[str, Hashable], threading.Lock] = {}
+        # 백그라운드 재조회가 진행 중인 키 (키당 1개만 실행)
+        self._refreshing: set = set()
+        self._snapshot_path = snapshot_path
+        self._persist_sources = set(persist_sources)
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_timer: Optional[threading.Timer] = None
+        self._load_snapshot()
+
+    def ttl(self, source: str) -> int:
+        """소스의 TTL(초)을 반환합니다."""
+        return self._ttls.get(source, DEFAULT_TTL)
+
+    def _count(self, source: str, field: str):
+        stats = self._stats.setdefault(source, {"hits": 0, "misses": 0, "stale": 0})
+        stats[field] += 1
+
+    def _is_fresh(self, source: str, fetched_at: float) -> bool:
+        return time.time() - fetched_at <= self.ttl(source)
+
+    def get(self, source: str, key: Hashable) -> Optional[Any]:
+        """유효한 캐시 값을 반환합니다 (없거나 만료 시 None)."""
+        with self._lock:
+            entry = self._store.get((source, key))
+            fresh = entry is not None and self._is_fresh(source, entry[0])
+            self._count(source, "hits" if fresh else "misses")
+            return entry[1] if fresh else None
+
+    def set(self, source: str, key: Hashable, value: Any):
+        """값을 캐시에 저장합니다 (기존 값은 통째로 교체)."""
+        with self._lock:
+            self._store[(source, key)] = (time.time(), value)
+        if source in self._persist_sources:
+            self._schedule_snapshot()
+
+    def get_entry(self, source: str, key: Hashable, fetch: Callable[[], Any],
+                  force: bool = False) -> CacheEntry:
+        """
+        캐시 항목을 반환합니다.
+        - 유효한 값이 있으면 그대로 반환
+        - 만료된 값만 있으면 지연 표시와 함께 즉시 반환하고 백그라운드에서 재조회
+        - 값이 전혀 없으면 fetch()를 호출해 저장 (실패 시 예외)
+
+        Args:
+            source: 데이터 소스 이름 (CACHE_TTL의 키)
+            key: make_key()로 만든 캐시 키
+            fetch: 값을 가져오는 함수 (실패 시 예외 발생)
+            force: True면 캐시를 무시하고 새로 가져와 교체 (백그라운드 갱신용)
+
+        Returns:
+            CacheEntry
+        """
+        with self._lock:
+            entry = None if force else self._store.get((source, key))
+            if entry and self._is_fresh(source, entry[0]):
+                self._count(source, "hits")
+                return CacheEntry(entry[1], entry[0])
+            if entry:
+                self._count(source, "stale")
+            key_lock = self._key_locks.setdefault((source, key), threading.Lock())
+
+        if entry:
+            self._refresh_in_background(source, key, fetch)
+            return CacheEntry(entry[1], entry[0], stale=True)
+
+        with key_lock:
+            if not force:
+                # 대기하는 동안 다른 세션이 먼저 채웠을 수 있음
+                with self._lock:
+                    entry = self._store.get((source, key))
+                    self._count(source, "hits" if entry else "misses")
+                if entry:
+                    return CacheEntry(entry[1], entry[0], stale=not self._is_fresh(source, entry[0]))
+            value = fetch()
+            self.set(source, key, value)
+            return CacheEntry(value, time.time())
+
+    def get_or_fetch(self, source: str, key: Hashable, fetch: Callable[[], Any],
+                     force: bool = False) -> Any:
+        """get_entry()와 같지만 값만 반환합니다."""
+        return self.get_entry(source, key, fetch, force=force).value
+
+    def _refresh_in_background(self, source: str, key: Hashable, fetch: Callable[[], Any]):
+        with self._lock:
+            if (source, key) in self._refreshing:
+                return
+            self._refreshing.add((source, key))
+
+        def worker():
+            try:
+                self.get_entry(source, key, fetch, force=True)
+            except Exception:
+                # 실패하면 기존(지연) 값을 계속 사용
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.discard((source, key))
+
+        threading.Thread(target=worker, name=f"cache-refresh-{source}", daemon=True).start()
+
+    def clear(self, source: Optional[str] = None):
+        """캐시를 비웁니다 (source 지정 시 해당 소스만)."""
+        with self._lock:
+            if source is None:
+                self._store.clear()
+                self._key_locks.clear()
+            else:
+                for store_key in [k for k in self._store if k[0] == source]:
+                    del self._store[store_key]
+                    self._key_locks.pop(store_key, None)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """소스별 hit/miss/stale 카운터 사본을 반환합니다."""
+        with self._lock:
+            return {source: dict(counts) for source, counts in self._stats.items()}
+
+    # ===========================================
+    # 3. 마지막 정상값 디스크 보관
+    # ===========================================
+    def _load_snapshot(self):
+        if not self._snapshot_path or not os.path.exists(self._snapshot_path):
+            return
+        try:
+            with open(self._snapshot_path, "rb") as f:
+                snapshot = pickle.load(f)
+            self._store.update(snapshot)
+        except Exception:
+            # 손상된 스냅샷은 무시하고 빈 캐시로 시작
+            pass
+
+    def _schedule_snapshot(self):
+        """스냅샷 저장 예약 (이미 예약되어 있으면 그 저장에 합류)"""
+        if not self._snapshot_path:
+            return
+        with self._lock:
+            if self._snapshot_timer is not None:
+                return
+            self._snapshot_timer = threading.Timer(SNAPSHOT_DEBOUNCE_SEC, self.flush_snapshot)
+            self._snapshot_timer.daemon = True
+            self._snapshot_timer.start()
+
+    def flush_snapshot(self):
+        """예약된 스냅샷을 지금 저장합니다 (예약이 없으면 아무것도 하지 않음)."""
+        with self._lock:
+            timer, self._snapshot_timer = self._snapshot_timer, None
+        if timer is None:
+            return
+        timer.cancel()
+        self._save_snapshot()
+
+    def _save_snapshot(self):
+        if not self._snapshot_path:
+            return
+        with self._lock:
+            snapshot = {k: v for k, v in self._store.items() if k[0] in self._persist_sources}
+        with self._snapshot_lock:
+            try:
+                tmp_path = f"{self._snapshot_path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(snapshot, f)
+                # 원자적 교체 (읽는 쪽이 반쯤 쓰인 파일을 보지 않도록)
+                os.replace(tmp_path, self._snapshot_path)
+            except Exception:
+                pass
+
+
+# ===========================================
+# 4. 서버 공용 인스턴스
+# ===========================================
+# 모듈은 서버 프로세스당 한 번만 import되므로 모든 세션이 이 인스턴스를 공유합니다.
+os.makedirs(os.path.dirname(CACHE_SNAPSHOT_PATH), exist_ok=True)
+market_cache = MarketCache(CACHE_TTL, CACHE_SNAPSHOT_PATH, CACHE_PERSIST_SOURCES)
+atexit.register(market_cache.flush_snapshot)
+
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """
+    공용 캐시의 소스별 hit/miss/stale 통계를 반환합니다.
+
+    Returns:
+        dict: {소스: {'hits': int, 'misses': int, 'stale': int}}
+    """
+    return market_cache.stats()
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/market_providers.py - 시장 데이터 공급자 (Provider) 모음
+================================================================================
+소싱 대시보드의 모든 지표(Arabica, Robusta, USD/KRW, 컨테이너 운임지수)를
+같은 인터페이스로 조회합니다. 공급자마다 조회 방법과 캐시 정책이 다르고,
+화면 코드는 get_market_quotes()만 호출하면 됩니다.
+
+- YahooProvider: Yahoo Finance 티커 (배치 시세 1회 요청을 공유)
+- CsvProvider: 로컬 CSV 파일 또는 CSV URL (운임지수, 오프라인 실행용)
+
+💡 팁:
+- 새 데이터 소스는 MarketDataProvider를 상속해 fetch()만 구현한 뒤
+  build_market_providers()에 추가하면 됩니다 (화면 코드 수정 불필요).
+- MARKET_DATA_OFFLINE=1이면 모든 지표를 data/offline_market.csv에서 읽습니다.
+- 운임지수는 외부 피드가 연결되어 있지 않습니다. data/freight_index.csv를
+  직접 갱신하거나 FREIGHT_INDEX_URL에 같은 형식의 CSV 주소를 지정해야 합니다.
+  저장소의 CSV는 형식 예시용 샘플이므로, 마지막 행 날짜가
+  FREIGHT_INDEX_MAX_AGE_DAYS보다 오래되면 시세를 '기준일 지연'(outdated)으로 표시하고
+  히스토리에서도 그 이후 날짜는 비워둡니다 (운임 시그널 규칙은 적용되지 않음).
+================================================================================
+"""
+
+import io
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+import pandas as pd
+
+from config import (
+    MARKET_DATA_OFFLINE, OFFLINE_MARKET_PATH, FREIGHT_INDEX_PATH, FREIGHT_INDEX_URL,
+    FREIGHT_INDEX_MAX_AGE_DAYS
+)
+from .market_cache import market_cache, make_key, CacheEntry
+from .http_client import http_get
+from .api_helpers import get_batch_tickers, get_batch_closes_entry, get_close_series
+from .indicators import indicator_book
+
+
+# ===========================================
+# 1. 시세 데이터 클래스
+# ===========================================
+@dataclass
+class Quote:
+    """최근 종가와 직전 종가 (조회 시각, 지연 여부, 데이터 기준일 포함)"""
+    price: float
+    prev: float
+    fetched_at: datetime
+    stale: bool = False             # 캐시 만료 후 재조회 중
+    as_of: Optional[datetime] = None    # 최근 종가의 날짜
+    outdated: bool = False          # 기준일이 공급자의 max_age_days보다 오래됨
+
+    @property
+    def change(self) -> float:
+        return self.price - self.prev
+
+    @property
+    def change_pct(self) -> float:
+        return (self.change / self.prev) * 100 if self.prev else 0.0
+
+
+# ===========================================
+# 2. 공급자 인터페이스
+# ===========================================
+class MarketDataProvider(ABC):
+    """
+    지표 하나의 최근 종가 시리즈를 공급하는 기본 클래스
+
+    Args:
+        key: 지표 키 (예: "arabica")
+        label: 화면 표시 이름
+        unit: 가격 단위
+        cache_source: 공용 캐시 소스 이름 (TTL은 config.CACHE_TTL)
+        max_age_days: 최근 종가 날짜가 이보다 오래되면 outdated (None이면 검사 안 함)
+    """
+
+    def __init__(self, key: str, label: str, unit: str, cache_source: str,
+                 max_age_days: Optional[int] = None):
+        self.key = key
+        self.label = label
+        self.unit = unit
+        self.cache_source = cache_source
+        self.max_age_days = max_age_days
+
+    def is_outdated(self, as_of) -> bool:
+        """데이터 기준일이 max_age_days보다 오래되었는지"""
+        if self.max_age_days is None or as_of is None:
+            return False
+        return pd.Timestamp(as_of) < pd.Timestamp.now().normalize() - timedelta(days=self.max_age_days)
+
+    @abstractmethod
+    def fetch(self) -> pd.Series:
+        """최근 종가 시리즈를 가져옵니다 (오래된 순, 실패 시 예외)."""
+
+    def entry(self, force: bool = False) -> CacheEntry:
+        """공용 캐시를 거친 종가 시리즈 항목"""
+        return market_cache.get_entry(self.cache_source, make_key(provider=self.key), self.fetch,
+                                      force=force)
+
+    def history(self, period: str) -> pd.Series:
+        """
+        기간별 일별 종가 시리즈 (기본: 공급자가 가진 전체 시리즈)
+
+        Args:
+            period: 기간 ("1y", "5y", "10y", "max")
+        """
+        return self.entry().value
+
+    def quote(self, force: bool = False) -> Quote:
+        """
+        최근 종가와 직전 종가를 반환합니다.
+
+        Raises:
+            ValueError: 종가가 2개 미만인 경우
+        """
+        entry = self.entry(force)
+        closes = entry.value.dropna()
+        if len(closes) < 2:
+            raise ValueError(f"{self.label} 데이터 부족")
+        last = closes.index[-1]
+        as_of = pd.Timestamp(last).to_pydatetime() if isinstance(last, (datetime, pd.Timestamp)) else None
+        return Quote(float(closes.iloc[-1]), float(closes.iloc[-2]),
+                     datetime.fromtimestamp(entry.fetched_at), entry.stale,
+                     as_of, self.is_outdated(as_of))
+
+
+class YahooProvider(MarketDataProvider):
+    """Yahoo Finance 티커 공급자 (배치 대상 티커는 배치 시세 1회 요청을 공유)"""
+
+    def __init__(self, key: str, label: str, unit: str, ticker: str):
+        super().__init__(key, label, unit, cache_source="yahoo_quote")
+        self.ticker = ticker
+
+    def fetch(self) -> pd.Series:
+        return get_close_series(self.ticker, "5d")
+
+    def history(self, period: str) -> pd.Series:
+        return get_close_series(self.ticker, period)
+
+    def entry(self, force: bool = False) -> CacheEntry:
+        if self.ticker not in get_batch_tickers():
+            return super().entry(force)
+        batch = get_batch_closes_entry("5d", force)
+        if self.ticker not in batch.value.columns:
+            raise ValueError(f"{self.ticker} 데이터 없음")
+        return CacheEntry(batch.value[self.ticker], batch.fetched_at, batch.stale)
+
+
+class CsvProvider(MarketDataProvider):
+    """
+    CSV(로컬 파일 또는 URL) 공급자. date 컬럼과 값 컬럼이 필요합니다.
+
+    Args:
+        location: 파일 경로 또는 http(s) URL
+        column: 값 컬럼 이름 (기본 "close")
+    """
+
+    def __init__(self, key: str, label: str, unit: str, location: str,
+                 column: str = "close", cache_source: str = "market_file",
+                 max_age_days: Optional[int] = None):
+        super().__init__(key, label, unit, cache_source, max_age_days)
+        self.location = location
+        self.column = column
+
+    def fetch(self) -> pd.Series:
+        if self.location.startswith(("http://", "https://")):
+            response = http_get(self.location)
+            response.raise_for_status()
+            source = io.StringIO(response.text)
+        else:
+            source = self.location
+        df = pd.read_csv(source, parse_dates=["date"]).sort_values("date")
+        if self.column not in df.columns:
+            raise ValueError(f"{os.path.basename(self.location)}에 {self.column} 컬럼 없음")
+        return df.set_index("date")[self.column].astype(float)
+
+
+# ===========================================
+# 3. 대시보드 공급자 구성
+# ===========================================
+def build_market_providers(offline: bool = MARKET_DATA_OFFLINE) -> Dict[str, MarketDataProvider]:
+    """
+    소싱 대시보드 지표별 공급자를 만듭니다.
+
+    Args:
+        offline: True면 모든 지표를 로컬 CSV(OFFLINE_MARKET_PATH)에서 읽음
+
+    Returns:
+        dict: {지표 키: 공급자} (화면 표시 순서)
+    """
+    instruments = [
+        ("arabica", "ICE Arabica (NY)", "¢/lb", "KC=F"),
+        ("robusta", "London Robusta", "$/MT", "RC=F"),
+        ("usd_krw", "USD/KRW Exchange Rate", "", "KRW=X"),
+    ]
+    if offline:
+        providers = {key: CsvProvider(key, label, unit, OFFLINE_MARKET_PATH, column=key)
+                     for key, label, unit, _ in instruments}
+        providers["freight"] = CsvProvider("freight", "Shanghai Freight Index", "points",
+                                           OFFLINE_MARKET_PATH, column="freight")
+        return providers
+
+    providers = {key: YahooProvider(key, label, unit, ticker) for key, label, unit, ticker in instruments}
+    providers["freight"] = CsvProvider("freight", "Shanghai Freight Index", "points",
+                                       FREIGHT_INDEX_URL or FREIGHT_INDEX_PATH,
+                                       cache_source="freight_index",
+                                       max_age_days=FREIGHT_INDEX_MAX_AGE_DAYS)
+    return providers
+
+
+market_providers = build_market_providers()
+
+
+def get_market_quotes() -> Dict[str, Optional[Quote]]:
+    """
+    모든 지표의 시세를 동시에 조회합니다.
+    Yahoo 지표들은 같은 배치 요청을 기다리므로 실제 요청은 1회입니다.
+
+    Returns:
+        dict: {지표 키: Quote 또는 None(조회 실패)}
+    """
+    def load(provider: MarketDataProvider) -> Optional[Quote]:
+        try:
+            return provider.quote()
+        except Exception:
+            return None
+
+    providers = list(market_providers.values())
+    with ThreadPoolExecutor(max_workers=len(providers)) as pool:
+        quotes = list(pool.map(load, providers))
+    return {provider.key: quote for provider, quote in zip(providers, quotes)}
+
+
+def get_market_history(period: str = "10y") -> pd.DataFrame:
+    """
+    모든 지표의 일별 종가를 날짜 기준으로 맞춘 표를 반환합니다.
+    주간 지표(운임지수)와 휴장일은 직전 값으로 채웁니다.
+
+    Args:
+        period: 기간 ("1y", "5y", "10y", "max")
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스 + 지표 키 컬럼 (조회 실패한 지표는 NaN,
+                      갱신이 끊긴 지표는 마지막 날짜 + max_age_days 이후 NaN)
+    """
+    def load(provider: MarketDataProvider) -> pd.Series:
+        try:
+            return provider.history(period)
+        except Exception:
+            return pd.Series(dtype=float)
+
+    providers = list(market_providers.values())
+    with ThreadPoolExecutor(max_workers=len(providers)) as pool:
+        series = list(pool.map(load, providers))
+
+    prices = pd.concat({p.key: s for p, s in zip(providers, series)}, axis=1).sort_index().ffill()
+    # 갱신이 끊긴 지표(샘플 운임지수 등)는 상수로 이어 붙이지 않음
+    for p, s in zip(providers, series):
+        last = s.last_valid_index()
+        if p.max_age_days is not None and last is not None:
+            prices.loc[prices.index > last + timedelta(days=p.max_age_days), p.key] = float("nan")
+    # 일별 지표 기준으로 기간을 자름 (CSV 지표가 더 오래된 데이터를 가질 수 있음)
+    daily = [p.key for p in providers if isinstance(p, YahooProvider)]
+    if daily:
+        prices = prices.loc[prices[daily].first_valid_index():]
+    return prices
+
+
+def get_market_indicators(keys=("arabica", "robusta", "usd_krw"),
+                          period: str = "1y") -> Dict[str, Dict[str, float]]:
+    """
+    지표별 최근 기술적 지표 값 (RSI, Z-점수, 이동평균, 변동성 등)
+    indicator_book에 상태를 두므로 rerun 때는 새 날짜만 반영합니다.
+
+    Args:
+        keys: 지표 키 목록
+        period: 계산에 쓸 일별 종가 기간
+
+    Returns:
+        dict: {지표 키: {지표 이름: 값}} (조회 실패한 지표는 제외)
+    """
+    indicators = {}
+    for key in keys:
+        try:
+            indicator_book.sync(("market", key, period), market_providers[key].history(period))
+        except Exception:
+            continue
+        indicators[key] = indicator_book.latest(("market", key, period))
+    return indicators
+
+
+def refresh_freight_index():
+    """운임지수 갱신 (백그라운드 워머용, 실패 시 예외)"""
+    market_providers["freight"].entry(force=True)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/replay.py - 외부 API 녹화/재생 (Record/Replay)
+================================================================================
+Yahoo Finance, exchangerate-api, OpenWeatherMap, Google News RSS, 네이버,
+Google 번역, OpenAI 응답을 로컬 카세트(data/cassettes)에 저장해 두고
+네트워크 없이 그대로 재생합니다. 인터넷이 없는 빌드 서버에서도 화면 렌더링
+성능을 같은 입력으로 반복 측정할 수 있습니다.
+
+- API_REPLAY_MODE=off     : 평소처럼 외부 API 호출 (기본값)
+- API_REPLAY_MODE=record  : 외부 API를 호출하고 응답을 카세트에 저장
+- API_REPLAY_MODE=replay  : 카세트에서만 읽음 (없으면 CassetteMissingError)
+
+💡 팁:
+- REPLAY_LATENCY_MS로 재생 시 응답 지연을 흉내냅니다.
+  숫자(ms)면 고정 지연, "recorded"면 녹화 당시 걸린 시간만큼 기다립니다.
+- 카세트 키에서는 API 키 값을 지우므로 녹화/재생 환경의 키가 달라도 됩니다.
+  단, 키가 없으면 호출 전에 기본값을 반환하는 함수가 있으므로 재생 환경의
+  .env에도 (가짜라도) 키를 넣어두세요.
+- 카세트에는 응답 원문이 들어 있으므로 저장소에 올리지 않습니다 (.gitignore).
+- 화면 코드가 CassetteMissingError를 잡아 폴백으로 넘어가도 missing_cassettes()에
+  기록이 남으므로, 측정 스크립트(bench_render.py)는 폴백 경로를 측정하지 않습니다.
+================================================================================
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from typing import Any, Callable, List, Optional, TypeVar
+
+from config import (
+    API_REPLAY_MODE, CASSETTE_DIR, REPLAY_LATENCY_MS,
+    EXCHANGE_API_KEY, WEATHER_API_KEY, OPENAI_API_KEY, NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+)
+
+
+T = TypeVar("T")
+
+REPLAY_MODES = ("off", "record", "replay")
+
+# 카세트 키에서 지울 비밀 값 (API 키가 URL 경로나 파라미터에 들어가는 경우 대비)
+_SECRETS = [s for s in (EXCHANGE_API_KEY, WEATHER_API_KEY, OPENAI_API_KEY,
+                        NAVER_CLIENT_ID, NAVER_CLIENT_SECRET) if s]
+
+
+class CassetteMissingError(LookupError):
+    """재생 모드에서 해당 요청의 카세트가 없는 경우"""
+
+
+# 재생 모드에서 찾지 못한 카세트 (호출 쪽에서 예외를 삼켜도 남음)
+_missing: List[str] = []
+_missing_lock = threading.Lock()
+
+
+def missing_cassettes() -> List[str]:
+    """reset_missing_cassettes() 이후 찾지 못한 카세트 목록 ("<서비스>/<키>.pkl")"""
+    with _missing_lock:
+        return list(_missing)
+
+
+def reset_missing_cassettes():
+    with _missing_lock:
+        _missing.clear()
+
+
+# ===========================================
+# 1. 카세트 키 / 경로
+# ===========================================
+def _scrub(text: str) -> str:
+    for secret in _SECRETS:
+        text = text.replace(secret, "***")
+    return text
+
+
+def cassette_key(request: dict) -> str:
+    """
+    요청 내용으로 카세트 키를 만듭니다 (API 키 값은 제외).
+
+    Args:
+        request: 요청을 구분하는 값들 (URL, 파라미터, 프롬프트 등)
+
+    Returns:
+        str: SHA-1 해시 문자열
+    """
+    canonical = _scrub(json.dumps(request, sort_keys=True, ensure_ascii=False, default=str))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def cassette_path(service: str, request: dict) -> str:
+    """카세트 파일 경로 (data/cassettes/<서비스>/<키>.pkl)"""
+    return os.path.join(CASSETTE_DIR, service, f"{cassette_key(request)}.pkl")
+
+
+# ===========================================
+# 2. 녹화 / 재생
+# ===========================================
+def _inject_latency(recorded_elapsed: float):
+    if REPLAY_LATENCY_MS == "recorded":
+        time.sleep(recorded_elapsed)
+    elif REPLAY_LATENCY_MS:
+        time.sleep(float(REPLAY_LATENCY_MS) / 1000)
+
+
+def replay_call(service: str, request: dict, call: Callable[[], T],
+                dump: Optional[Callable[[T], Any]] = None,
+                load: Optional[Callable[[Any], T]] = None) -> T:
+    """
+    외부 API 호출을 모드에 따라 그대로 실행 / 녹화 / 재생합니다.
+
+    Args:
+        service: 서비스 이름 (카세트 폴더 이름, 예: "yahoo", "openai")
+        request: 요청을 구분하는 값들 (같은 값이면 같은 카세트)
+        call: 실제 API 호출 함수
+        dump: 응답을 저장 가능한 형태로 바꾸는 함수 (기본: 그대로 pickle)
+        load: dump 결과를 응답으로 되돌리는 함수
+
+    Returns:
+        call()의 결과 (재생 모드에서는 카세트의 값)
+
+    Raises:
+        CassetteMissingError: 재생 모드에서 카세트가 없는 경우
+    """
+    if API_REPLAY_MODE == "replay":
+        path = cassette_path(service, request)
+        if not os.path.exists(path):
+            with _missing_lock:
+                _missing.append(f"{service}/{os.path.basename(path)}")
+            raise CassetteMissingError(f"{service} 카세트 없음: {os.path.basename(path)}")
+        with open(path, "rb") as f:
+            cassette = pickle.load(f)
+        _inject_latency(cassette["elapsed"])
+        return load(cassette["response"]) if load else cassette["response"]
+
+    if API_REPLAY_MODE != "record":
+        return call()
+
+    started = time.time()
+    result = call()
+    path = cassette_path(service, request)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    cassette = {
+        "service": service,
+        "request": json.loads(_scrub(json.dumps(request, ensure_ascii=False, default=str))),
+        "elapsed": time.time() - started,
+        "response": dump(result) if dump else result,
+    }
+    # 원자적 교체 (동시에 녹화하는 세션이 반쯤 쓰인 파일을 읽지 않도록)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(cassette, f)
+    os.replace(tmp_path, path)
+    return result
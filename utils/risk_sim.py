@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/risk_sim.py - 수입 원가 몬테카를로 리스크 시뮬레이션
+================================================================================
+선적 리드타임 동안 USD/KRW, Arabica 가격, 컨테이너 운임이 함께 움직이는
+경로를 수십만~백만 개 만들고, 경로마다 CIF → 관세 → 부가세 → 총액을
+계산해 원가 분포(P5/P50/P95)를 구합니다.
+
+- 세 지표는 상관된 기하 브라운 운동(GBM)으로 가정하고, 상관/변동성은
+  최근 시세(주간 로그수익률)에서 추정합니다 (데이터 부족 시 기본값).
+- 원가는 도착 시점 값만 필요하므로 경로 전체 대신 만기 분포를 한 번에 뽑습니다.
+- 리드타임("45-60 Days")은 경로마다 구간 안에서 균등하게 뽑습니다.
+- 원가 계산 규칙은 utils/landed_cost.py와 같습니다.
+
+💡 팁:
+- 100만 경로 ≈ 0.2초 (배열 연산만 사용, 반복문 없음)
+================================================================================
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .landed_cost import cost_chain
+
+
+RISK_FACTORS = ("usd_krw", "arabica", "freight")
+
+# 시세가 부족할 때 쓰는 연 변동성 / 상관계수 (RISK_FACTORS 순서)
+DEFAULT_ANNUAL_VOL = np.array([0.08, 0.35, 0.45])
+DEFAULT_CORR = np.array([
+    [1.0, -0.1, 0.1],
+    [-0.1, 1.0, 0.2],
+    [0.1, 0.2, 1.0],
+])
+
+MIN_WEEKLY_OBS = 26
+
+
+# ===========================================
+# 1. 위험 모형 (변동성 / 상관)
+# ===========================================
+@dataclass(frozen=True)
+class RiskModel:
+    """일(달력일) 단위 로그수익률 공분산 (RISK_FACTORS 순서)"""
+    daily_cov: np.ndarray
+    source: str                 # "history" 또는 "default"
+
+    @property
+    def annual_vol(self) -> np.ndarray:
+        return np.sqrt(np.diag(self.daily_cov) * 365)
+
+    @property
+    def corr(self) -> np.ndarray:
+        std = np.sqrt(np.diag(self.daily_cov))
+        return self.daily_cov / np.outer(std, std)
+
+
+def default_risk_model() -> RiskModel:
+    """기본 변동성/상관으로 만든 위험 모형"""
+    daily_vol = DEFAULT_ANNUAL_VOL / np.sqrt(365)
+    return RiskModel(DEFAULT_CORR * np.outer(daily_vol, daily_vol), "default")
+
+
+def estimate_risk_model(prices: Optional[pd.DataFrame]) -> RiskModel:
+    """
+    시세 표로 위험 모형을 추정합니다.
+    주간 지표(운임지수)와 섞여 있으므로 주간 로그수익률로 공분산을 구해 일 단위로 나눕니다.
+
+    Args:
+        prices: 날짜 인덱스 + usd_krw, arabica, freight 컬럼 (get_market_history() 결과)
+
+    Returns:
+        RiskModel (데이터가 부족하면 기본 모형)
+    """
+    if prices is None or prices.empty or not set(RISK_FACTORS).issubset(prices.columns):
+        return default_risk_model()
+    weekly = prices[list(RISK_FACTORS)].sort_index().ffill().resample("W").last()
+    returns = np.log(weekly).diff().dropna()
+    if len(returns) < MIN_WEEKLY_OBS:
+        return default_risk_model()
+    cov = returns.cov().to_numpy() / 7
+    if not np.all(np.isfinite(cov)) or np.any(np.diag(cov) <= 0):
+        return default_risk_model()
+    return RiskModel(cov, "history")
+
+
+def parse_lead_time(text: str) -> Tuple[int, int]:
+    """
+    "45-60 Days" 같은 리드타임 문자열을 (최소, 최대) 일수로 바꿉니다.
+
+    Raises:
+        ValueError: 숫자가 없는 경우
+    """
+    days = [int(n) for n in re.findall(r"\d+", str(text))]
+    if not days:
+        raise ValueError(f"리드타임 형식 오류: {text}")
+    return min(days), max(days)
+
+
+# ===========================================
+# 2. 시뮬레이션
+# ===========================================
+@dataclass
+class SimulationResult:
+    """시뮬레이션 결과 (경로별 총액 배열 + 요약)"""
+    totals: np.ndarray
+    percentiles: Dict[int, float]
+    mean: float
+    point_estimate: float       # 현재 시세 그대로일 때의 총액
+    model: RiskModel
+    lead_days: Tuple[int, int]
+
+
+def simulate_factors(model: RiskModel, lead_days: Tuple[int, int], n_paths: int,
+                     seed: Optional[int] = None) -> np.ndarray:
+    """
+    리드타임 뒤 지표별 변동 배수를 뽑습니다 (평균 1, 로그정규).
+
+    Args:
+        model: 위험 모형
+        lead_days: (최소, 최대) 리드타임 일수
+        n_paths: 경로 수
+        seed: 난수 시드
+
+    Returns:
+        np.ndarray: (n_paths, 3) 배수 배열 (RISK_FACTORS 순서)
+    """
+    rng = np.random.default_rng(seed)
+    horizon = rng.uniform(lead_days[0], lead_days[1], size=n_paths) if lead_days[1] > lead_days[0] \
+        else np.full(n_paths, float(lead_days[0]))
+    chol = np.linalg.cholesky(model.daily_cov)
+    shocks = rng.standard_normal((n_paths, len(RISK_FACTORS))) @ chol.T
+    shocks *= np.sqrt(horizon)[:, None]
+    # 평균이 현재값과 같도록 -σ²T/2 보정
+    shocks -= 0.5 * np.diag(model.daily_cov) * horizon[:, None]
+    return np.exp(shocks)
+
+
+def simulate_landed_cost(incoterm: str, price: float, freight: float, insurance_krw: float,
+                         duty_rate: float, local_cost: float, usd_krw: float,
+                         lead_days: Tuple[int, int], model: Optional[RiskModel] = None,
+                         n_paths: int = 1_000_000, seed: Optional[int] = None,
+                         price_linked: bool = True,
+                         percentiles: Sequence[int] = (5, 50, 95)) -> SimulationResult:
+    """
+    도착 시점 수입 원가 분포를 시뮬레이션합니다.
+
+    Args:
+        incoterm: 인코텀즈 코드
+        price: 물품대금 (USD)
+        freight: 국제운송비 (USD, EXW/FOB만 반영)
+        insurance_krw: 보험료 (원)
+        duty_rate: 관세율 (%)
+        local_cost: 국내 발생비용 (원)
+        usd_krw: 현재 USD/KRW 환율
+        lead_days: (최소, 최대) 리드타임 일수
+        model: 위험 모형 (None이면 기본 모형)
+        n_paths: 경로 수
+        seed: 난수 시드
+        price_linked: True면 물품대금이 Arabica 선물 가격에 연동(가격 미확정 계약)
+        percentiles: 구할 백분위
+
+    Returns:
+        SimulationResult
+    """
+    model = model or default_risk_model()
+    factors = simulate_factors(model, lead_days, n_paths, seed)
+    fx = usd_krw * factors[:, 0]
+    price_usd = price * factors[:, 1] if price_linked else price
+
+    totals = cost_chain(incoterm, price_krw=price_usd * fx, freight_krw=freight * factors[:, 2] * fx,
+                        insurance_krw=insurance_krw, duty_rate=duty_rate,
+                        local_cost=local_cost)["total_krw"]
+    point = cost_chain(incoterm, price_krw=price * usd_krw, freight_krw=freight * usd_krw,
+                       insurance_krw=insurance_krw, duty_rate=duty_rate,
+                       local_cost=local_cost)["total_krw"]
+
+    values = np.percentile(totals, percentiles)
+    return SimulationResult(
+        totals=totals,
+        percentiles={int(p): float(v) for p, v in zip(percentiles, values)},
+        mean=float(totals.mean()),
+        point_estimate=float(point),
+        model=model,
+        lead_days=lead_days,
+    )
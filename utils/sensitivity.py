@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/sensitivity.py - 수입 원가 민감도 분석 (시나리오 그리드 / 토네이도)
+================================================================================
+환율 × 운임 × 관세율 조합 전체의 총 필요 자금을 배열 한 번의 브로드캐스트로
+계산합니다 (예: 200 × 50 × 3 = 30,000개 시나리오, 수 ms).
+원가 계산 규칙은 utils/landed_cost.py의 cost_chain()과 같습니다.
+
+- sensitivity_grid(): (관세율, 환율, 운임) 3차원 총액 배열 → 히트맵
+- tornado_table(): 변수 하나씩 낮음/높음으로 바꿨을 때의 총액 → 토네이도 차트
+
+💡 팁:
+- CFR/CIF/DDP는 운임이 물품대금에 포함되어 운임 축으로는 총액이 변하지 않습니다.
+================================================================================
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .landed_cost import cost_chain
+
+
+# 토네이도 기본 변동 폭 (기준값 대비 비율, 관세율은 %p)
+DEFAULT_SWINGS = {
+    "fx": 0.10,
+    "price": 0.10,
+    "freight": 0.50,
+    "duty_rate": 3.0,
+    "local_cost": 0.20,
+}
+
+SWING_LABELS = {
+    "fx": "환율",
+    "price": "물품대금",
+    "freight": "국제운송비",
+    "duty_rate": "관세율",
+    "local_cost": "국내비용",
+}
+
+
+# ===========================================
+# 1. 시나리오 그리드
+# ===========================================
+@dataclass
+class SensitivityGrid:
+    """시나리오 그리드 결과 (totals[관세율, 환율, 운임])"""
+    fx_levels: np.ndarray
+    freight_levels: np.ndarray
+    duty_levels: np.ndarray
+    totals: np.ndarray
+
+    def frame(self, duty_index: int) -> pd.DataFrame:
+        """관세율 하나에 대한 환율(행) × 운임(열) 표"""
+        return pd.DataFrame(self.totals[duty_index], index=self.fx_levels, columns=self.freight_levels)
+
+
+def sensitivity_grid(incoterm: str, price: float, insurance_krw: float, local_cost: float,
+                     fx_levels: Sequence[float], freight_levels: Sequence[float],
+                     duty_levels: Sequence[float]) -> SensitivityGrid:
+    """
+    환율 × 운임 × 관세율 전체 조합의 총 필요 자금을 한 번에 계산합니다.
+
+    Args:
+        incoterm: 인코텀즈 코드
+        price: 물품대금 (USD)
+        insurance_krw: 보험료 (원)
+        local_cost: 국내 발생비용 (원)
+        fx_levels: USD/KRW 환율 후보
+        freight_levels: 국제운송비 후보 (USD)
+        duty_levels: 관세율 후보 (%)
+
+    Returns:
+        SensitivityGrid: totals 모양은 (관세율 수, 환율 수, 운임 수)
+    """
+    fx = np.asarray(fx_levels, dtype=float)
+    freight = np.asarray(freight_levels, dtype=float)
+    duty = np.asarray(duty_levels, dtype=float)
+
+    totals = cost_chain(
+        incoterm,
+        price_krw=price * fx[None, :, None],
+        freight_krw=freight[None, None, :] * fx[None, :, None],
+        insurance_krw=insurance_krw,
+        duty_rate=duty[:, None, None],
+        local_cost=local_cost,
+    )["total_krw"]
+    # 운임이 반영되지 않는 조건에서도 모양을 (관세율, 환율, 운임)으로 맞춤
+    totals = np.broadcast_to(totals, (len(duty), len(fx), len(freight)))
+    return SensitivityGrid(fx, freight, duty, totals)
+
+
+# ===========================================
+# 2. 토네이도 (변수별 영향도)
+# ===========================================
+def tornado_table(incoterm: str, base: Dict[str, float],
+                  swings: Dict[str, float] = None) -> pd.DataFrame:
+    """
+    변수 하나씩 낮음/높음으로 바꿨을 때의 총액을 계산합니다 (나머지는 기준값).
+
+    Args:
+        incoterm: 인코텀즈 코드
+        base: 기준값 {fx, price, freight(USD), insurance_krw, duty_rate(%), local_cost}
+        swings: {변수: 변동 폭} (관세율은 %p, 나머지는 비율, 기본 DEFAULT_SWINGS)
+
+    Returns:
+        pd.DataFrame: variable, label, low_value, high_value, low_total, high_total, spread
+                      (영향이 큰 순서)
+    """
+    swings = swings or DEFAULT_SWINGS
+    names = list(swings)
+    # 행 0: 낮음, 행 1: 높음 / 열: 변수 → (2, 변수 수) 배열 한 번에 계산
+    values = {key: np.full((2, len(names)), float(base[key])) for key in ("fx", "price", "freight", "duty_rate", "local_cost")}
+    bounds = {}
+    for col, name in enumerate(names):
+        if name == "duty_rate":
+            low, high = max(0.0, base[name] - swings[name]), base[name] + swings[name]
+        else:
+            low, high = base[name] * (1 - swings[name]), base[name] * (1 + swings[name])
+        values[name][:, col] = (low, high)
+        bounds[name] = (low, high)
+
+    totals = cost_chain(
+        incoterm,
+        price_krw=values["price"] * values["fx"],
+        freight_krw=values["freight"] * values["fx"],
+        insurance_krw=float(base["insurance_krw"]),
+        duty_rate=values["duty_rate"],
+        local_cost=values["local_cost"],
+    )["total_krw"]
+    totals = np.broadcast_to(totals, (2, len(names)))
+
+    table = pd.DataFrame({
+        "variable": names,
+        "label": [SWING_LABELS.get(name, name) for name in names],
+        "low_value": [bounds[name][0] for name in names],
+        "high_value": [bounds[name][1] for name in names],
+        "low_total": totals[0],
+        "high_total": totals[1],
+    })
+    table["spread"] = (table["high_total"] - table["low_total"]).abs()
+    return table.sort_values("spread", ascending=False, ignore_index=True)
+
+
+def level_range(center: float, pct: float, steps: int, floor: float = 0.0) -> np.ndarray:
+    """기준값 ±pct 구간을 steps개로 나눈 후보 (center가 0이면 0 ~ floor 구간)"""
+    if center <= 0:
+        return np.linspace(0.0, floor, steps)
+    return np.linspace(center * (1 - pct), center * (1 + pct), steps)
+
+
+def base_total(incoterm: str, base: Dict[str, float]) -> float:
+    """기준값 그대로의 총 필요 자금"""
+    return float(cost_chain(
+        incoterm,
+        price_krw=base["price"] * base["fx"],
+        freight_krw=base["freight"] * base["fx"],
+        insurance_krw=base["insurance_krw"],
+        duty_rate=base["duty_rate"],
+        local_cost=base["local_cost"],
+    )["total_krw"])
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/signal_engine.py - 소싱 시그널 엔진 (규칙 파일 + 벡터 연산)
+================================================================================
+Arabica, Robusta, USD/KRW, 운임지수의 일별 변동률로 0~100 소싱 점수와
+시그널 단계(강력 매수 ~ 변동성 경고)를 계산합니다.
+
+점수 규칙과 단계는 data/signal_rules.json에 정의되어 있고, 읽을 때
+(지표 위치, 비교 연산, 임계값, 가감점) 배열로 컴파일됩니다.
+평가는 "변동률 행렬 → 규칙별 불리언 마스크 → 가감점 행렬곱" 한 번이므로
+규칙이 늘어나도 반복문이 늘지 않습니다.
+
+- score_snapshot(): 오늘 하루의 점수 + 로직 트리거 문구 (tab1 요약 카드)
+- compute_signal_history(): 전체 기간의 점수/단계 (tab1 히스토리 차트)
+- score_panel(): 여러 산지/시나리오의 기간별 점수를 한 번에 계산
+
+규칙은 변동률 외에 기술적 지표(<지표>_rsi, <지표>_zscore, utils/indicators.py)도
+참조할 수 있습니다.
+
+Streamlit에 의존하지 않으므로 백그라운드 작업에서도 사용할 수 있습니다.
+
+💡 팁:
+- 규칙 파일(config.SIGNAL_RULES_PATH)을 수정하면 다음 평가 때 자동으로 다시 읽습니다.
+================================================================================
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from config import SIGNAL_RULES_PATH
+from .indicators import indicator_features
+
+
+INSTRUMENTS = ("arabica", "robusta", "usd_krw", "freight")
+# 기술적 지표(RSI, Z-점수)를 규칙에 쓸 수 있는 지표
+INDICATOR_INSTRUMENTS = ("arabica", "robusta", "usd_krw")
+# 규칙이 참조할 수 있는 전체 특성 (변동률 + <지표>_rsi, <지표>_zscore)
+FEATURES = INSTRUMENTS + tuple(f"{name}_{kind}" for name in INDICATOR_INSTRUMENTS
+                               for kind in ("rsi", "zscore"))
+
+# 규칙 파일의 비교 연산 → NumPy 함수
+COMPARATORS = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+}
+
+
+# ===========================================
+# 1. 규칙 / 시그널 단계
+# ===========================================
+@dataclass(frozen=True)
+class SignalRule:
+    """규칙 하나: 지표 변동률(%)이 조건을 만족하면 점수에 delta를 더함"""
+    instrument: str
+    comparator: str
+    threshold: float
+    delta: float
+    message: str            # {pct}에 변동률이 들어감
+
+
+@dataclass(frozen=True)
+class SignalBand:
+    """점수 구간별 시그널 단계 (min_score 이상이면 해당 단계)"""
+    min_score: float
+    status: str
+    emoji: str
+    market_context: str
+    cpo_action: str
+
+
+class RuleSet:
+    """
+    컴파일된 규칙 묶음
+
+    Args:
+        rules: 규칙 목록
+        bands: 점수가 높은 단계부터 정렬된 단계 목록 (마지막은 하한 없음)
+        base_score: 기본 점수
+        instruments: 특성 행렬의 열 순서 (변동률, 기술적 지표)
+    """
+
+    def __init__(self, rules: Sequence[SignalRule], bands: Sequence[SignalBand],
+                 base_score: float = 50, instruments: Sequence[str] = FEATURES):
+        for rule in rules:
+            if rule.comparator not in COMPARATORS:
+                raise ValueError(f"지원하지 않는 비교 연산: {rule.comparator}")
+            if rule.instrument not in instruments:
+                raise ValueError(f"알 수 없는 지표: {rule.instrument}")
+
+        self.rules = tuple(rules)
+        self.bands = tuple(bands)
+        self.base_score = base_score
+        self.instruments = tuple(instruments)
+
+        # 컴파일: 규칙별 열 위치 / 임계값 / 가감점, 비교 연산별 규칙 위치
+        self._columns = np.array([self.instruments.index(r.instrument) for r in self.rules], dtype=int)
+        self._thresholds = np.array([r.threshold for r in self.rules], dtype=float)
+        self._deltas = np.array([r.delta for r in self.rules], dtype=float)
+        self._groups = [(COMPARATORS[op], np.array([i for i, r in enumerate(self.rules) if r.comparator == op]))
+                        for op in COMPARATORS if any(r.comparator == op for r in self.rules)]
+        # searchsorted용 오름차순 경계값 (가장 낮은 단계 제외)
+        self._band_edges = np.array([band.min_score for band in reversed(self.bands[:-1])])
+        self._statuses = np.array([band.status for band in self.bands])
+        self._emojis = np.array([band.emoji for band in self.bands])
+        # 기술적 지표를 참조하는 규칙이 있을 때만 지표를 계산
+        self.uses_indicators = any(r.instrument not in INSTRUMENTS for r in self.rules)
+
+    def with_rules(self, rules: Sequence[SignalRule]) -> "RuleSet":
+        """같은 단계/기본 점수에 규칙만 바꾼 새 묶음 (백테스트용)"""
+        return RuleSet(rules, self.bands, self.base_score, self.instruments)
+
+    # -------------------------------------------
+    # 평가
+    # -------------------------------------------
+    def masks(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        변동률 행렬에 모든 규칙을 한 번에 적용합니다.
+
+        Args:
+            matrix: (..., 지표 수) 변동률 배열 (NaN은 어떤 조건도 만족하지 않음)
+
+        Returns:
+            np.ndarray: (..., 규칙 수) 불리언 배열
+        """
+        values = np.asarray(matrix, dtype=float)[..., self._columns]
+        result = np.zeros(values.shape, dtype=bool)
+        for compare, idx in self._groups:
+            result[..., idx] = compare(values[..., idx], self._thresholds[idx])
+        return result
+
+    def score_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        """(..., 지표 수) 변동률 배열 → (...) 점수 배열"""
+        return self.base_score + self.masks(matrix).astype(float) @ self._deltas
+
+    def band_indices(self, score: np.ndarray) -> np.ndarray:
+        """점수 배열 → self.bands 인덱스 배열"""
+        return len(self.bands) - 1 - np.searchsorted(self._band_edges, score, side="right")
+
+    def band_for_score(self, score: float) -> SignalBand:
+        """점수에 해당하는 시그널 단계"""
+        return self.bands[int(self.band_indices(np.array([score]))[0])]
+
+    def to_matrix(self, change_pct: Mapping[str, np.ndarray]) -> np.ndarray:
+        """{특성: 값 배열} → (길이, 특성 수) 행렬 (없는 특성은 NaN)"""
+        length = len(next(iter(change_pct.values())))
+        return np.column_stack([
+            np.asarray(change_pct[name], dtype=float) if name in change_pct else np.full(length, np.nan)
+            for name in self.instruments
+        ])
+
+
+def _parse_band(item: dict) -> SignalBand:
+    min_score = item.get("min_score")
+    return SignalBand(-np.inf if min_score is None else float(min_score), item["status"],
+                      item["emoji"], item["market_context"], item["cpo_action"])
+
+
+def load_rule_set(path: str = SIGNAL_RULES_PATH) -> RuleSet:
+    """
+    규칙 파일(JSON)을 읽어 컴파일합니다.
+
+    Args:
+        path: 규칙 파일 경로
+
+    Returns:
+        RuleSet
+    """
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    rules = [SignalRule(r["instrument"], r["comparator"], float(r["threshold"]),
+                        float(r["delta"]), r["message"]) for r in spec["rules"]]
+    bands = sorted((_parse_band(b) for b in spec["bands"]), key=lambda b: b.min_score, reverse=True)
+    return RuleSet(rules, bands, float(spec.get("base_score", 50)))
+
+
+_rule_set: Optional[RuleSet] = None
+_rule_mtime: Optional[float] = None
+_rule_lock = threading.Lock()
+
+
+def get_rule_set() -> RuleSet:
+    """현재 규칙 묶음 (규칙 파일이 바뀌었으면 다시 읽음)"""
+    global _rule_set, _rule_mtime
+    mtime = os.path.getmtime(SIGNAL_RULES_PATH)
+    with _rule_lock:
+        if _rule_set is None or mtime != _rule_mtime:
+            _rule_set = load_rule_set(SIGNAL_RULES_PATH)
+            _rule_mtime = mtime
+        return _rule_set
+
+
+# ===========================================
+# 2. 단일 시점 점수 (오늘)
+# ===========================================
+def score_snapshot(change_pct: Mapping[str, float], rule_set: Optional[RuleSet] = None) -> Dict:
+    """
+    지표별 변동률로 오늘의 점수와 로직 트리거를 계산합니다.
+
+    Args:
+        change_pct: {지표 키: 변동률(%)} (+ 선택: {<지표>_rsi, <지표>_zscore: 최근 지표 값})
+        rule_set: 규칙 묶음 (None이면 규칙 파일)
+
+    Returns:
+        dict: {'score', 'band': SignalBand, 'triggers': [문구, ...]}
+    """
+    rule_set = rule_set or get_rule_set()
+    row = rule_set.to_matrix({name: [pct] for name, pct in change_pct.items()})[0]
+    hits = rule_set.masks(row)
+    score = float(rule_set.base_score + hits.astype(float) @ rule_set._deltas)
+    triggers: List[str] = [
+        rule.message.format(pct=row[rule_set.instruments.index(rule.instrument)])
+        for rule, hit in zip(rule_set.rules, hits) if hit
+    ]
+    return {'score': score, 'band': rule_set.band_for_score(score), 'triggers': triggers}
+
+
+# ===========================================
+# 3. 전체 기간 / 여러 대상 점수 (벡터 연산)
+# ===========================================
+def score_changes(change_pct: Mapping[str, np.ndarray], rule_set: Optional[RuleSet] = None) -> np.ndarray:
+    """
+    지표별 변동률 배열로 날짜별 점수 배열을 계산합니다.
+
+    Args:
+        change_pct: {지표 키: 변동률(%) 배열} (모든 배열 길이 동일)
+        rule_set: 규칙 묶음 (None이면 규칙 파일, 백테스트에서 바꿔 넣음)
+
+    Returns:
+        np.ndarray: 날짜별 점수
+    """
+    rule_set = rule_set or get_rule_set()
+    return rule_set.score_matrix(rule_set.to_matrix(change_pct))
+
+
+def compute_signal_history(prices: pd.DataFrame, rule_set: Optional[RuleSet] = None) -> pd.DataFrame:
+    """
+    날짜별 가격 표로 전체 기간의 시그널 히스토리를 계산합니다.
+
+    Args:
+        prices: 날짜 인덱스 + arabica/robusta/usd_krw/freight 컬럼
+                (빈 날짜는 직전 값으로 채움)
+        rule_set: 규칙 묶음 (None이면 규칙 파일)
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스 + score, status, emoji, 지표별 변동률(<지표>_pct) 컬럼
+    """
+    rule_set = rule_set or get_rule_set()
+    prices = prices.reindex(columns=list(INSTRUMENTS)).sort_index().ffill()
+    changes = prices.pct_change(fill_method=None) * 100
+    columns = {name: changes[name].to_numpy() for name in INSTRUMENTS}
+    if rule_set.uses_indicators:
+        # 증분 지표 상태를 재사용 (새 날짜만 갱신)
+        columns.update(indicator_features(prices, INDICATOR_INSTRUMENTS, key="signal_history"))
+    score = rule_set.score_matrix(rule_set.to_matrix(columns))
+    band_idx = rule_set.band_indices(score)
+
+    history = pd.DataFrame({
+        'score': score,
+        'status': rule_set._statuses[band_idx],
+        'emoji': rule_set._emojis[band_idx],
+    }, index=prices.index)
+    for name in INSTRUMENTS:
+        history[f"{name}_pct"] = changes[name].to_numpy()
+    return history
+
+
+def score_panel(prices: Mapping[str, pd.DataFrame], rule_set: Optional[RuleSet] = None) -> pd.DataFrame:
+    """
+    여러 대상(산지, 시나리오 등)의 가격 표를 한 번에 점수화합니다.
+    모든 표를 날짜 기준으로 맞춰 (대상 수, 날짜 수, 지표 수) 배열 하나로 평가합니다.
+
+    Args:
+        prices: {대상 이름: 날짜 인덱스 + 지표 컬럼 가격 표}
+        rule_set: 규칙 묶음 (None이면 규칙 파일)
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스 × 대상 컬럼의 점수 표
+    """
+    rule_set = rule_set or get_rule_set()
+    names = list(prices)
+    dates = pd.DatetimeIndex(sorted(set().union(*(df.index for df in prices.values()))))
+
+    def features(name: str) -> np.ndarray:
+        frame = prices[name].reindex(index=dates, columns=list(INSTRUMENTS)).ffill()
+        columns = dict((frame.pct_change(fill_method=None) * 100).items())
+        if rule_set.uses_indicators:
+            columns.update(indicator_features(frame, INDICATOR_INSTRUMENTS, key=("panel", name)))
+        return rule_set.to_matrix(columns)
+
+    cube = np.stack([features(name) for name in names])
+    return pd.DataFrame(rule_set.score_matrix(cube).T, index=dates, columns=names)
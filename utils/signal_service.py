@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/signal_service.py - 시장 스냅샷 + 알고리즘 시그널 (Streamlit 비의존)
+================================================================================
+소싱 대시보드(tab1)와 시그널 알림 데몬(utils/alert_daemon.py)이 함께 쓰는
+"지표 4개 시세 조회 → 점수/단계 계산" 로직입니다.
+Streamlit을 import하지 않으므로 브라우저 없이 별도 프로세스에서 실행할 수 있습니다.
+
+💡 팁:
+- 점수 규칙은 utils/signal_engine.py(data/signal_rules.json)를 따릅니다.
+- 조회할 수 없는 지표는 더미 데이터로 대체하고 data_source에 표시합니다.
+================================================================================
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict
+
+from .market_providers import get_market_quotes, get_market_indicators, market_providers
+from .signal_engine import score_snapshot, INSTRUMENTS
+
+
+# ===========================================
+# 1. 시장 스냅샷
+# ===========================================
+@dataclass
+class MarketMetric:
+    """시장 지표 데이터 클래스"""
+    name: str
+    price: float
+    unit: str
+    change: float
+    change_pct: float
+
+
+def get_dummy_market_data() -> Dict:
+    """더미 시장 데이터 생성 (폴백용)"""
+    return {
+        'arabica': MarketMetric("ICE Arabica (NY)", 241.50, "¢/lb", -2.35, -0.96),
+        'robusta': MarketMetric("London Robusta", 4820.00, "$/MT", 15.50, 0.32),
+        'usd_krw': MarketMetric("USD/KRW Exchange Rate", 1382.50, "", 8.20, 0.60),
+        'freight': MarketMetric("Shanghai Freight Index", 1458, "points", -23, -1.55),
+        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S KST')
+    }
+
+
+def get_market_data_live() -> Dict:
+    """
+    실제 시장 데이터 로드 (utils/market_providers.py, 4개 지표 동시 조회)
+    API 장애 시 마지막 정상 시세를 '지연 데이터'로 표시하고,
+    조회할 수 없는 지표만 더미 데이터로 폴백
+    데이터 기준일이 오래된 지표(갱신되지 않는 운임지수 CSV 등)는
+    'outdated'에 {지표 키: 기준일}로 기록하고 실시간 데이터로 표시하지 않습니다.
+    """
+    quotes = get_market_quotes()
+    fallback = get_dummy_market_data()
+
+    metrics, missing, fetched_at, stale, outdated = {}, [], [], False, {}
+    for key, provider in market_providers.items():
+        quote = quotes.get(key)
+        if quote is None:
+            metrics[key] = fallback[key]
+            missing.append(provider.label)
+            continue
+        metrics[key] = MarketMetric(provider.label, quote.price, provider.unit,
+                                    quote.change, quote.change_pct)
+        fetched_at.append(quote.fetched_at)
+        stale = stale or quote.stale
+        if quote.outdated:
+            outdated[key] = quote.as_of.strftime('%Y-%m-%d')
+
+    if not fetched_at:
+        fallback['data_source'] = '⚠️ Fallback Data'
+        fallback['outdated'] = {}
+        return fallback
+
+    if missing:
+        data_source = f"⚠️ 일부 Fallback ({', '.join(missing)})"
+    elif stale:
+        data_source = '🕒 Stale Data (갱신 중)'
+    elif outdated:
+        labels = ', '.join(f"{market_providers[key].label} 기준일 {day}" for key, day in outdated.items())
+        data_source = f"📁 기준일 지연 ({labels})"
+    else:
+        data_source = '✅ Live Data'
+
+    metrics['last_updated'] = min(fetched_at).strftime('%Y-%m-%d %H:%M:%S KST')
+    metrics['data_source'] = data_source
+    metrics['outdated'] = outdated
+    return metrics
+
+
+# ===========================================
+# 2. 알고리즘 시그널
+# ===========================================
+def generate_algorithmic_signal(market_data: Dict) -> Dict:
+    """
+    알고리즘 시그널 생성 (점수 규칙은 utils/signal_engine.py와 공유)
+
+    Args:
+        market_data: get_market_data_live() 결과
+
+    Returns:
+        dict: signal_status, signal_emoji, signal_strength, logic_triggers,
+              market_context, cpo_action, timestamp
+    """
+    # 기준일이 오래된 지표의 변동률은 오늘 시그널에 반영하지 않음 (NaN은 어떤 규칙도 만족하지 않음)
+    outdated = market_data.get('outdated', {})
+    features = {key: float('nan') if key in outdated else market_data[key].change_pct
+                for key in INSTRUMENTS}
+    # 기술적 지표 규칙용 최근 RSI / Z-점수 (일별 종가 기준, 증분 갱신)
+    for key, values in get_market_indicators().items():
+        features[f"{key}_rsi"] = values['rsi']
+        features[f"{key}_zscore"] = values['zscore']
+    snapshot = score_snapshot(features)
+    band = snapshot['band']
+    logic_triggers = snapshot['triggers'] or ["현재 시장은 중립 상태입니다."]
+
+    return {
+        'signal_status': band.status,
+        'signal_emoji': band.emoji,
+        'signal_strength': snapshot['score'],
+        'logic_triggers': logic_triggers,
+        'market_context': band.market_context,
+        'cpo_action': band.cpo_action,
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S KST')
+    }
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/tariff_index.py - 관세율 색인 (국가 × HS 코드 × 적용일)
+================================================================================
+관세율표(data/tariff_schedule.csv)를 (국가, HS 코드) 키 사전으로 색인해
+원가 계산기와 일괄 계산 엔진이 관세율을 직접 입력하지 않고 조회하도록 합니다.
+
+- 조회: 사전 조회 1번 + 적용기간 이분 탐색 (키당 기간은 보통 1~2개)
+- HS 코드는 숫자만 사용하며 10 → 8 → 6 → 4자리 순으로 가장 구체적인 세율을 찾습니다
+  (예: "0901.11-0000" → 0901110000, 09011100, 090111, 0901)
+- 국가별 세율이 없으면 국가 "*" 행(기본세율)을 사용합니다.
+- 국가 이름은 한글/영문(get_coffee_origins()의 country_en) 모두 인식합니다.
+- 일괄 계산은 (국가, HS, 날짜) 고유 조합만 조회한 뒤 배열로 펼칩니다.
+
+💡 팁:
+- 관세율표 CSV에 행을 추가하면 전체 관세율표(HSK 10단위)로 확장됩니다.
+  파일이 바뀌면 다음 조회 때 자동으로 다시 읽습니다.
+- final_rate가 비어 있으면 기본/FTA/할당관세 중 가장 낮은 세율을 사용합니다.
+================================================================================
+"""
+
+import bisect
+import os
+import re
+import threading
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import TARIFF_SCHEDULE_PATH, get_coffee_origins
+
+
+HS_LEVELS = (10, 8, 6, 4)
+ANY_COUNTRY = "*"
+
+
+def normalize_hs(code) -> str:
+    """HS 코드에서 숫자만 남깁니다 ("0901.11-0000" → "0901110000")."""
+    return re.sub(r"\D", "", str(code))
+
+
+def _country_key(name) -> str:
+    return str(name).strip().casefold()
+
+
+def _optional_rate(value) -> Optional[float]:
+    return None if pd.isna(value) else float(value)
+
+
+def _to_day(on) -> pd.Timestamp:
+    """적용일 해석 (None은 오늘, 잘못된 날짜는 NaT)"""
+    day = pd.to_datetime(date.today() if on is None else on, errors="coerce")
+    return pd.NaT if pd.isna(day) else day.normalize()
+
+
+def parse_dates(values) -> np.ndarray:
+    """
+    날짜 배열을 해석합니다 (고유값만 변환한 뒤 펼침).
+
+    Returns:
+        np.ndarray: datetime64 배열 (빈 값이나 "2025/13/45" 같은 잘못된 날짜는 NaT)
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    parsed = [pd.NaT if pd.isna(v) or not str(v).strip() else pd.to_datetime(v, errors="coerce")
+              for v in uniques]
+    # 빈 값(NaN)은 factorize 코드가 -1 → 마지막 자리의 NaT
+    return pd.DatetimeIndex(parsed + [pd.NaT]).normalize().to_numpy()[codes]
+
+
+def _day_keys(values) -> np.ndarray:
+    """날짜 배열 → 조회 키 ("YYYY-MM-DD", 빈 값 "", 잘못된 날짜 "?")"""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    keys = []
+    for v in uniques:
+        if pd.isna(v) or not str(v).strip():
+            keys.append("")
+            continue
+        day = _to_day(v)
+        keys.append("?" if pd.isna(day) else day.strftime("%Y-%m-%d"))
+    return np.array(keys + [""], dtype=object)[codes]
+
+
+@dataclass(frozen=True)
+class TariffRate:
+    """(국가, HS 코드, 적용기간)별 관세율 (%)"""
+    country: str
+    hs_code: str
+    item: str
+    base_rate: float
+    fta_rate: Optional[float]       # None: FTA 미체결
+    quota_rate: Optional[float]     # None: 할당관세 없음
+    final_rate: float
+    note: str
+
+
+# ===========================================
+# 1. 색인
+# ===========================================
+class TariffIndex:
+    """(국가, HS 코드) → 적용기간별 관세율 색인"""
+
+    def __init__(self, schedule: pd.DataFrame):
+        """
+        Args:
+            schedule: 관세율표 (country, hs_code, base_rate 필수 /
+                      item, fta_rate, quota_rate, final_rate, valid_from, valid_to, note, region 선택)
+        """
+        df = schedule.copy()
+        for column in ("fta_rate", "quota_rate", "final_rate", "valid_from", "valid_to"):
+            if column not in df.columns:
+                df[column] = np.nan
+        for column in ("item", "note", "region"):
+            df[column] = df[column].fillna("").astype(str) if column in df.columns else ""
+        for column in ("base_rate", "fta_rate", "quota_rate", "final_rate"):
+            df[column] = pd.to_numeric(df[column], errors="coerce")
+        df["final_rate"] = df["final_rate"].fillna(df[["base_rate", "fta_rate", "quota_rate"]].min(axis=1))
+        df["valid_from"] = pd.to_datetime(df["valid_from"]).fillna(pd.Timestamp.min)
+        df["valid_to"] = pd.to_datetime(df["valid_to"]).fillna(pd.Timestamp.max)
+        self.schedule = df
+
+        # 키별 (시작일 목록, (종료일, 세율) 목록) - 시작일 순 정렬
+        self._index: Dict[Tuple[str, str], Tuple[List[pd.Timestamp], List[Tuple[pd.Timestamp, TariffRate]]]] = {}
+        for row in df.sort_values("valid_from").itertuples(index=False):
+            rate = TariffRate(row.country, str(row.hs_code), row.item, float(row.base_rate),
+                              _optional_rate(row.fta_rate), _optional_rate(row.quota_rate),
+                              float(row.final_rate), row.note)
+            starts, periods = self._index.setdefault((_country_key(row.country), normalize_hs(row.hs_code)), ([], []))
+            starts.append(row.valid_from)
+            periods.append((row.valid_to, rate))
+
+        # 영문 국가명 → 관세율표 국가명 (get_coffee_origins 기준)
+        self._aliases = {_country_key(info.get("country_en", name)): _country_key(name)
+                         for name, info in get_coffee_origins().items()}
+
+    @property
+    def countries(self) -> List[str]:
+        """국가별 세율이 있는 국가 목록 (기본세율 "*" 제외)"""
+        return sorted(set(self.schedule["country"]) - {ANY_COUNTRY})
+
+    @property
+    def hs_codes(self) -> List[str]:
+        """관세율표의 HS 코드 목록"""
+        return sorted(set(self.schedule["hs_code"].astype(str)))
+
+    def current(self, on=None) -> pd.DataFrame:
+        """해당 날짜(기본 오늘)에 유효한 관세율표 행 (잘못된 날짜면 빈 표)"""
+        day = _to_day(on)
+        df = self.schedule
+        return df[(df["valid_from"] <= day) & (df["valid_to"] >= day)].reset_index(drop=True)
+
+    # ===========================================
+    # 2. 조회
+    # ===========================================
+    def _at(self, key: Tuple[str, str], day: pd.Timestamp) -> Optional[TariffRate]:
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        starts, periods = entry
+        pos = bisect.bisect_right(starts, day) - 1
+        if pos < 0 or periods[pos][0] < day:
+            return None
+        return periods[pos][1]
+
+    def lookup(self, country, hs_code, on=None) -> Optional[TariffRate]:
+        """
+        관세율 조회
+
+        Args:
+            country: 국가 이름 (한글 또는 영문)
+            hs_code: HS 코드 (점/하이픈 포함 가능)
+            on: 적용일 (기본 오늘)
+
+        Returns:
+            TariffRate (해당 세율이 없거나 날짜가 잘못되었으면 None)
+        """
+        day = _to_day(on)
+        if pd.isna(day):
+            return None
+        name = _country_key(country)
+        name = self._aliases.get(name, name)
+        digits = normalize_hs(hs_code)
+        for key_country in (name, ANY_COUNTRY):
+            for level in HS_LEVELS:
+                if len(digits) < level:
+                    continue
+                rate = self._at((key_country, digits[:level]), day)
+                if rate is not None:
+                    return rate
+        return None
+
+    def duty_rates(self, countries, hs_codes, dates=None) -> np.ndarray:
+        """
+        여러 행의 최종 관세율(%)을 한 번에 조회합니다 (고유 조합만 조회 후 배열로 펼침).
+
+        Args:
+            countries: 국가 배열
+            hs_codes: HS 코드 배열 (또는 코드 1개)
+            dates: 적용일 배열 (빈 값은 오늘)
+
+        Returns:
+            np.ndarray: 최종 관세율 (찾지 못했거나 날짜가 잘못되었으면 NaN)
+        """
+        keys = pd.DataFrame({"country": pd.Series(countries, dtype=object).fillna("").to_numpy()})
+        keys["hs"] = hs_codes if np.ndim(hs_codes) == 0 else pd.Series(hs_codes, dtype=object).fillna("").to_numpy()
+        # 날짜는 고유값에서만 해석 (빈 값은 "" → 오늘, 잘못된 날짜는 "?" → 조회하지 않음)
+        keys["day"] = "" if dates is None else _day_keys(dates)
+
+        groups = keys.groupby(["country", "hs", "day"], sort=False)
+        codes = groups.ngroup().to_numpy()
+        rates = np.array([
+            np.nan if day == "?" or (rate := self.lookup(country, hs, day or None)) is None else rate.final_rate
+            for country, hs, day in groups.head(1).itertuples(index=False)
+        ], dtype=float)
+        return rates[codes]
+
+
+def load_tariff_index(path: str = TARIFF_SCHEDULE_PATH) -> TariffIndex:
+    """관세율표 CSV를 읽어 색인합니다."""
+    return TariffIndex(pd.read_csv(path, dtype={"hs_code": str}, encoding="utf-8-sig"))
+
+
+_tariff_index: Optional[TariffIndex] = None
+_tariff_mtime: Optional[float] = None
+_tariff_lock = threading.Lock()
+
+
+def get_tariff_index() -> TariffIndex:
+    """현재 관세율 색인 (관세율표 파일이 바뀌었으면 다시 읽음)"""
+    global _tariff_index, _tariff_mtime
+    mtime = os.path.getmtime(TARIFF_SCHEDULE_PATH)
+    with _tariff_lock:
+        if _tariff_index is None or mtime != _tariff_mtime:
+            _tariff_index = load_tariff_index(TARIFF_SCHEDULE_PATH)
+            _tariff_mtime = mtime
+        return _tariff_index
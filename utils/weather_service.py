@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+================================================================================
+📁 utils/weather_service.py - 선적항 날씨 일괄 조회 서비스
+================================================================================
+get_coffee_origins()의 모든 선적항 날씨를 OpenWeatherMap group API 한 번으로
+받아 공용 캐시(소스: weather, 기본 15분)에 저장합니다.
+tab2 제안서, 랜딩 페이지, tab5 체크리스트가 모두 이 캐시를 읽으므로
+재실행/슬라이더 조작마다 날씨를 다시 받지 않습니다.
+
+group API는 도시 이름이 아닌 도시 ID를 받으므로, 처음 한 번만 도시 이름으로
+ID를 조회해 캐시(소스: weather_city_id, 디스크 보관)에 저장해 둡니다.
+
+💡 팁:
+- 갱신 주기는 config.py의 CACHE_TTL["weather"]에서 조정합니다.
+- 선적항 목록에 없는 도시는 도시 이름으로 개별 조회합니다.
+================================================================================
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Tuple
+
+from config import WEATHER_API_KEY, get_coffee_origins
+from .market_cache import market_cache, make_key
+from .http_client import http_get
+
+
+WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
+GROUP_URL = "https://api.openweathermap.org/data/2.5/group"
+
+# group API 한 번에 넣을 수 있는 최대 도시 수
+GROUP_MAX_IDS = 20
+
+WEATHER_DESC_KO = {
+    'clear sky': '맑음',
+    'few clouds': '구름 조금',
+    'scattered clouds': '구름 낌',
+    'broken clouds': '구름 많음',
+    'overcast clouds': '흐림',
+    'light rain': '약한 비',
+    'moderate rain': '비',
+    'heavy intensity rain': '강한 비',
+    'thunderstorm': '뇌우',
+    'snow': '눈',
+    'mist': '안개',
+    'haze': '연무'
+}
+
+NO_KEY_WEATHER = {'temp': 0, 'desc_ko': "API키 없음", 'desc_en': "No API Key"}
+NOT_FOUND_WEATHER = {'temp': 0, 'desc_ko': "정보 없음", 'desc_en': "No Info"}
+ERROR_WEATHER = {'temp': 0, 'desc_ko': "수신 불가", 'desc_en': "Error"}
+
+
+class WeatherNotFoundError(Exception):
+    """OpenWeatherMap이 도시 정보를 돌려주지 않은 경우"""
+
+
+# ===========================================
+# 1. OpenWeatherMap 응답 처리
+# ===========================================
+def _parse_weather(res: dict) -> dict:
+    """OpenWeatherMap 도시 응답을 {'temp', 'desc_ko', 'desc_en'}로 변환합니다."""
+    desc_en = res['weather'][0]['description']
+    # 영문 → 한글 변환
+    desc_ko = WEATHER_DESC_KO.get(desc_en, desc_en)
+    return {'temp': res['main']['temp'], 'desc_ko': desc_ko, 'desc_en': desc_en}
+
+
+def _fetch_city(city_name: str) -> Tuple[int, dict]:
+    """
+    도시 이름으로 날씨를 조회합니다 (실패 시 예외).
+
+    Returns:
+        tuple: (OpenWeatherMap 도시 ID, 날씨 dict)
+    """
+    params = {"q": city_name, "appid": WEATHER_API_KEY, "units": "metric", "lang": "en"}
+    res = http_get(WEATHER_URL, params=params).json()
+    if res.get('cod') != 200:
+        raise WeatherNotFoundError(city_name)
+    return res['id'], _parse_weather(res)
+
+
+def _fetch_group(city_ids: Iterable[int]) -> Dict[int, dict]:
+    """도시 ID 묶음의 날씨를 group API로 조회합니다 (ID당 1회가 아닌 묶음당 1회)."""
+    city_ids = list(city_ids)
+    weather = {}
+    for i in range(0, len(city_ids), GROUP_MAX_IDS):
+        chunk = city_ids[i:i + GROUP_MAX_IDS]
+        params = {"id": ",".join(str(cid) for cid in chunk), "appid": WEATHER_API_KEY,
+                  "units": "metric", "lang": "en"}
+        response = http_get(GROUP_URL, params=params)
+        response.raise_for_status()
+        for item in response.json().get('list', []):
+            weather[item['id']] = _parse_weather(item)
+    return weather
+
+
+# ===========================================
+# 2. 도시 ID 확인 (최초 1회)
+# ===========================================
+def _resolve_city_ids(ports: Iterable[str]) -> Tuple[Dict[str, int], Dict[str, dict]]:
+    """
+    선적항별 도시 ID를 반환합니다. 캐시에 없는 항구만 동시에 이름으로 조회합니다.
+
+    Returns:
+        tuple: ({항구: 도시 ID}, {항구: ID 조회 중 함께 받은 날씨})
+    """
+    ids, fresh_weather, missing = {}, {}, []
+    for port in ports:
+        city_id = market_cache.get("weather_city_id", make_key(city=port))
+        if city_id is None:
+            missing.append(port)
+        else:
+            ids[port] = city_id
+
+    if missing:
+        def lookup(port):
+            try:
+                return port, _fetch_city(port)
+            except WeatherNotFoundError:
+                return port, None
+
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            for port, found in pool.map(lookup, missing):
+                if found is None:
+                    continue
+                city_id, weather = found
+                market_cache.set("weather_city_id", make_key(city=port), city_id)
+                ids[port] = city_id
+                fresh_weather[port] = weather
+    return ids, fresh_weather
+
+
+# ===========================================
+# 3. 선적항 날씨 조회 (공용 캐시)
+# ===========================================
+def get_origin_ports() -> Tuple[str, ...]:
+    """모든 산지의 선적항 이름 (정렬, 중복 제거)"""
+    return tuple(sorted({info['port'] for info in get_coffee_origins().values()}))
+
+
+def _fetch_port_weather(ports: Tuple[str, ...]) -> Dict[str, dict]:
+    ids, weather = _resolve_city_ids(ports)
+    pending = {city_id: port for port, city_id in ids.items() if port not in weather}
+    if pending:
+        by_id = _fetch_group(pending)
+        for city_id, port in pending.items():
+            if city_id in by_id:
+                weather[port] = by_id[city_id]
+    if not weather:
+        raise WeatherNotFoundError(", ".join(ports))
+    return weather
+
+
+def get_port_weather_map(force: bool = False) -> Dict[str, dict]:
+    """
+    모든 선적항 날씨를 한 번에 조회합니다 (공용 캐시, 소스: weather).
+
+    Args:
+        force: True면 캐시를 무시하고 새로 받아 교체 (백그라운드 갱신용)
+
+    Returns:
+        dict: {항구 이름: {'temp', 'desc_ko', 'desc_en'}} (실패 시 예외)
+    """
+    ports = get_origin_ports()
+    return market_cache.get_or_fetch("weather", make_key(ports=ports),
+                                     lambda: _fetch_port_weather(ports), force=force)
+
+
+def get_port_weather(city_name: str) -> dict:
+    """
+    도시(선적항) 날씨를 반환합니다. 선적항이면 일괄 조회 결과에서 꺼내고,
+    목록에 없는 도시는 이름으로 개별 조회합니다.
+
+    Args:
+        city_name: 도시 이름 (영문)
+
+    Returns:
+        dict: {'temp': 온도, 'desc_ko': 한글 설명, 'desc_en': 영문 설명}
+    """
+    if not WEATHER_API_KEY:
+        return dict(NO_KEY_WEATHER)
+    try:
+        if city_name in get_origin_ports():
+            return get_port_weather_map().get(city_name, dict(NOT_FOUND_WEATHER))
+        return market_cache.get_or_fetch("weather", make_key(city=city_name),
+                                         lambda: _fetch_city(city_name)[1])
+    except WeatherNotFoundError:
+        return dict(NOT_FOUND_WEATHER)
+    except Exception:
+        return dict(ERROR_WEATHER)
@@ -13,8 +13,14 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # 외부 모듈 임포트 (기존 코드 유지)
 try:
-    from config import get_coffee_origins, COLOR_PRIMARY, COLOR_SECONDARY
-    from utils import get_exchange_rate, get_market_data, get_current_local_rate, get_history_rate
+    from config import (
+        get_coffee_origins, COLOR_PRIMARY, COLOR_SECONDARY, PAGE_LOAD_DEADLINE_SEC, METRIC_REFRESH_SEC
+    )
+    from utils import (
+        get_exchange_rate_info, get_market_data, get_current_local_rate, get_history_rate,
+        get_quotes_freshness, get_batch_tickers, sync_history, gather_with_deadline,
+        get_country_weather
+    )
 except ImportError:
     # 더미 데이터 및 설정 (Import 실패 시 대비)
     COLOR_PRIMARY = "#4B2C20"
@@ -23,10 +29,102 @@ except ImportError:
         return {
             "에티오피아": {"lat": 9.145, "lon": 40.4896, "desc": "커피의 고향", "hs_code": "0901.11", "port": "Djibouti", "lead_time": "45 days", "currency": "ETB", "docs": ["B/L", "Invoice"]}
         }
-    def get_exchange_rate(): return 1350.0
+    def get_exchange_rate_info(): return {'rate': 1350.0, 'fetched_at': None, 'stale': True}
     def get_market_data(ticker): return 250.0, 1.5
     def get_current_local_rate(curr): return 56.0
     def get_history_rate(curr, p): return None
+    def get_quotes_freshness(): return {'fetched_at': None, 'stale': True}
+    PAGE_LOAD_DEADLINE_SEC = 6.0
+    METRIC_REFRESH_SEC = 30
+    def get_batch_tickers(): return []
+    def sync_history(tickers, force=False): return 0
+    def get_country_weather(city): return {'temp': 20, 'desc_ko': '맑음', 'desc_en': 'Clear'}
+    def gather_with_deadline(jobs, deadline, defaults=None):
+        return {name: job() for name, job in jobs.items()}
+
+@st.fragment(run_every=METRIC_REFRESH_SEC or None)
+def render_top_metrics():
+    """
+    상단 메트릭 타일 (환율, ICE Arabica)
+    METRIC_REFRESH_SEC마다 이 함수만 다시 실행되며, 값은 공용 시장 캐시에서 읽습니다.
+    (지도, 정보 패널, CSS는 다시 그리지 않음)
+    """
+    # 공용 캐시가 데워져 있으면 바로 반환, 갱신이 늦으면 직전에 표시한 값을 유지
+    # (시세 기준 시각도 배치 시세 조회를 기다릴 수 있으므로 같은 마감 시간 안에서 조회)
+    last = {
+        'krw': {'rate': 1445.0, 'fetched_at': None, 'stale': True},
+        'coffee': (0.0, 0.0),
+        'quotes': {'fetched_at': None, 'stale': True},
+        **st.session_state.get('landing_metrics', {}),
+    }
+    loaded = gather_with_deadline(
+        {
+            'krw': get_exchange_rate_info,
+            'coffee': lambda: get_market_data("KC=F"),
+            'quotes': get_quotes_freshness,
+        },
+        deadline=1.0,
+        defaults=last
+    )
+    st.session_state['landing_metrics'] = loaded
+    krw_info = loaded['krw']
+    current_krw_rate = krw_info['rate']
+    coffee_p, coffee_c = loaded['coffee']
+    quotes_info = loaded['quotes']
+
+    usd_arrow = "↔"
+    usd_color = "#2E7D32"
+    usd_bg = "#E8F5E9"
+    usd_label = "Real-time"
+
+    # API 장애 시 마지막 정상값을 보여주므로 기준 시각을 함께 표시
+    if krw_info['stale']:
+        usd_arrow = "🕒"
+        usd_color = "#F57C00"
+        usd_bg = "#FFF3E0"
+        usd_label = f"{krw_info['fetched_at']:%m-%d %H:%M} 기준" if krw_info['fetched_at'] else "기본값"
+    ice_stale_note = ""
+    if quotes_info['stale'] and quotes_info['fetched_at']:
+        ice_stale_note = f" · 🕒 {quotes_info['fetched_at']:%m-%d %H:%M} 기준"
+
+    if coffee_c < 0:
+        ice_color = "#D32F2F"
+        ice_bg = "#FFEBEE"
+        ice_arrow = "▼"
+    else:
+        ice_color = "#2E7D32"
+        ice_bg = "#E8F5E9"
+        ice_arrow = "▲"
+
+    # [수정됨] st.columns를 사용하여 두 박스를 물리적으로 분리
+    m_col1, m_col2 = st.columns(2)
+
+    with m_col1:
+        st.markdown(f"""
+        <div class="metric-box">
+            <div class="metric-label">USD / KRW (오늘의 환율)</div>
+            <div class="metric-value">{current_krw_rate:,.1f} 원</div>
+            <div style="color: {usd_color}; font-size: 10px;">
+                <span class="delta-badge" style="background-color: {usd_bg};">
+                    {usd_arrow} {usd_label}
+                </span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with m_col2:
+        st.markdown(f"""
+        <div class="metric-box">
+            <div class="metric-label">ICE Arabica (NY) / 커피 시세</div>
+            <div class="metric-value">${coffee_p:,.2f}</div>
+            <div style="color: {ice_color}; font-size: 10px;">
+                <span class="delta-badge" style="background-color: {ice_bg};">
+                    {ice_arrow} {coffee_c:+.2f}%{ice_stale_note}
+                </span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
 
 def show():
     """
@@ -37,8 +135,23 @@ def show():
     # ===========================================
     try:
         data = get_coffee_origins()
-        current_krw_rate = get_exchange_rate()
-        coffee_p, coffee_c = get_market_data("KC=F")
+        # 필요한 조회를 한꺼번에 시작하고 전체 마감 시간 하나로 기다림
+        # (KC=F 조회가 KRW=X와 모든 산지 통화를 한 번에 받으므로 산지 환율은 이후 캐시에서 처리)
+        loaded = gather_with_deadline(
+            {
+                'krw': get_exchange_rate_info,
+                'coffee': lambda: get_market_data("KC=F"),
+                # 지도 클릭 후 바로 그릴 수 있도록 히스토리 저장소도 미리 갱신 (마감 후에도 계속 진행)
+                'history': lambda: sync_history(get_batch_tickers()),
+            },
+            deadline=PAGE_LOAD_DEADLINE_SEC,
+            defaults={
+                'krw': {'rate': 1445.0, 'fetched_at': None, 'stale': True},
+                'coffee': (0.0, 0.0),
+            }
+        )
+        # 상단 메트릭 타일의 첫 값 (이후 갱신이 늦으면 직전 값을 유지)
+        st.session_state['landing_metrics'] = {'krw': loaded['krw'], 'coffee': loaded['coffee']}
     except Exception:
         st.error("데이터를 불러오는 중 에러가 발생했습니다.")
         return
@@ -50,22 +163,6 @@ def show():
     st.markdown(" ")
     st.markdown(" ")
     
-    # ===========================================
-    # 3. 상단 메트릭
-    # ===========================================
-    usd_arrow = "↔"
-    usd_color = "#2E7D32"
-    usd_bg = "#E8F5E9"
-
-    if coffee_c < 0:
-        ice_color = "#D32F2F"
-        ice_bg = "#FFEBEE"
-        ice_arrow = "▼"
-    else:
-        ice_color = "#2E7D32"
-        ice_bg = "#E8F5E9"
-        ice_arrow = "▲"
-
     # [수정됨] CSS 스타일 정의 (박스 디자인 및 안내창 스타일)
     st.markdown(f"""
     <style>
@@ -108,34 +205,10 @@ def show():
     </style>
     """, unsafe_allow_html=True)
 
-    # [수정됨] st.columns를 사용하여 두 박스를 물리적으로 분리
-    m_col1, m_col2 = st.columns(2)
-
-    with m_col1:
-        st.markdown(f"""
-        <div class="metric-box">
-            <div class="metric-label">USD / KRW (오늘의 환율)</div>
-            <div class="metric-value">{current_krw_rate:,.1f} 원</div>
-            <div style="color: {usd_color}; font-size: 10px;">
-                <span class="delta-badge" style="background-color: {usd_bg};">
-                    {usd_arrow} Real-time
-                </span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with m_col2:
-        st.markdown(f"""
-        <div class="metric-box">
-            <div class="metric-label">ICE Arabica (NY) / 커피 시세</div>
-            <div class="metric-value">${coffee_p:,.2f}</div>
-            <div style="color: {ice_color}; font-size: 10px;">
-                <span class="delta-badge" style="background-color: {ice_bg};">
-                    {ice_arrow} {coffee_c:+.2f}%
-                </span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    # ===========================================
+    # 3. 상단 메트릭 (일정 주기로 이 부분만 다시 그림)
+    # ===========================================
+    render_top_metrics()
 
     # ===========================================
     # 4. 메인 레이아웃 (지도 | 정보 패널)
@@ -180,15 +253,30 @@ def show():
             st.markdown(f"<h3 style='color: {COLOR_SECONDARY}; margin-top: 0;'> {selected_country}</h3>", unsafe_allow_html=True)
             st.markdown(f"**• 특징:**\n\n{info['desc']}", unsafe_allow_html=True)
 
+            # 현재 환율, 히스토리 차트, 선적항 날씨를 동시에 조회
+            # (기간 라디오 값은 재실행 전에 세션에 반영되어 있으므로 먼저 읽어서 사용)
+            selected_period = st.session_state.get("landing_period", "1y")
+            country_data = gather_with_deadline(
+                {
+                    'local_rate': lambda: get_current_local_rate(info['currency']),
+                    'fig': lambda: get_history_rate(info['currency'], selected_period),
+                    'weather': lambda: get_country_weather(info['port']),
+                },
+                deadline=PAGE_LOAD_DEADLINE_SEC,
+                defaults={'weather': {'temp': 0, 'desc_ko': "수신 불가", 'desc_en': "Error"}}
+            )
+            port_weather = country_data['weather']
+
             details = pd.DataFrame({
-                "Trade Item / 항목": ["HS Code / 세번부호", "Loading Port / 선적항", "Lead Time / 리드타임"],
-                "Details / 상세내용": [info['hs_code'], info['port'], info['lead_time']]
+                "Trade Item / 항목": ["HS Code / 세번부호", "Loading Port / 선적항", "Port Weather / 선적항 날씨", "Lead Time / 리드타임"],
+                "Details / 상세내용": [info['hs_code'], info['port'],
+                                    f"{port_weather['temp']}°C, {port_weather['desc_ko']}", info['lead_time']]
             })
             details.index = details.index + 1
             st.table(details)
             
             st.write("**• 환율 변동 내역:**")
-            local_rate = get_current_local_rate(info['currency'])
+            local_rate = country_data['local_rate']
             if local_rate:
                 st.markdown(f"""
                 <div style="background-color: #E8F5E9; padding: 12px; border-radius: 8px; text-align: center; font-weight: 600; color: #2E7D32;">
@@ -200,9 +288,9 @@ def show():
             c1, c2 = st.columns([4, 6])
             with c1: st.markdown("**• 기간 선택:**")
             with c2:
-                selected_period = st.radio("", ["1y", "5y", "10y", "max"], horizontal=True, key="landing_period")
+                st.radio("", ["1y", "5y", "10y", "max"], horizontal=True, key="landing_period")
 
-            fig = get_history_rate(info['currency'], selected_period)
+            fig = country_data['fig']
             if fig: st.plotly_chart(fig, use_container_width=True)
             
             st.write("**• 필수 서류:**")
@@ -23,39 +23,35 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import (
     COLOR_PRIMARY, COLOR_SUCCESS, COLOR_WARNING, COLOR_RISK,
-    PERIOD_LABELS
+    PERIOD_LABELS, ALERT_MAX_AGE_SEC, METRIC_REFRESH_SEC
 )
+from utils import get_chart_series, get_market_history, indicator_book
+from utils.signal_engine import compute_signal_history, get_rule_set
+# 시세 조회 / 시그널 계산은 알림 데몬과 공유 (Streamlit 비의존)
+from utils.signal_service import (
+    MarketMetric, get_market_data_live, generate_algorithmic_signal
+)
+from utils.alert_log import alert_log
 
 
 # ===========================================
 # 데이터 클래스 정의
 # ===========================================
-@dataclass
-class MarketMetric:
-    """시장 지표 데이터 클래스"""
-    name: str
-    price: float
-    unit: str
-    change: float
-    change_pct: float
-
-
 @dataclass
 class ChartConfig:
-    """차트 설정 데이터 클래스"""
+    """차트 설정 데이터 클래스 (기본 시리즈를 freq 봉으로 묶은 뒤 마지막 periods개)"""
     periods: int
     freq: str
-    volatility: float
 
 
-# 기간별 설정
+# 기간별 설정 (모든 기간은 같은 기본 시리즈에서 파생)
 PERIOD_CONFIG = {
-    '1D': ChartConfig(24, 'H', 0.3),
-    '1W': ChartConfig(7, 'D', 0.8),
-    '1M': ChartConfig(30, 'D', 1.2),
-    '6M': ChartConfig(26, 'W', 2.5),
-    '1Y': ChartConfig(52, 'W', 3.5),
-    '3Y': ChartConfig(36, 'M', 5.0)
+    '1D': ChartConfig(24, 'h'),
+    '1W': ChartConfig(7, 'D'),
+    '1M': ChartConfig(30, 'D'),
+    '6M': ChartConfig(26, 'W'),
+    '1Y': ChartConfig(52, 'W'),
+    '3Y': ChartConfig(36, 'MS')
 }
 
 
@@ -174,119 +170,100 @@ def calculate_y_range(series: pd.Series, padding: float = 0.05) -> Tuple[float,
 # ===========================================
 # 데이터 생성 함수
 # ===========================================
-@st.cache_data(ttl=300)
-def get_dummy_market_data() -> Dict:
-    """더미 시장 데이터 생성 (폴백용)"""
-    return {
-        'arabica': MarketMetric("ICE Arabica (NY)", 241.50, "¢/lb", -2.35, -0.96),
-        'robusta': MarketMetric("London Robusta", 4820.00, "$/MT", 15.50, 0.32),
-        'usd_krw': MarketMetric("USD/KRW Exchange Rate", 1382.50, "", 8.20, 0.60),
-        'freight': MarketMetric("Shanghai Freight Index", 1458, "points", -23, -1.55),
-        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S KST')
-    }
+# 기본 시리즈: 가장 촘촘한 간격으로 3년치를 한 번 생성하고 모든 기간이 여기서 파생
+BASE_FREQ = 'h'
+BASE_SPAN_DAYS = 3 * 365 + 62   # 3Y(36개월 봉) + 첫 달이 잘리지 않도록 여유
+BASE_VOLATILITY = (0.35, 7.0)   # (Arabica, Robusta) 1시간당 변동성
+PRICE_BASES = (245.0, 4800.0)   # (Arabica ¢/lb, Robusta $/MT)
+PRICE_BAND = 0.15               # 기준가 대비 ±15% 범위로 제한
+PRICE_COLUMNS = ('arabica', 'robusta')
 
 
-@st.cache_data(ttl=300)
-def get_market_data_live() -> Dict:
+def generate_price_paths(n: int, bases: Tuple[float, ...], vols: Tuple[float, ...],
+                         seed: int = 42) -> np.ndarray:
     """
-    실제 시장 데이터 로드 (Yahoo Finance)
-    실패 시 더미 데이터로 자동 폴백
+    여러 시리즈의 랜덤워크 가격 경로를 한 번에 생성합니다 (반복문 없음).
+
+    Args:
+        n: 시점 개수
+        bases: 시리즈별 시작 가격
+        vols: 시리즈별 1스텝 변동성
+        seed: 난수 시드
+
+    Returns:
+        np.ndarray: (n, 시리즈 수) 가격 배열 (기준가 ±PRICE_BAND 안에서 반사)
     """
-    try:
-        import yfinance as yf
-        
-        # Arabica 선물 데이터
-        arabica_ticker = yf.Ticker("KC=F")
-        arabica_data = arabica_ticker.history(period="5d")
-        
-        if len(arabica_data) >= 2:
-            arabica_price = float(arabica_data['Close'].iloc[-1])
-            arabica_prev = float(arabica_data['Close'].iloc[-2])
-            arabica_change = arabica_price - arabica_prev
-            arabica_change_pct = (arabica_change / arabica_prev) * 100
-        else:
-            raise ValueError("Arabica 데이터 부족")
-        
-        # USD/KRW 환율
-        fx_ticker = yf.Ticker("KRW=X")
-        fx_data = fx_ticker.history(period="5d")
-        
-        if len(fx_data) >= 2:
-            fx_price = float(fx_data['Close'].iloc[-1])
-            fx_prev = float(fx_data['Close'].iloc[-2])
-            fx_change = fx_price - fx_prev
-            fx_change_pct = (fx_change / fx_prev) * 100
-        else:
-            raise ValueError("환율 데이터 부족")
-        
-        # Robusta 추정치
-        robusta_price = arabica_price * 0.55 * 50
-        robusta_change = arabica_change * 0.5
-        robusta_change_pct = arabica_change_pct * 0.8
-        
-        # Freight 고정값
-        freight_index = 1458
-        freight_change = -23
-        freight_change_pct = -1.55
-        
-        return {
-            'arabica': MarketMetric("ICE Arabica (NY)", arabica_price, "¢/lb", 
-                                   arabica_change, arabica_change_pct),
-            'robusta': MarketMetric("London Robusta", robusta_price, "$/MT", 
-                                   robusta_change, robusta_change_pct),
-            'usd_krw': MarketMetric("USD/KRW Exchange Rate", fx_price, "", 
-                                   fx_change, fx_change_pct),
-            'freight': MarketMetric("Shanghai Freight Index", freight_index, "points", 
-                                   freight_change, freight_change_pct),
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S KST'),
-            'data_source': '✅ Live Data'
-        }
-        
-    except Exception as e:
-        dummy_data = get_dummy_market_data()
-        dummy_data['data_source'] = '⚠️ Fallback Data'
-        return dummy_data
+    bases = np.asarray(bases, dtype=float)
+    rng = np.random.default_rng(seed)
+    shocks = rng.normal(0.0, np.asarray(vols, dtype=float) * 0.5, size=(n, len(bases)))
+    shocks[0] = 0.0
+    paths = bases + np.cumsum(shocks, axis=0)
+    # 경계에 붙어 평평해지지 않도록 밴드 경계에서 반사 (누적합을 접어서 한 번에 계산)
+    low, width = bases * (1 - PRICE_BAND), bases * 2 * PRICE_BAND
+    folded = np.mod(paths - low, 2 * width)
+    return low + np.where(folded > width, 2 * width - folded, folded)
+
+
+@st.cache_data(ttl=3600, max_entries=4, show_spinner=False)
+def get_base_price_series(end: pd.Timestamp, seed: int = 42, base_freq: str = BASE_FREQ) -> pd.DataFrame:
+    """
+    모든 기간 차트의 원본이 되는 기본 가격 시리즈 (끝 시각, 시드, 간격별 캐시)
+
+    Args:
+        end: 마지막 시점 (base_freq 단위로 내림한 현재 시각)
+        seed: 난수 시드
+        base_freq: 기본 간격 ('h' 기본, 'min'이면 약 160만 점)
 
+    Returns:
+        pd.DataFrame: 날짜 인덱스 + arabica, robusta 컬럼
+    """
+    dates = pd.date_range(start=end - pd.Timedelta(days=BASE_SPAN_DAYS), end=end, freq=base_freq)
+    # 간격이 달라도 1시간 변동성이 같도록 스텝 변동성을 조정
+    step_hours = pd.tseries.frequencies.to_offset(base_freq).nanos / 3.6e12
+    vols = tuple(v * np.sqrt(step_hours) for v in BASE_VOLATILITY)
+    prices = generate_price_paths(len(dates), PRICE_BASES, vols, seed)
+    return pd.DataFrame(prices, index=pd.DatetimeIndex(dates, name='date'), columns=list(PRICE_COLUMNS))
+
+
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def get_price_bars(freq: str, end: pd.Timestamp, seed: int = 42, base_freq: str = BASE_FREQ) -> pd.DataFrame:
+    """
+    기본 시리즈를 freq 봉으로 묶은 OHLC 표 (간격별 1회만 계산)
+
+    봉 경계가 기본 시리즈 전체 기준이므로 같은 간격의 기간끼리는
+    봉이 정확히 일치합니다 (예: 1W = 1M의 마지막 7일).
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스 + <컬럼>(종가), <컬럼>_open/_high/_low 컬럼
+    """
+    base = get_base_price_series(end, seed, base_freq)
+    # 봉 날짜는 시작 시점 기준 (진행 중인 주/월 봉이 미래 날짜로 찍히지 않도록)
+    ohlc = base.resample(freq, closed='left', label='left').agg(['first', 'max', 'min', 'last']).dropna()
+    bars = pd.DataFrame(index=ohlc.index)
+    for column in PRICE_COLUMNS:
+        bars[column] = ohlc[(column, 'last')]
+        bars[f'{column}_open'] = ohlc[(column, 'first')]
+        bars[f'{column}_high'] = ohlc[(column, 'max')]
+        bars[f'{column}_low'] = ohlc[(column, 'min')]
+    return bars
+
+
+def get_historical_data(period: str = '1M', seed: int = 42, base_freq: str = BASE_FREQ) -> pd.DataFrame:
+    """
+    기간별 히스토리 데이터 (공통 기본 시리즈의 봉에서 마지막 N개를 잘라냄)
+
+    Args:
+        period: 기간 코드 ('1D' ~ '3Y')
+        seed: 난수 시드
+        base_freq: 기본 시리즈 간격 (예: 'min'이면 3Y ≈ 160만 점을 봉으로 묶음)
 
-def get_historical_data(period: str = '1M') -> pd.DataFrame:
-    """기간별 히스토리 데이터 생성"""
+    Returns:
+        pd.DataFrame: date, arabica, robusta(종가) + <컬럼>_open/_high/_low 컬럼
+    """
     config = PERIOD_CONFIG[period]
-    
-    end_date = datetime.now()
-    dates = pd.date_range(end=end_date, periods=config.periods, freq=config.freq)
-    
-    arabica_base = 245
-    robusta_base = 4800
-    
-    volatility_map = {
-        '1D': (0.5, 15), '1W': (1.0, 25), '1M': (2.0, 40),
-        '6M': (5.0, 80), '1Y': (8.0, 120), '3Y': (15.0, 200)
-    }
-    arabica_vol, robusta_vol = volatility_map.get(period, (2.0, 40))
-    
-    np.random.seed(42)
-    
-    arabica_prices = [arabica_base]
-    robusta_prices = [robusta_base]
-    
-    for i in range(1, config.periods):
-        arabica_change = np.random.normal(0, arabica_vol * 0.5)
-        arabica_price = arabica_prices[-1] + arabica_change
-        arabica_price = max(arabica_base * 0.85, min(arabica_base * 1.15, arabica_price))
-        arabica_prices.append(arabica_price)
-        
-        robusta_change = np.random.normal(0, robusta_vol * 0.5)
-        robusta_price = robusta_prices[-1] + robusta_change
-        robusta_price = max(robusta_base * 0.85, min(robusta_base * 1.15, robusta_price))
-        robusta_prices.append(robusta_price)
-    
-    df = pd.DataFrame({
-        'date': dates,
-        'arabica': arabica_prices,
-        'robusta': robusta_prices
-    })
-    
-    return df.sort_values('date').reset_index(drop=True)
+    end = pd.Timestamp.now().floor(base_freq)
+    bars = get_price_bars(config.freq, end, seed, base_freq)
+    return bars.iloc[-config.periods:].reset_index()
 
 
 # ===========================================
@@ -301,88 +278,40 @@ def analyze_market_signal(change_pct: float) -> Tuple[str, str, str]:
     return "🟡", "YELLOW", "관망 - 변동성 제한적"
 
 
-def generate_algorithmic_signal(market_data: Dict) -> Dict:
-    """알고리즘 시그널 생성"""
-    arabica = market_data['arabica']
-    robusta = market_data['robusta']
-    fx = market_data['usd_krw']
-    freight = market_data['freight']
-    
-    # 점수 계산
-    signal_score = 50
-    logic_triggers = []
-    
-    # Arabica 가격 하락 → 매수 호기
-    if arabica.change_pct < -1.0:
-        signal_score += 15
-        logic_triggers.append(f"Arabica 가격 {arabica.change_pct:.2f}% 하락 (매수 적기)")
-    elif arabica.change_pct > 2.0:
-        signal_score -= 15
-        logic_triggers.append(f"Arabica 가격 {arabica.change_pct:.2f}% 급등 (신중)")
-    
-    # Robusta 가격
-    if robusta.change_pct < -1.0:
-        signal_score += 10
-        logic_triggers.append(f"Robusta 가격 {robusta.change_pct:.2f}% 하락")
-    elif robusta.change_pct > 2.0:
-        signal_score -= 10
-        logic_triggers.append(f"Robusta 가격 {robusta.change_pct:.2f}% 상승")
-    
-    # 환율 (원화 강세 = 유리)
-    if fx.change_pct < -0.5:
-        signal_score += 10
-        logic_triggers.append(f"원화 강세 {fx.change_pct:.2f}% (수입 유리)")
-    elif fx.change_pct > 1.0:
-        signal_score -= 10
-        logic_triggers.append(f"원화 약세 {fx.change_pct:.2f}% (비용 증가)")
-    
-    # 운임지수
-    if freight.change_pct < -1.0:
-        signal_score += 5
-        logic_triggers.append(f"운임지수 {freight.change_pct:.2f}% 하락")
-    elif freight.change_pct > 2.0:
-        signal_score -= 5
-        logic_triggers.append(f"운임지수 {freight.change_pct:.2f}% 상승")
-    
-    # 최종 신호 결정
-    if signal_score >= 75:
-        signal_status = "강력 매수"
-        signal_emoji = "🟢🟢"
-        market_context = "매우 유리한 시장 조건이 감지되었습니다."
-        cpo_action = "즉시 소싱 계약 추진 권장. 현재 가격 수준에서 대량 매입을 고려하십시오."
-    elif signal_score >= 60:
-        signal_status = "매수"
-        signal_emoji = "🟢"
-        market_context = "양호한 시장 조건입니다."
-        cpo_action = "1-2주 내 소싱 계약 체결을 권장합니다."
-    elif signal_score >= 45:
-        signal_status = "중립 관망"
-        signal_emoji = "🟡"
-        market_context = "시장이 균형 상태입니다."
-        cpo_action = "추가 시장 변동을 모니터링하면서 단계적 접근을 권장합니다."
-    elif signal_score >= 30:
-        signal_status = "주의"
-        signal_emoji = "🟠"
-        market_context = "불리한 시장 조건이 예상됩니다."
-        cpo_action = "소싱 결정을 1-2주 지연하거나 소량 계약만 진행하십시오."
-    else:
-        signal_status = "변동성 경고"
-        signal_emoji = "🔴"
-        market_context = "시장 변동성이 매우 높습니다."
-        cpo_action = "소싱 결정을 보류하고 시장 안정화를 기다리십시오."
-    
-    if not logic_triggers:
-        logic_triggers.append("현재 시장은 중립 상태입니다.")
-    
-    return {
-        'signal_status': signal_status,
-        'signal_emoji': signal_emoji,
-        'signal_strength': signal_score,
-        'logic_triggers': logic_triggers,
-        'market_context': market_context,
-        'cpo_action': cpo_action,
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S KST')
-    }
+@st.cache_data(ttl=300, show_spinner=False)
+def get_signal_history(period: str = "10y") -> pd.DataFrame:
+    """전체 기간 일별 시그널 히스토리 (실제 시세 기준, 5분 캐시)"""
+    return compute_signal_history(get_market_history(period))
+
+
+def create_signal_history_chart(history: pd.DataFrame) -> go.Figure:
+    """일별 시그널 점수 차트 (단계 경계선 표시)"""
+    score = get_chart_series("signal_score", "history", lambda: history['score'],
+                             version=(history.index[-1], len(history)))
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=score.index,
+        y=score.values,
+        mode='lines',
+        name='Signal Score',
+        line=dict(color=COLOR_PRIMARY, width=1.5),
+        hovertemplate='<b>%{x|%Y-%m-%d}</b><br>점수: %{y:.0f}<extra></extra>'
+    ))
+    for band in get_rule_set().bands[:-1]:
+        fig.add_hline(y=band.min_score, line=dict(color='#BDBDBD', width=1, dash='dot'),
+                      annotation_text=band.status, annotation_position='right')
+    
+    fig.update_layout(
+        title=dict(text='일별 소싱 시그널 점수', x=0.5),
+        xaxis=dict(title='날짜', showgrid=True, gridcolor='rgba(0,0,0,0.05)'),
+        yaxis=dict(title='점수 (0-100)', range=[0, 100]),
+        plot_bgcolor='white',
+        height=320,
+        margin=dict(l=40, r=80, t=60, b=40),
+        showlegend=False
+    )
+    return fig
 
 
 # ===========================================
@@ -407,6 +336,19 @@ def render_metric_card(metric: MarketMetric):
     """, unsafe_allow_html=True)
 
 
+@st.fragment(run_every=METRIC_REFRESH_SEC or None)
+def render_metric_strip():
+    """
+    상단 시세 타일 4개 (METRIC_REFRESH_SEC마다 이 부분만 다시 실행)
+    시세는 공용 시장 캐시에서 읽으므로 차트/시그널/CSS는 다시 그리지 않습니다.
+    """
+    market_data = get_market_data_live()
+    cols = st.columns(4)
+    for col, key in zip(cols, ['arabica', 'robusta', 'usd_krw', 'freight']):
+        with col:
+            render_metric_card(market_data[key])
+
+
 def render_signal_card(emoji: str, title: str, desc: str, price_info: str):
     """신호등 카드 렌더링 (Streamlit Native)"""
     st.markdown(f"""
@@ -423,10 +365,27 @@ def render_signal_card(emoji: str, title: str, desc: str, price_info: str):
     """, unsafe_allow_html=True)
 
 
+def render_indicator_caption(key: tuple):
+    """차트 아래 최근 RSI / Z-점수 / 변동성 표시"""
+    latest = indicator_book.latest(key)
+    if pd.isna(latest['rsi']):
+        return
+    st.caption(f"RSI(14) {latest['rsi']:.0f} | Z-점수 {latest['zscore']:+.2f} | "
+               f"변동성(20) {latest['volatility']:.2f}%")
+
+
 def create_price_chart(df: pd.DataFrame, column: str, title: str, unit: str, 
                        color: str, period: str) -> go.Figure:
-    """가격 차트 생성"""
+    """가격 차트 생성 (20기간 이동평균 / 볼린저 밴드 오버레이)"""
     df = df.sort_values('date').reset_index(drop=True)
+    full = df.set_index('date')[column]
+    # 지표는 원본 해상도로 증분 계산 (같은 데이터로 rerun하면 재계산 없음)
+    indicators = indicator_book.sync(("tab1", column, period), full)
+    # 점이 많은 기간은 화면 폭에 맞게 축소 (최고/최저점은 보존)
+    series = get_chart_series(column, period, lambda: full,
+                              version=(df['date'].iloc[-1], len(df)))
+    indicators = indicators.reindex(series.index)
+    df = series.rename(column).rename_axis('date').reset_index()
     y_range = calculate_y_range(df[column])
     
     max_idx = df[column].idxmax()
@@ -446,6 +405,18 @@ def create_price_chart(df: pd.DataFrame, column: str, title: str, unit: str,
         hovertemplate='<b>%{x|%Y-%m-%d}</b><br>가격: %{y:.2f} ' + unit + '<extra></extra>'
     ))
     
+    # 이동평균 / 볼린저 밴드
+    for name, label, dash in [('sma_short', 'MA20', 'solid'), ('bb_upper', 'BB 상단', 'dot'),
+                              ('bb_lower', 'BB 하단', 'dot')]:
+        fig.add_trace(go.Scatter(
+            x=df['date'],
+            y=indicators[name].to_numpy(),
+            mode='lines',
+            name=label,
+            line=dict(color='#8D6E63', width=1.2, dash=dash),
+            hovertemplate=label + ': %{y:.2f}<extra></extra>'
+        ))
+    
     # 최고가/최저가 마커
     fig.add_trace(go.Scatter(
         x=[df.loc[max_idx, 'date']],
@@ -505,10 +476,7 @@ def show():
     # ===========================================
     st.markdown('<h3 style="border-bottom: 3px solid #00695C; padding-bottom: 8px; color:#6F4E37;">시장 데이터 스냅샷</h3>', unsafe_allow_html=True)
     
-    cols = st.columns(4)
-    for col, key in zip(cols, ['arabica', 'robusta', 'usd_krw', 'freight']):
-        with col:
-            render_metric_card(market_data[key])
+    render_metric_strip()
     
     # ===========================================
     # 섹션 2: 선물 가격 추세
@@ -525,10 +493,12 @@ def show():
     with col1:
         fig_arabica = create_price_chart(hist_data, 'arabica', 'Arabica', '¢/lb', COLOR_PRIMARY, period)
         st.plotly_chart(fig_arabica, use_container_width=True)
+        render_indicator_caption(('tab1', 'arabica', period))
     
     with col2:
         fig_robusta = create_price_chart(hist_data, 'robusta', 'Robusta', '$/MT', COLOR_PRIMARY, period)
         st.plotly_chart(fig_robusta, use_container_width=True)
+        render_indicator_caption(('tab1', 'robusta', period))
     
     # ===========================================
     # 섹션 3: 소싱 시그널
@@ -541,6 +511,10 @@ def show():
         'fx': analyze_market_signal(market_data['usd_krw'].change_pct),
         'freight': analyze_market_signal(market_data['freight'].change_pct)
     }
+    # 기준일이 오래된 운임지수는 신호 대신 기준일을 표시
+    freight_as_of = market_data.get('outdated', {}).get('freight')
+    if freight_as_of:
+        signals['freight'] = ("⚪", "GRAY", f"판단 보류 - 운임지수 기준일 {freight_as_of} (갱신 필요)")
     
     col1, col2 = st.columns(2)
     
@@ -569,7 +543,8 @@ def show():
     # ===========================================
     st.markdown('<h3 style="border-bottom: 3px solid #00695C; padding-bottom: 8px; margin-top: 2rem; color:#6F4E37;">핵심 요약 및 실행 계획</h3>', unsafe_allow_html=True)
     
-    algo_signal = generate_algorithmic_signal(market_data)
+    # 알림 데몬(python -m utils.alert_daemon)의 최근 기록을 우선 사용, 없으면 직접 계산
+    algo_signal = alert_log.latest(max_age=ALERT_MAX_AGE_SEC) or generate_algorithmic_signal(market_data)
     
     signal_colors = {
         '강력 매수': '#10B981', '매수': '#34D399', '중립 관망': '#F59E0B',
@@ -610,7 +585,29 @@ def show():
         </div>
         """, unsafe_allow_html=True)
     
-    st.caption(f"Last Updated: {market_data['last_updated']}")
+    # 알림 데몬이 기록한 단계 전환
+    recent_alerts = alert_log.recent_alerts(limit=10)
+    if recent_alerts:
+        with st.expander(f"🔔 최근 시그널 전환 ({len(recent_alerts)}건)"):
+            for alert in recent_alerts:
+                changed_at = datetime.fromtimestamp(alert['created_at']).strftime('%Y-%m-%d %H:%M')
+                st.markdown(f"- **{changed_at}** {alert['from_status'] or '-'} → **{alert['to_status']}** "
+                            f"(점수 {alert['score']:.0f}) · {' / '.join(alert['triggers'])}")
+    
+    # 같은 점수 규칙을 과거 전체 기간에 적용한 시그널 히스토리
+    try:
+        signal_history = get_signal_history()
+    except Exception:
+        signal_history = None
+    if signal_history is not None and not signal_history.empty:
+        st.plotly_chart(create_signal_history_chart(signal_history), use_container_width=True)
+        band_days = signal_history['status'].value_counts()
+        st.caption(" | ".join(f"{band.emoji} {band.status}: {band_days.get(band.status, 0):,}일"
+                              for band in get_rule_set().bands))
+    
+    signal_source = "알림 데몬 기록" if 'evaluated_at' in algo_signal else "실시간 계산"
+    st.caption(f"Last Updated: {market_data['last_updated']} | {market_data['data_source']} | "
+               f"Signal: {algo_signal['timestamp']} ({signal_source})")
 
 
 if __name__ == "__main__":
@@ -27,25 +27,26 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
 
-# Excel 라이브러리
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-
-
 # 경로 설정
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+# Excel (공용 내보내기 모듈, xlsxwriter)
+from utils.excel_export import ExcelReport
+
+
 # API 키 및 유틸리티 가져오기
 try:
     from config import OPENAI_API_KEY
     from utils import get_exchange_rate_with_status, get_country_weather
+    from utils.replay import replay_call
 except ImportError:
     # 파일이 없거나 에러날 경우를 대비한 더미 데이터
     OPENAI_API_KEY = None
     def get_exchange_rate_with_status(): return 1450.0, "API 미연동 (기본값)"
     def get_country_weather(city): return {'temp': 20, 'desc_ko': '맑음', 'desc_en': 'Clear'}
+    def replay_call(service, request, call, dump=None, load=None): return call()
 
 
 
@@ -206,7 +207,7 @@ def get_ai_advice(context_data, lang_code):
         Provide a sharp, professional business judgment in 3-4 sentences.
         """
        
-        response = client.chat.completions.create(
+        request = dict(
             model="gpt-4o-mini", # 혹은 gpt-3.5-turbo
             messages=[
                 {"role": "system", "content": system_instruction},
@@ -215,7 +216,12 @@ def get_ai_advice(context_data, lang_code):
             temperature=0.7,
             max_tokens=300
         )
-        return response.choices[0].message.content.strip()
+        # API_REPLAY_MODE에 따라 응답을 녹화/재생 (utils/replay.py)
+        content = replay_call(
+            "openai", request,
+            lambda: client.chat.completions.create(**request).choices[0].message.content
+        )
+        return content.strip()
        
     except Exception as e:
         return f"❌ AI 분석 실패: {str(e)} (API 키나 인터넷 연결을 확인하세요)"
@@ -337,103 +343,54 @@ def create_pdf_proposal(data, lang='ko'):
 # Excel 생성 함수
 # ==========================================
 def create_excel_proposal(data, lang='ko'):
-    buffer = BytesIO()
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Proposal"
-   
     is_ko = (lang == 'ko')
-   
-    # 스타일
-    title_font = Font(name='맑은 고딕' if is_ko else 'Calibri', size=20, bold=True, color='1F4788')
-    section_header_font = Font(name='맑은 고딕' if is_ko else 'Calibri', size=14, bold=True, color='1F4788')
-    table_header_fill = PatternFill(start_color='E7F0F9', end_color='E7F0F9', fill_type='solid')
-    red_bold_font = Font(name='맑은 고딕' if is_ko else 'Calibri', bold=True, color='C00000')
-    thin_border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-   
-    # 1. Title
-    ws.merge_cells('A1:B1')
-    ws['A1'] = "수입 의사결정 제안서" if is_ko else "Coffee Import Proposal"
-    ws['A1'].font = title_font
-    ws['A1'].alignment = Alignment(horizontal='center', vertical='center')
-   
-    # Date
-    ws.merge_cells('A3:B3')
-    ws['A3'] = f"Date: {data['date']}"
-    ws['A3'].alignment = Alignment(horizontal='center')
-   
-    # 2. Import Overview
-    row = 5
-    ws[f'A{row}'] = "1. 수입 개요" if is_ko else "1. Import Overview"
-    ws[f'A{row}'].font = section_header_font
-    row += 1
-   
-    char_val = data.get('desc') if is_ko else data.get('desc_en')
-    if not char_val: char_val = "-"
-   
-    labels_s1 = [
-        ("수입 대상국" if is_ko else "Origin Country", f"{data['country']} ({data['port']}항)" if is_ko else f"{data['country_en']} ({data['port_en']})"),
-        ("커피 품종" if is_ko else "Coffee Variety", data['variety'] if is_ko else data['variety_en']),
-        ("특징" if is_ko else "Characteristics", char_val),
-        ("적용 환율" if is_ko else "Exchange Rate", f"{data['exchange_rate']} KRW/USD")
-    ]
-   
-    for label, value in labels_s1:
-        cell_a = ws[f'A{row}']
-        cell_a.value = label
-        cell_a.fill = table_header_fill
-        cell_a.border = thin_border
-       
-        cell_b = ws[f'B{row}']
-        cell_b.value = value
-        cell_b.border = thin_border
-        row += 1
-       
-    row += 1
-   
-    # 3. Cost & Volume
-    ws[f'A{row}'] = "2. 비용 및 규모" if is_ko else "2. Cost & Volume"
-    ws[f'A{row}'].font = section_header_font
-    row += 1
-   
-    labels_s2 = [
-        ("• 단가" if is_ko else "• Unit Price", f"${data['unit_price']}/kg"),
-        ("• 수입 물량" if is_ko else "• Import Volume", f"{data['quantity_ton']} ton"),
-    ]
-   
-    for label, value in labels_s2:
-        ws[f'A{row}'] = label
-        ws[f'A{row}'].border = thin_border
-        ws[f'B{row}'] = value
-        ws[f'B{row}'].border = thin_border
-        row += 1
-       
-    ws[f'A{row}'] = "• 예상 총액 (FOB)" if is_ko else "• Estimated Total (FOB)"
-    ws[f'A{row}'].border = thin_border
-   
-    total_str = f"${data['total_usd']} ({data['total_krw']} KRW)"
-    ws[f'B{row}'] = total_str
-    ws[f'B{row}'].font = red_bold_font
-    ws[f'B{row}'].border = thin_border
-   
-    row += 2
-   
-    # 4. Recommendations
-    ws[f'A{row}'] = "3. 종합 의견" if is_ko else "3. Recommendations"
-    ws[f'A{row}'].font = section_header_font
-    row += 1
-   
-    ws.merge_cells(f'A{row}:B{row+2}')
-    cell_advice = ws[f'A{row}']
-    cell_advice.value = data['ai_opinion']
-    cell_advice.alignment = Alignment(wrap_text=True, vertical='top')
-   
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 50
-   
-    wb.save(buffer)
-    buffer.seek(0)
-    return buffer
+
+    # 스타일 (utils/excel_export.py 서식 dict)
+    title_style = {'font_size': 20, 'bold': True, 'font_color': '#1F4788', 'align': 'center', 'valign': 'vcenter'}
+    section_header_style = {'font_size': 14, 'bold': True, 'font_color': '#1F4788'}
+    label_style = {'bg_color': '#E7F0F9', 'border': 1}
+    cell_style = {'border': 1}
+    red_bold_style = {'bold': True, 'font_color': '#C00000', 'border': 1}
+
+    with ExcelReport(font_name='맑은 고딕' if is_ko else 'Calibri') as report:
+        sheet = report.add_sheet("Proposal", widths=[25, 50])
+
+        # 1. Title / Date
+        sheet.merged("수입 의사결정 제안서" if is_ko else "Coffee Import Proposal", 2, title_style).skip()
+        sheet.merged(f"Date: {data['date']}", 2, {'align': 'center'}).skip()
+
+        # 2. Import Overview
+        sheet.values(["1. 수입 개요" if is_ko else "1. Import Overview"], section_header_style)
+
+        char_val = data.get('desc') if is_ko else data.get('desc_en')
+        if not char_val: char_val = "-"
+
+        labels_s1 = [
+            ("수입 대상국" if is_ko else "Origin Country", f"{data['country']} ({data['port']}항)" if is_ko else f"{data['country_en']} ({data['port_en']})"),
+            ("커피 품종" if is_ko else "Coffee Variety", data['variety'] if is_ko else data['variety_en']),
+            ("특징" if is_ko else "Characteristics", char_val),
+            ("적용 환율" if is_ko else "Exchange Rate", f"{data['exchange_rate']} KRW/USD")
+        ]
+        sheet.key_values(labels_s1, label_style, cell_style).skip()
+
+        # 3. Cost & Volume
+        sheet.values(["2. 비용 및 규모" if is_ko else "2. Cost & Volume"], section_header_style)
+
+        labels_s2 = [
+            ("• 단가" if is_ko else "• Unit Price", f"${data['unit_price']}/kg"),
+            ("• 수입 물량" if is_ko else "• Import Volume", f"{data['quantity_ton']} ton"),
+        ]
+        sheet.key_values(labels_s2, cell_style, cell_style)
+
+        total_str = f"${data['total_usd']} ({data['total_krw']} KRW)"
+        sheet.key_values([("• 예상 총액 (FOB)" if is_ko else "• Estimated Total (FOB)", total_str)],
+                         cell_style, red_bold_style).skip()
+
+        # 4. Recommendations
+        sheet.values(["3. 종합 의견" if is_ko else "3. Recommendations"], section_header_style)
+        sheet.merged(data['ai_opinion'], 2, {'text_wrap': True, 'valign': 'top'}, rows=3)
+
+    return report.output
 
 
 
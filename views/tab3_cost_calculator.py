@@ -11,7 +11,8 @@
 
 import streamlit as st
 import pandas as pd
-import io
+import numpy as np
+import plotly.graph_objects as go
 
 
 # 경로 설정
@@ -20,7 +21,16 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
-from utils import get_exchange_rate_with_status
+from config import get_coffee_origins
+from utils import get_exchange_rate_with_status, get_fx_matrix, get_market_history
+from utils.excel_export import ExcelReport, export_tables, HEADER_STYLE
+from utils.landed_cost import (
+    calculate_landed_cost, calculate_landed_costs, summarize_landed_costs,
+    read_shipments_csv, SHIPMENT_TEMPLATE
+)
+from utils.tariff_index import get_tariff_index
+from utils.risk_sim import estimate_risk_model, parse_lead_time, simulate_landed_cost, RISK_FACTORS
+from utils.sensitivity import sensitivity_grid, tornado_table, level_range, base_total
 
 
 
@@ -132,6 +142,8 @@ def show():
     # ===========================================
     # 메인 입력 섹션
     # ===========================================
+    # 교차환율 행렬 (공용 캐시, 현재 적용 USD/KRW 기준)
+    fx_matrix = get_fx_matrix(final_applied_rate)
     col1, col2 = st.columns([1, 2])
 
 
@@ -143,6 +155,23 @@ def show():
             key="cost_incoterm"
         )
         selected_code = incoterm.split()[0]
+        currencies = list(fx_matrix.krw_rates())
+        currency = st.selectbox(
+            "결제 통화 (물품대금/운임)", currencies, index=currencies.index("USD"),
+            format_func=lambda c: f"{c} ({fx_matrix.rate(c):,.2f} 원)" if c != "KRW" else c,
+            key="cost_currency"
+        )
+        unit_rate = fx_matrix.rate(currency)
+
+        # 원산지 + HS 코드 → 관세율 자동 입력 (utils/tariff_index.py)
+        tariffs = get_tariff_index()
+        origin = st.selectbox("원산지 (관세율 자동 적용)", ["직접 입력"] + tariffs.countries,
+                              key="cost_origin", on_change=apply_tariff)
+        hs_code = st.selectbox("HS 코드", tariffs.hs_codes, key="cost_hs_code", on_change=apply_tariff,
+                               disabled=origin == "직접 입력")
+        tariff = tariffs.lookup(origin, hs_code) if origin != "직접 입력" else None
+        if tariff is not None:
+            st.caption(f"관세율 {tariff.final_rate:g}% (기본 {tariff.base_rate:g}%) · {tariff.note}")
        
 
 
@@ -150,13 +179,13 @@ def show():
         st.subheader("2. 비용 데이터")
        
         # ① 물품대금
-        p_value = st.number_input("① 물품대금 (Price, USD)", min_value=0.0, value=0.0, format="%.2f", key="cost_price")
+        p_value = st.number_input(f"① 물품대금 (Price, {currency})", min_value=0.0, value=0.0, format="%.2f", key="cost_price")
 
 
         # ② 국제운송비 (조건부)
         f_value = 0.0
         if selected_code in ["EXW", "FOB"]:
-            f_value = st.number_input("② 국제운송비 (Freight, USD)", min_value=0.0, value=0.0, format="%.2f", key="cost_freight")
+            f_value = st.number_input(f"② 국제운송비 (Freight, {currency})", min_value=0.0, value=0.0, format="%.2f", key="cost_freight")
         else:
             st.info(f"{selected_code} 조건은 운임이 물품대금에 포함되어 있습니다.")
        
@@ -173,7 +202,9 @@ def show():
 
         c1, c2 = st.columns(2)
         with c1:
-            duty_rate = st.number_input("④ 관세율 (%)", value=0.0, step=0.1, format="%.2f", key="cost_duty")
+            # 원산지 선택 시 apply_tariff()가 값을 채우므로 기본값은 session_state로 관리
+            st.session_state.setdefault('cost_duty', 0.0)
+            duty_rate = st.number_input("④ 관세율 (%)", step=0.1, format="%.2f", key="cost_duty")
         with c2:
             local_cost = st.number_input("⑤ 국내 발생비용 (KRW)", value=0, step=10000, format="%d", key="cost_local")
 
@@ -183,27 +214,19 @@ def show():
     # ===========================================
     if st.button("계산 결과 보기", use_container_width=True, key="cost_calc_btn"):
        
-        # [Fix] 계산 로직에 사용할 변수 정의 (위에서 결정된 final_applied_rate를 할당)
-        exchange_rate = final_applied_rate
-
-
-        # 계산 로직
-        usd_portion = p_value + f_value
-        base_krw = usd_portion * exchange_rate
-        cif_krw = base_krw + i_value_krw
-        cif_usd_ref = cif_krw / exchange_rate if exchange_rate > 0 else 0
+        # [Fix] 계산 로직에 사용할 변수 정의 (결제 통화 1단위당 원화, USD면 final_applied_rate)
+        exchange_rate = unit_rate
 
 
-        duty_amt = cif_krw * (duty_rate / 100)
-        vat_amt = 0 if duty_rate == 0 else (cif_krw + duty_amt) * 0.1
-       
-        if selected_code == "DDP":
-            total_krw = (p_value * exchange_rate) + local_cost
-            duty_amt = 0
-            vat_amt = 0
-            cif_krw = base_krw
-        else:
-            total_krw = cif_krw + duty_amt + vat_amt + local_cost
+        # 계산 로직 (utils/landed_cost.py, 일괄 계산과 같은 규칙)
+        cost = calculate_landed_cost(selected_code, p_value, f_value, i_value_krw,
+                                     duty_rate, local_cost, exchange_rate, currency)
+        cif_krw = cost['cif_krw']
+        duty_amt = cost['duty_krw']
+        vat_amt = cost['vat_krw']
+        total_krw = cost['total_krw']
+        cif_fc_ref = cif_krw / exchange_rate if exchange_rate > 0 else 0
+        fc = (lambda v: f"${v:,.2f}") if currency == "USD" else (lambda v: f"{v:,.2f} {currency}")
 
 
         # 결과 화면
@@ -218,7 +241,7 @@ def show():
         k3.metric("과세가격 (CIF)", f"{int(cif_krw):,} 원", help="관세청 신고 기준 가격")
 
 
-        st.caption(f"※ 적용 환율: {exchange_rate:,.2f} 원/USD | 보험료는 원화({int(i_value_krw):,}원) 그대로 합산")
+        st.caption(f"※ 적용 환율: {exchange_rate:,.2f} 원/{currency} | 보험료는 원화({int(i_value_krw):,}원) 그대로 합산")
        
         # 결과 테이블
         st.markdown("### 상세 비용 분석표")
@@ -227,11 +250,11 @@ def show():
 
         df = pd.DataFrame({
             "항목": ["물품대금(Price)", "국제운송비(Freight)", "보험료(Insurance)", "과세가격(CIF)", "관세(Duty)", "부가세(VAT)", "국내비용(Local)"],
-            "외화 (USD)": [
-                f"${p_value:,.2f}",
-                f"${f_value:,.2f}" if f_value > 0 else "-",
+            f"외화 ({currency})": [
+                fc(p_value),
+                fc(f_value) if f_value > 0 else "-",
                 "-",
-                f"${cif_usd_ref:,.2f} (참고)",
+                f"{fc(cif_fc_ref)} (참고)",
                 "-", "-", "-"
             ],
             "원화 (KRW)": [
@@ -253,74 +276,31 @@ def show():
         st.divider()
         st.markdown("### 결과 다운로드")
        
-        output = io.BytesIO()
-
-
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            workbook = writer.book
-            worksheet = workbook.add_worksheet('최종원가분석')
-           
-            # [수정] 스타일 정의: 타이틀을 검정색(#000000) 및 중앙 정렬(center)로 변경
-            title_format = workbook.add_format({
+        with ExcelReport() as report:
+            sheet = report.add_sheet('최종원가분석', widths=[25, 22, 22])
+            sheet.merged('원두 수입 원가 계산 결과', 3, {
                 'bold': True, 'font_size': 16, 'font_color': '#333333',
                 'align': 'center', 'valign': 'vcenter', 'bottom': 2
-            })
-           
-            header_format = workbook.add_format({
-                'bold': True, 'font_size': 11, 'font_color': 'white',
-                'align': 'center', 'fg_color': '#00695C', 'border': 1
-            })
-           
-            data_format = workbook.add_format({
-                'font_size': 10, 'align': 'right', 'border': 1
-            })
-           
-            total_format = workbook.add_format({
-                'bold': True, 'font_size': 12, 'font_color': '#00695C',
-                'align': 'right', 'bg_color': '#E8F5E9', 'border': 2
-            })
-           
-            # 열 너비 설정
-            worksheet.set_column('A:A', 25)
-            worksheet.set_column('B:B', 22)
-            worksheet.set_column('C:C', 22)
-           
-            # 제목
-            row = 0
-            worksheet.merge_range(row, 0, row, 2, f'원두 수입 원가 계산 결과', title_format)
-            row += 2
-           
+            }).skip()
+
             # 계산 정보
-            info_format = workbook.add_format({'font_size': 10, 'align': 'left'})
-            worksheet.write(row, 0, f'인코텀즈: {selected_code}', info_format)
-            row += 1
-            worksheet.write(row, 0, f'적용 환율: {exchange_rate:,.2f} 원/USD', info_format)
-            row += 2
-           
-            # 헤더
-            worksheet.write(row, 0, '항목', header_format)
-            worksheet.write(row, 1, '외화 (USD)', header_format)
-            worksheet.write(row, 2, '원화 (KRW)', header_format)
-            row += 1
-           
-            # 데이터
-            for idx, r in df.iterrows():
-                worksheet.write(row, 0, r['항목'], data_format)
-                worksheet.write(row, 1, r['외화 (USD)'], data_format)
-                clean_val = str(r['원화 (KRW)']).replace('🔴 ', '')
-                worksheet.write(row, 2, clean_val, data_format)
-                row += 1
-           
-            row += 1
-            worksheet.write(row, 0, '총 필요 자금', header_format)
-            worksheet.write(row, 2, f"{int(total_krw):,}원", total_format)
-           
-            row += 1
-            worksheet.write(row, 0, '예상 세금', header_format)
-            worksheet.write(row, 2, f"{int(duty_amt + vat_amt):,}원", total_format)
+            info_style = {'font_size': 10, 'align': 'left'}
+            sheet.values([f'인코텀즈: {selected_code}'], info_style)
+            sheet.values([f'적용 환율: {exchange_rate:,.2f} 원/{currency}'], info_style).skip()
 
+            # 상세 비용 표 (화면 표와 같은 값, 표시용 마커만 제거)
+            sheet.table({
+                '항목': df['항목'],
+                f'외화 ({currency})': df[f'외화 ({currency})'],
+                '원화 (KRW)': df['원화 (KRW)'].str.replace('🔴 ', '', regex=False),
+            }, header_style=HEADER_STYLE, cell_style={'font_size': 10, 'align': 'right', 'border': 1})
+            sheet.skip()
 
-        output.seek(0)
+            total_style = {'bold': True, 'font_size': 12, 'font_color': '#00695C',
+                           'align': 'right', 'bg_color': '#E8F5E9', 'border': 2}
+            sheet.values(['총 필요 자금', None, f"{int(total_krw):,}원"], [HEADER_STYLE, None, total_style])
+            sheet.values(['예상 세금', None, f"{int(duty_amt + vat_amt):,}원"], [HEADER_STYLE, None, total_style])
+        output = report.output
 
 
 
@@ -356,6 +336,308 @@ def show():
         )
 
 
+    # ===========================================
+    # 민감도 분석 (시나리오 그리드)
+    # ===========================================
+    # 민감도/리스크 분석은 USD/KRW 기준이므로 결제 통화 금액을 USD로 환산해 전달
+    p_usd, f_usd = fx_matrix.convert([p_value, f_value], currency, "USD")
+    st.divider()
+    render_sensitivity(selected_code, p_usd, f_usd, i_value_krw,
+                       duty_rate, local_cost, final_applied_rate)
+
+
+    # ===========================================
+    # 리스크 시뮬레이션 (몬테카를로)
+    # ===========================================
+    st.divider()
+    render_risk_simulator(selected_code, p_usd, f_usd, i_value_krw,
+                          duty_rate, local_cost, final_applied_rate)
+
+
+    # ===========================================
+    # 일괄 계산 (CSV 업로드)
+    # ===========================================
+    st.divider()
+    render_batch_calculator(final_applied_rate)
+
+
+    # ===========================================
+    # 교차환율 표
+    # ===========================================
+    with st.expander("💱 교차환율 표 (행 통화 1단위 = 열 통화 금액)"):
+        st.dataframe(fx_matrix.matrix.style.format("{:,.4f}"), use_container_width=True)
+
+
+def apply_tariff():
+    """원산지/HS 코드를 바꾸면 관세율 입력칸을 관세율표 값으로 채웁니다."""
+    origin = st.session_state.get('cost_origin', "직접 입력")
+    if origin == "직접 입력":
+        return
+    tariff = get_tariff_index().lookup(origin, st.session_state.get('cost_hs_code', "0901.11"))
+    if tariff is not None:
+        st.session_state['cost_duty'] = tariff.final_rate
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_sensitivity(incoterm: str, price: float, freight: float, insurance_krw: float, duty_rate: float,
+                    local_cost: float, usd_krw: float, fx_pct: float, freight_pct: float,
+                    duty_levels: tuple, fx_steps: int = 200, freight_steps: int = 50):
+    """입력값 조합별 시나리오 그리드 + 토네이도 표 (같은 입력은 캐시 재사용)"""
+    grid = sensitivity_grid(
+        incoterm, price, insurance_krw, local_cost,
+        fx_levels=level_range(usd_krw, fx_pct, fx_steps),
+        # 운임 미입력 시 0 ~ 5,000 USD 구간으로 탐색
+        freight_levels=level_range(freight, freight_pct, freight_steps, floor=5000.0),
+        duty_levels=duty_levels,
+    )
+    base = {"fx": usd_krw, "price": price, "freight": freight, "insurance_krw": insurance_krw,
+            "duty_rate": duty_rate, "local_cost": local_cost}
+    swings = {"fx": fx_pct, "price": 0.10, "freight": freight_pct,
+              "duty_rate": max(duty_levels) - duty_rate if max(duty_levels) > duty_rate else 3.0,
+              "local_cost": 0.20}
+    return grid, tornado_table(incoterm, base, swings), base_total(incoterm, base)
+
+
+def render_sensitivity(incoterm: str, price: float, freight: float, insurance_krw: float,
+                       duty_rate: float, local_cost: float, usd_krw: float):
+    """
+    환율 × 운임 × 관세율 시나리오 그리드를 히트맵/토네이도 차트로 보여줍니다.
+
+    Args:
+        incoterm: 인코텀즈 코드
+        price: 물품대금 (USD)
+        freight: 국제운송비 (USD)
+        insurance_krw: 보험료 (원)
+        duty_rate: 관세율 (%)
+        local_cost: 국내 발생비용 (원)
+        usd_krw: 현재 적용 환율
+    """
+    st.subheader("📐 민감도 분석")
+    if not st.toggle("민감도 분석 모드", key="cost_sens_mode",
+                     help="환율 200단계 × 운임 50단계 × 관세율 후보 전체를 한 번에 계산합니다."):
+        return
+    if price <= 0:
+        st.warning("물품대금을 입력하세요.")
+        return
+
+    c_fx, c_freight, c_duty = st.columns(3)
+    with c_fx:
+        fx_pct = st.slider("환율 변동 폭 (±%)", 1, 30, 10, key="cost_sens_fx") / 100
+    with c_freight:
+        freight_pct = st.slider("운임 변동 폭 (±%)", 10, 100, 50, step=10, key="cost_sens_freight") / 100
+    with c_duty:
+        # 현재 관세율이 기본 후보에 없어도(예: 1.5%) 기본 선택에 넣을 수 있도록 후보에 추가
+        duty_options = sorted({0.0, 2.0, 3.0, 5.0, 8.0, 13.0, float(duty_rate)})
+        duty_levels = st.multiselect("관세율 후보 (%)", duty_options,
+                                     default=sorted({0.0, 2.0, 8.0, float(duty_rate)}), key="cost_sens_duty",
+                                     format_func=lambda d: f"{d:g}")
+    if not duty_levels:
+        st.warning("관세율 후보를 1개 이상 선택하세요.")
+        return
+
+    duty_levels = tuple(sorted(set(duty_levels)))
+    grid, tornado, base = get_sensitivity(incoterm, price, freight, insurance_krw, duty_rate,
+                                          local_cost, usd_krw, fx_pct, freight_pct, duty_levels)
+
+    c_heat, c_tornado = st.columns(2)
+    with c_heat:
+        shown_duty = st.radio("히트맵 관세율", duty_levels, horizontal=True, key="cost_sens_shown",
+                              format_func=lambda d: f"{d:g}%")
+        heat = go.Figure(go.Heatmap(
+            z=grid.totals[duty_levels.index(shown_duty)], x=grid.freight_levels, y=grid.fx_levels,
+            colorscale="Teal", colorbar=dict(title="원"),
+            hovertemplate="운임 $%{x:,.0f}<br>환율 %{y:,.1f}<br>총액 %{z:,.0f}원<extra></extra>"
+        ))
+        heat.update_layout(height=380, margin=dict(l=10, r=10, t=30, b=10),
+                           xaxis_title="국제운송비 (USD)", yaxis_title="USD/KRW")
+        st.plotly_chart(heat, use_container_width=True)
+    with c_tornado:
+        rows = tornado.iloc[::-1]
+        fig = go.Figure()
+        fig.add_trace(go.Bar(y=rows["label"], x=rows["low_total"] - base, base=base, orientation="h",
+                             name="낮음", marker_color="#00695C"))
+        fig.add_trace(go.Bar(y=rows["label"], x=rows["high_total"] - base, base=base, orientation="h",
+                             name="높음", marker_color="#6F4E37"))
+        fig.add_vline(x=base, line_color="#333333", line_dash="dash")
+        fig.update_layout(barmode="overlay", height=380, margin=dict(l=10, r=10, t=60, b=10),
+                          xaxis_title="총 필요 자금 (원)", legend=dict(orientation="h", y=1.1))
+        st.plotly_chart(fig, use_container_width=True)
+
+    low, high = grid.totals.min(), grid.totals.max()
+    st.caption(f"※ {grid.totals.size:,}개 시나리오 · 총액 범위 {low:,.0f} ~ {high:,.0f} 원 · "
+               f"기준 총액 {base:,.0f} 원"
+               + ("" if incoterm in ("EXW", "FOB") else f" · {incoterm} 조건은 운임이 물품대금에 포함되어 운임 축 영향 없음"))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_risk_model():
+    """최근 5년 시세로 추정한 위험 모형 (1시간 캐시)"""
+    try:
+        return estimate_risk_model(get_market_history("5y"))
+    except Exception:
+        return estimate_risk_model(None)
+
+
+def render_risk_simulator(incoterm: str, price: float, freight: float, insurance_krw: float,
+                          duty_rate: float, local_cost: float, usd_krw: float):
+    """
+    위 입력값으로 도착 시점 원가 분포(P5/P50/P95)를 시뮬레이션합니다.
+
+    Args:
+        incoterm: 인코텀즈 코드
+        price: 물품대금 (USD)
+        freight: 국제운송비 (USD)
+        insurance_krw: 보험료 (원)
+        duty_rate: 관세율 (%)
+        local_cost: 국내 발생비용 (원)
+        usd_krw: 현재 적용 환율
+    """
+    st.subheader("🎲 원가 리스크 시뮬레이션")
+    st.caption("산지 리드타임 동안 환율 · Arabica 가격 · 운임이 함께 움직이는 경로를 만들어 "
+               "도착 시점 총 필요 자금의 분포를 계산합니다.")
+
+    origins = get_coffee_origins()
+    c_origin, c_paths, c_linked = st.columns([2, 2, 1.5], vertical_alignment="bottom")
+    with c_origin:
+        origin = st.selectbox("산지 (리드타임)", list(origins.keys()), key="cost_risk_origin",
+                              format_func=lambda name: f"{name} ({origins[name]['lead_time']})")
+    with c_paths:
+        n_paths = st.select_slider("경로 수", options=[10_000, 100_000, 500_000, 1_000_000],
+                                   value=1_000_000, format_func=lambda n: f"{n:,}", key="cost_risk_paths")
+    with c_linked:
+        price_linked = st.checkbox("가격 미확정 (선물 연동)", value=True, key="cost_risk_linked",
+                                   help="체크하면 물품대금이 Arabica 선물 가격을 따라 움직입니다.")
+
+    if not st.button("시뮬레이션 실행", use_container_width=True, key="cost_risk_btn"):
+        return
+    if price <= 0:
+        st.warning("물품대금을 입력하세요.")
+        return
+
+    lead_days = parse_lead_time(origins[origin]['lead_time'])
+    model = load_risk_model()
+    result = simulate_landed_cost(incoterm, price, freight, insurance_krw, duty_rate, local_cost,
+                                  usd_krw, lead_days, model=model, n_paths=n_paths,
+                                  price_linked=price_linked)
+    p5, p50, p95 = (result.percentiles[p] for p in (5, 50, 95))
+
+    k1, k2, k3 = st.columns(3)
+    k1.metric("P5 (낙관)", f"{p5:,.0f} 원", delta=f"{p5 - result.point_estimate:+,.0f} 원", delta_color="inverse")
+    k2.metric("P50 (중앙값)", f"{p50:,.0f} 원", delta=f"{p50 - result.point_estimate:+,.0f} 원", delta_color="inverse")
+    k3.metric("P95 (비관)", f"{p95:,.0f} 원", delta=f"{p95 - result.point_estimate:+,.0f} 원", delta_color="inverse")
+
+    # 경로 전체를 브라우저로 보내지 않도록 서버에서 구간별 개수만 계산
+    counts, edges = np.histogram(result.totals, bins=80)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+                           marker_color="#00695C", opacity=0.8))
+    for value, label in ((p5, "P5"), (p50, "P50"), (p95, "P95")):
+        fig.add_vline(x=value, line_dash="dash", line_color="#6F4E37", annotation_text=label)
+    fig.add_vline(x=result.point_estimate, line_color="#C62828", annotation_text="현재 시세")
+    fig.update_layout(height=320, margin=dict(l=10, r=10, t=30, b=10), showlegend=False,
+                      xaxis_title="총 필요 자금 (원)", yaxis_title="경로 수")
+    st.plotly_chart(fig, use_container_width=True)
+
+    vols = " · ".join(f"{name} {vol:.0%}" for name, vol in zip(RISK_FACTORS, model.annual_vol))
+    source = "최근 5년 시세 추정" if model.source == "history" else "기본값 (시세 부족)"
+    st.caption(f"※ 리드타임 {lead_days[0]}~{lead_days[1]}일 · {n_paths:,}개 경로 · "
+               f"연 변동성 {vols} ({source}) · 현재 시세 기준 총액 {result.point_estimate:,.0f} 원")
+
+
+def render_batch_calculator(usd_krw: float):
+    """
+    선적 CSV를 업로드받아 전체 원가를 한 번에 계산합니다.
+
+    Args:
+        usd_krw: 현재 적용 환율 (USD 행에 사용)
+    """
+    st.subheader("📦 일괄 원가 계산 (CSV 업로드)")
+    st.caption("필수 컬럼: incoterm, price | 선택 컬럼: freight, insurance(원), duty_rate(%), "
+               "local_cost(원), currency(기본 USD), origin, hs_code(기본 0901.11), import_date. "
+               "물품대금/운임은 currency 기준, 보험료/국내비용은 원화입니다. "
+               "duty_rate가 빈 행은 관세율표(원산지 × HS 코드 × 수입일)에서 자동 적용합니다.")
+
+    c_upload, c_template = st.columns([3, 1], vertical_alignment="bottom")
+    with c_upload:
+        uploaded = st.file_uploader("선적 목록 CSV", type=["csv"], key="cost_batch_csv")
+    with c_template:
+        st.download_button(
+            label="예시 CSV →",
+            data=SHIPMENT_TEMPLATE.to_csv(index=False).encode("utf-8-sig"),
+            file_name="shipments_template.csv",
+            mime="text/csv",
+            use_container_width=True,
+            key="cost_batch_template"
+        )
+
+    if uploaded is None:
+        return
+
+    try:
+        shipments = read_shipments_csv(uploaded)
+    except Exception as e:
+        st.error(f"CSV를 읽을 수 없습니다: {e}")
+        return
+
+    # 통화별 개별 조회 없이 교차환율 행렬 1개로 전체 행 환산
+    fx_matrix = get_fx_matrix(usd_krw, tuple(sorted(shipments['currency'].unique())))
+    result = calculate_landed_costs(shipments, fx_matrix, get_tariff_index())
+    summary = summarize_landed_costs(result)
+
+    k1, k2, k3 = st.columns(3)
+    k1.metric("총 필요 자금", f"{summary['total_krw']:,.0f} 원", delta=f"{summary['rows']:,}건")
+    k2.metric("예상 세금 (관세+부가세)", f"{summary['tax_krw']:,.0f} 원")
+    k3.metric("과세가격 (CIF) 합계", f"{summary['cif_krw']:,.0f} 원")
+    if summary['errors']:
+        st.warning(f"{summary['errors']:,}건은 계산하지 못했습니다 (error 컬럼 참고).")
+
+    st.dataframe(result, use_container_width=True, hide_index=True)
+    c_csv, c_xlsx = st.columns(2)
+    with c_csv:
+        st.download_button(
+            label="계산 결과 CSV 다운로드 →",
+            data=result.to_csv(index=False).encode("utf-8-sig"),
+            file_name="Import_Cost_Batch.csv",
+            mime="text/csv",
+            use_container_width=True,
+            key="cost_batch_dl"
+        )
+    with c_xlsx:
+        # 대용량 리포트는 rerun마다 만들지 않고 요청할 때 1번만 생성 (같은 파일/환율이면 재사용)
+        report_id = (uploaded.file_id, usd_krw)
+        report = st.session_state.get('cost_batch_report')
+        if report is None or report[0] != report_id:
+            report = None
+            if st.button("엑셀 리포트 만들기 →", use_container_width=True, key="cost_batch_xlsx_build"):
+                with st.spinner("엑셀 리포트를 만드는 중..."):
+                    report = (report_id, build_batch_report(result, summary).getvalue())
+                st.session_state['cost_batch_report'] = report
+        if report is not None:
+            st.download_button(
+                label="계산 결과 엑셀 리포트 →",
+                data=report[1],
+                file_name="Import_Cost_Batch.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                use_container_width=True,
+                key="cost_batch_xlsx"
+            )
+
+
+def build_batch_report(result: pd.DataFrame, summary: dict):
+    """일괄 계산 결과 엑셀 리포트 (요약 / 계산 결과 / 오류 시트)"""
+    overview = pd.DataFrame({
+        "항목": ["선적 수", "계산 실패", "총 필요 자금 (원)", "예상 세금 (원)", "과세가격 합계 (원)"],
+        "값": [summary['rows'], summary['errors'], summary['total_krw'],
+              summary['tax_krw'], summary['cif_krw']],
+    })
+    sheets = {"요약": overview, "계산 결과": result}
+    if summary['errors']:
+        sheets["오류"] = result[result['error'] != ""]
+    krw_columns = {column: "#,##0" for column in
+                   ("price_krw", "freight_krw", "insurance_krw", "cif_krw", "duty_krw",
+                    "vat_krw", "local_cost_krw", "total_krw", "값")}
+    return export_tables(sheets, num_formats=krw_columns)
+
+
 if __name__ == "__main__":
     show()
 
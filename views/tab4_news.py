@@ -13,7 +13,6 @@ Google RSS와 네이버 API를 활용한 커피 관련 뉴스 수집 및 분석
 
 import streamlit as st
 import feedparser
-import requests
 import re
 import matplotlib.pyplot as plt
 from wordcloud import WordCloud
@@ -31,6 +30,8 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+from utils.http_client import http_get
+from utils.replay import replay_call
 
 # NLTK 데이터 다운로드 (최초 1회)
 try:
@@ -53,7 +54,9 @@ def translate_text(text: str) -> str:
         if not text:
             return ""
         translator = get_translator()
-        return translator.translate(text[:4999])
+        text = text[:4999]
+        return replay_call("google_translate", {"text": text, "target": "ko"},
+                           lambda: translator.translate(text))
     except Exception as e:
         return text
 
@@ -150,7 +153,7 @@ def fetch_google_news(query: str, target_keywords: Optional[List[str]] = None,
     rss_url = f"https://news.google.com/rss/search?q={encoded_query}+when:{period}&hl=en-US&gl=US&ceid=US:en"
     
     try:
-        feed = feedparser.parse(rss_url)
+        feed = replay_call("google_news_rss", {"url": rss_url}, lambda: feedparser.parse(rss_url))
     except Exception as e:
         return []
 
@@ -201,7 +204,7 @@ def fetch_naver_news_api(query: str) -> List[Dict]:
     params = {"query": query, "display": 10, "sort": "sim"}
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = http_get(url, headers=headers, params=params)
         if response.status_code == 200:
             items = response.json().get('items', [])
             results = []
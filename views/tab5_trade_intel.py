@@ -21,6 +21,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 from config import OPENAI_API_KEY, COLOR_PRIMARY, COLOR_SECONDARY, COLOR_RISK, COLOR_SUCCESS, COLOR_WARNING, COFFEE_PALETTE
+from config import get_coffee_origins
+from utils import get_country_weather
+from utils.replay import replay_call
+from utils.tariff_index import get_tariff_index, ANY_COUNTRY
 
 
 
@@ -79,22 +83,21 @@ def load_import_data():
 
 
 
-@st.cache_data
 def load_tariff_data():
-    """관세 데이터"""
-    dummy_tariff = [
-        ["남미", "과테말라", "0901.11", "생두", 2, "미체결", 0, 0, " 한-중미 FTA 협상 중! 현재 할당관세 0%"],
-        ["남미", "온두라스", "0901.11", "생두", 2, "0", 0, 0, " 한-중미 FTA 체결국"],
-        ["남미", "코스타리카", "0901.11", "생두", 2, "0", 0, 0, " 한-중미 FTA 체결국"],
-        ["남미", "콜롬비아", "0901.11", "생두", 2, "0", 0, 0, " 한-콜롬비아 FTA"],
-        ["남미", "페루", "0901.11", "생두", 2, "0", 0, 0, " 한-페루 FTA"],
-        ["남미", "브라질", "0901.11", "생두", 2, "미체결", 0, 0, " 현재 할당관세 0%"],
-        ["아프리카", "케냐", "0901.11", "생두", 2, "미체결", 0, 0, " 프리미엄 산지! 할당관세 혜택"],
-        ["아프리카", "에티오피아", "0901.11", "생두", 2, "0", 0, 0, " 최빈개발국 특례 0%"],
-        ["아시아", "베트남", "0901.11", "생두", 2, "0", 0, 0, " 한-아세안 FTA"],
-        ["아시아", "인도네시아", "0901.11", "생두", 2, "0", 0, 0, " 한-아세안 FTA 및 CEPA"]
-    ]
-    return pd.DataFrame(dummy_tariff, columns=["대륙", "국가", "HSCode", "품목", "기본세율", "FTA세율", "할당관세", "최종세율", "비고"])
+    """관세 데이터 (data/tariff_schedule.csv, 원가 계산기와 같은 관세율 색인)"""
+    current = get_tariff_index().current()
+    df = current[(current["country"] != ANY_COUNTRY) & (current["hs_code"] == "0901.11")]
+    return pd.DataFrame({
+        "대륙": df["region"],
+        "국가": df["country"],
+        "HSCode": df["hs_code"],
+        "품목": df["item"],
+        "기본세율": df["base_rate"],
+        "FTA세율": df["fta_rate"].map(lambda v: "미체결" if pd.isna(v) else f"{v:g}"),
+        "할당관세": df["quota_rate"],
+        "최종세율": df["final_rate"],
+        "비고": " " + df["note"],
+    }).reset_index(drop=True)
 
 
 
@@ -139,7 +142,7 @@ def get_ai_compliance_summary(country):
         from openai import OpenAI
         client = OpenAI(api_key=OPENAI_API_KEY)
        
-        response = client.chat.completions.create(
+        request = dict(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "커피 수입 무역 전문가입니다. 한 줄로 답변하세요."},
@@ -148,7 +151,11 @@ def get_ai_compliance_summary(country):
             max_tokens=150,
             temperature=0.5
         )
-        return response.choices[0].message.content
+        # API_REPLAY_MODE에 따라 응답을 녹화/재생 (utils/replay.py)
+        return replay_call(
+            "openai", request,
+            lambda: client.chat.completions.create(**request).choices[0].message.content
+        )
     except Exception as e:
         return f"분석 오류: {str(e)}"
 
@@ -398,11 +405,16 @@ def show():
             st.markdown(" ")
 
 
+            # 선적항 날씨 (모든 항구를 한 번에 받은 공용 캐시에서 조회)
+            port = get_coffee_origins()[target_country]['port']
+            port_weather = get_country_weather(port)
+
             checks = [
                 ("환경 리스크", country_info['EUDR_Risk'], "EUDR 산림파괴 방지 규제"),
                 ("식품 안전", "준수 필요", f"한국 관세청 {country_info['Import_Regulation']} 기준"),
                 ("공급망 실사", "분석 대상", f"{country_info['Labor_Compliance']} 리포트"),
-                ("인증 현황", "확인 필요", f"글로벌 {country_info['Certification']} 보유 상태")
+                ("인증 현황", "확인 필요", f"글로벌 {country_info['Certification']} 보유 상태"),
+                ("선적항 날씨", f"{port_weather['temp']}°C", f"{port} - {port_weather['desc_ko']}")
             ]
            
             for title, status, desc in checks: